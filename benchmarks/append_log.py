@@ -0,0 +1,63 @@
+"""
+Benchmark adding words through the append log against opening the
+dictionary and appending one word per call, for each durability mode and
+with several threads sharing group commits.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from utils.append_log import DURABILITY_MODES, WordLog, read_log
+from benchmarks.common import synthetic_words
+
+
+def append_per_call(path, words):
+    """add_to_dictionary before the append log."""
+    for word in words:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(f"\n{word}")
+
+
+def log_words(path, words, durability, threads):
+    log = WordLog(path, durability, compact_size=0)
+    shares = [words[i::threads] for i in range(threads)]
+    workers = [threading.Thread(target=lambda share=share: [log.add(word) for word in share])
+               for share in shares]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    log.close()
+    return log.stats()
+
+
+def run(count=2000, threads=8):
+    words = synthetic_words(count, seed=5)
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'dictionary.txt')
+    try:
+        print(f"Adding {count} words")
+        start = time.perf_counter()
+        append_per_call(path, words)
+        elapsed = time.perf_counter() - start
+        print(f"  open + append per word              {count / elapsed:10,.0f} words/s   no fsync, no lock")
+        for durability in DURABILITY_MODES:
+            for workers in sorted({1, threads}):
+                for name in os.listdir(directory):
+                    os.remove(os.path.join(directory, name))
+                start = time.perf_counter()
+                stats = log_words(path, words, durability, workers)
+                elapsed = time.perf_counter() - start
+                assert sorted(read_log(path)) == words
+                print(f"  log durability={durability:6} threads={workers:<3}  {count / elapsed:10,.0f} words/s   "
+                      f"{stats['groups']} group commits")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,80 @@
+"""
+Simulate fast typing against SuggestionService on a large dictionary and
+measure how responsive the event loop stays and how much work is skipped.
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+from utils.async_service import SuggestionService
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import synthetic_words, misspell, write_dictionary
+
+
+async def heartbeat(stop, gaps, interval=0.005):
+    """Record how late a periodic UI tick fires; large gaps mean a frozen UI."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        gaps.append(time.perf_counter() - start - interval)
+
+
+async def type_words(service, typos, keystroke_interval, pause=0.4):
+    pending = []
+    for typo in typos:
+        for i in range(1, len(typo) + 1):
+            pending.append(asyncio.ensure_future(service.suggest(typo[:i], key='editor')))
+            await asyncio.sleep(keystroke_interval)
+        # Pause between words long enough for the debounce to fire
+        await asyncio.sleep(pause)
+    return await asyncio.gather(*pending)
+
+
+async def simulate(checker, typos, keystroke_interval, debounce):
+    service = SuggestionService(checker, debounce=debounce)
+    stop = asyncio.Event()
+    gaps = []
+    ticker = asyncio.ensure_future(heartbeat(stop, gaps))
+    await type_words(service, typos, keystroke_interval)
+    stop.set()
+    await ticker
+    service.stop()
+    return service.stats(), max(gaps)
+
+
+def blocking(checker, typos):
+    """Synchronous suggestions on every keystroke, as the notebooks do."""
+    worst = 0.0
+    for typo in typos:
+        for i in range(1, len(typo) + 1):
+            start = time.perf_counter()
+            checker.generate_suggestions(typo[:i])
+            worst = max(worst, time.perf_counter() - start)
+    return worst
+
+
+def run(size=20000, words=5, keystroke_interval=0.03, debounce=0.15):
+    rng = random.Random(11)
+    lexicon = synthetic_words(size)
+    path = write_dictionary(lexicon)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            checker = TigrignaSpellChecker(path, cache_size=0)
+        typos = [misspell(rng.choice(lexicon), rng) for _ in range(words)]
+        print(f"Dictionary: {size} words, typing {sum(map(len, typos))} keystrokes "
+              f"every {keystroke_interval * 1000:.0f} ms")
+        print(f"  synchronous: UI blocked up to {blocking(checker, typos) * 1000:.0f} ms per keystroke")
+        stats, worst_gap = asyncio.run(simulate(checker, typos, keystroke_interval, debounce))
+        print(f"  service:     UI tick late by at most {worst_gap * 1000:.1f} ms")
+        print(f"  {stats}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:]))
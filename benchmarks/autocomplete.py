@@ -0,0 +1,69 @@
+"""
+Benchmark per-keystroke autocomplete latency of TigrignaSpellChecker.complete
+on a large frequency-annotated lexicon, against the notebooks' full
+dictionary startswith scan.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import inflected_words, synthetic_words, measure, write_dictionary
+
+
+def scan_suggestions(dictionary, prefix, max_count=10):
+    """get_suggestions from tigrigna_autocomplete_final.ipynb."""
+    suggestions = [word for word in dictionary if word.startswith(prefix)]
+    suggestions.sort(key=lambda x: (len(x), x))
+    return suggestions[:max_count]
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(size=500000, typed_words=2000):
+    rng = random.Random(8)
+    words = inflected_words(size // 160)
+    words += synthetic_words(max(0, size - len(words)), seed=9)
+    words = sorted(set(words))[:size]
+    rng.shuffle(words)
+    # Zipf-like counts: the shuffled position is the frequency rank
+    lines = [f"{word}\t{int(1e7 / (rank + 1))}" for rank, word in enumerate(words)]
+    path = write_dictionary(lines)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            checker = TigrignaSpellChecker(path)
+        build_time, _ = measure(lambda: checker.complete('ሀ'))
+        print(f"Lexicon: {len(words)} words, completion trie built in {build_time:.1f} s")
+
+        keystrokes = []
+        for word in rng.sample(words, typed_words):
+            keystrokes.extend(word[:i] for i in range(1, len(word) + 1))
+        latencies = []
+        for prefix in keystrokes:
+            start = time.perf_counter()
+            checker.complete(prefix, 10)
+            latencies.append(time.perf_counter() - start)
+        print(f"  trie    {len(keystrokes)} keystrokes   p50 {percentile(latencies, 0.5) * 1e6:7.1f} us   "
+              f"p99 {percentile(latencies, 0.99) * 1e6:7.1f} us   max {max(latencies) * 1e6:7.1f} us")
+
+        sample = keystrokes[:50]
+        scan_latencies = []
+        for prefix in sample:
+            start = time.perf_counter()
+            scan_suggestions(checker.word_dict, prefix)
+            scan_latencies.append(time.perf_counter() - start)
+        print(f"  scan    {len(sample)} keystrokes     p50 {percentile(scan_latencies, 0.5) * 1e3:7.1f} ms   "
+              f"p99 {percentile(scan_latencies, 0.99) * 1e3:7.1f} ms")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:]))
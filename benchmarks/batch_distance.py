@@ -0,0 +1,50 @@
+"""
+Benchmark the NumPy batch engine against the scalar linear scan of
+TigrignaSpellChecker.generate_suggestions on 10k, 100k and 1M synthetic words.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import synthetic_words, misspell, write_dictionary, measure
+
+
+def build_checker(path, engine):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return TigrignaSpellChecker(path, engine=engine)
+
+
+def run(sizes=(10000, 100000, 1000000), queries=10, scalar_queries=2, max_distance=2):
+    rng = random.Random(4)
+    for size in sizes:
+        words = synthetic_words(size)
+        path = write_dictionary(words)
+        try:
+            query_words = [misspell(rng.choice(words), rng, rng.randint(1, max_distance)) for _ in range(queries)]
+            print(f"\nDictionary size: {size}, max_distance={max_distance}")
+
+            _, scalar = measure(lambda: build_checker(path, 'linear'))
+            build_time, batch = measure(lambda: build_checker(path, 'batch'))
+            scalar_time, scalar_results = measure(
+                lambda: [scalar.generate_suggestions(q, max_distance) for q in query_words[:scalar_queries]])
+            batch_time, batch_results = measure(
+                lambda: [batch.generate_suggestions(q, max_distance) for q in query_words])
+            scalar_ms = scalar_time / scalar_queries * 1000
+            batch_ms = batch_time / queries * 1000
+            same = 'yes' if batch_results[:scalar_queries] == scalar_results else 'NO'
+            rows = batch.index.comparisons / queries
+            print(f"  scalar   {scalar_ms:10.2f} ms/query")
+            print(f"  batch    {batch_ms:10.2f} ms/query   encode {build_time * 1000:.0f} ms   "
+                  f"{rows:.0f} rows after length filter   speedup {scalar_ms / batch_ms:.1f}x   "
+                  f"same results: {same}")
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (10000, 100000, 1000000)
+    run(sizes)
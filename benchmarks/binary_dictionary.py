@@ -0,0 +1,61 @@
+"""
+Benchmark loading and membership tests of a compiled, memory-mapped
+dictionary against parsing the text dictionary into a Python set.
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+from utils.binary_dictionary import BinaryDictionary, compile_dictionary
+from utils.update_dictionary import load_dictionary
+from benchmarks.common import synthetic_words, misspell, measure
+
+
+def traced(func):
+    """Run a callable and return (seconds, result, traced peak MB)."""
+    elapsed, result = measure(func)
+    # Measure memory in a second run so tracing does not distort the timing
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, result, peak / 1e6
+
+
+def run(sizes=(100000, 1000000), lookups=100000):
+    workdir = tempfile.mkdtemp(prefix='tigrigna_binary_')
+    rng = random.Random(6)
+    try:
+        for size in sizes:
+            words = synthetic_words(size)
+            text_path = os.path.join(workdir, 'words.txt')
+            binary_path = os.path.join(workdir, 'words.tgdb')
+            with open(text_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(words))
+            compile_time, _ = measure(lambda: compile_dictionary({word: 0 for word in words}, binary_path))
+            queries = [rng.choice(words) if rng.random() < 0.5 else misspell(rng.choice(words), rng)
+                       for _ in range(lookups)]
+            print(f"\nDictionary: {size} words, text {os.path.getsize(text_path) / 1e6:.1f} MB, "
+                  f"compiled {os.path.getsize(binary_path) / 1e6:.1f} MB in {compile_time:.1f} s")
+
+            text_time, text_set, text_mb = traced(lambda: load_dictionary(text_path))
+            binary_time, binary, binary_mb = traced(lambda: BinaryDictionary(binary_path))
+            set_lookup, set_hits = measure(lambda: sum(query in text_set for query in queries))
+            mmap_lookup, mmap_hits = measure(lambda: sum(query in binary for query in queries))
+            assert set_hits == mmap_hits
+            print(f"  text + set   load {text_time * 1000:9.2f} ms   heap {text_mb:8.1f} MB   "
+                  f"{set_lookup / lookups * 1e9:8.0f} ns/lookup")
+            print(f"  mmap binary  load {binary_time * 1000:9.2f} ms   heap {binary_mb:8.1f} MB   "
+                  f"{mmap_lookup / lookups * 1e9:8.0f} ns/lookup")
+            binary.close()
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (100000, 1000000)
+    run(sizes)
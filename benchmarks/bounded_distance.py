@@ -0,0 +1,35 @@
+"""
+Microbenchmark the banded, early-exit edit distance against the full DP
+matrix for increasing word lengths.
+"""
+
+import contextlib
+import io
+import random
+import timeit
+
+from utils.distances import bounded_edit_distance
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import DICTIONARY_PATH, synthetic_words, misspell
+
+
+def run(lengths=(3, 5, 8, 12, 20), max_distance=2, pairs=200):
+    with contextlib.redirect_stdout(io.StringIO()):
+        checker = TigrignaSpellChecker(DICTIONARY_PATH)
+    rng = random.Random(5)
+    print(f"max_distance={max_distance}, {pairs} pairs per row, times in microseconds per pair")
+    print(f"{'length':>6} {'kind':>10} {'full':>9} {'bounded':>9} {'speedup':>8}")
+    for length in lengths:
+        words = synthetic_words(pairs, seed=length, min_len=length, max_len=length)
+        near = [(w, misspell(w, rng)) for w in words]
+        unrelated = [(w, rng.choice(words)) for w in words]
+        for kind, sample in (('near', near), ('unrelated', unrelated)):
+            full = timeit.timeit(lambda: [checker.edit_distance(a, b) for a, b in sample], number=5)
+            bounded = timeit.timeit(lambda: [bounded_edit_distance(a, b, max_distance) for a, b in sample],
+                                    number=5)
+            scale = 1e6 / (5 * len(sample))
+            print(f"{length:>6} {kind:>10} {full * scale:9.2f} {bounded * scale:9.2f} {full / bounded:7.1f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,39 @@
+"""
+Benchmark check_many against calling check_text per document on a stream
+of short messages, with one and several worker processes.
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import synthetic_words, write_dictionary, zipf_corpus, measure
+
+
+def run(messages=20000, size=20000, workers=4, engine='symspell'):
+    words = synthetic_words(size)
+    path = write_dictionary(words)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            # check_text relies on the default LRU cache for repeated typos;
+            # check_many gets no help from a cache
+            cached = TigrignaSpellChecker(path, engine=engine)
+            checker = TigrignaSpellChecker(path, engine=engine, cache_size=0)
+        documents = zipf_corpus(words, messages * 10, line_length=10).splitlines()
+        print(f"{len(documents)} messages of 10 tokens, dictionary of {size} words, {engine} engine, "
+              f"{os.cpu_count()} CPUs")
+
+        base_time, expected = measure(lambda: [cached.check_text(text) for text in documents], repeat=1)
+        print(f"  check_text per message   {base_time:8.2f} s")
+        for count in sorted({1, workers}):
+            elapsed, results = measure(lambda: list(checker.check_many(documents, workers=count)), repeat=1)
+            print(f"  check_many workers={count:<3}  {elapsed:8.2f} s   speedup {base_time / elapsed:.1f}x   "
+                  f"same results: {'yes' if results == expected else 'NO'}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:4]), *sys.argv[4:5])
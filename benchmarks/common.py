@@ -0,0 +1,152 @@
+"""
+Shared helpers for the Tigrigna spell checker benchmarks.
+Run any benchmark from the repository root, e.g.
+``python -m benchmarks.suggestion_engines``.
+"""
+
+import os
+import random
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DICTIONARY_PATH = os.path.join(REPO_ROOT, 'data', 'tigrigna_words.txt')
+
+# Consonant rows of the Ethiopic block (each row holds 8 vowel orders)
+FIDEL_BASES = [0x1200 + 8 * row for row in range(0x2B)]
+
+
+def synthetic_words(count: int, seed: int = 0, min_len: int = 2, max_len: int = 8) -> List[str]:
+    """
+    Generate unique pseudo-Tigrigna words made of random fidel characters.
+    
+    Args:
+        count: Number of words to generate
+        seed: Random seed for reproducible lexicons
+        min_len: Minimum word length in characters
+        max_len: Maximum word length in characters
+        
+    Returns:
+        List of unique words
+    """
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        length = rng.randint(min_len, max_len)
+        words.add(''.join(chr(rng.choice(FIDEL_BASES) + rng.randrange(7)) for _ in range(length)))
+    return sorted(words)
+
+
+# Inflectional prefixes and suffixes used to build morphologically rich lexicons
+PREFIXES = ['', 'ም', 'ዝ', 'ከ', 'ተ', 'ኣ', 'ን', 'ብ']
+SUFFIXES = ['', 'ኹ', 'ኻ', 'ኺ', 'ና', 'ኩም', 'ክን', 'ዉ', 'ን', 'ት', 'ታት', 'ቲ', 'ኡ', 'ኣ', 'ዮም', 'ዮ', 'ካ', 'ኪ', 'ኩ', 'ዎ']
+
+
+def inflected_words(stems: int, seed: int = 0) -> List[str]:
+    """
+    Generate a lexicon of synthetic stems combined with every prefix and suffix.
+    
+    Args:
+        stems: Number of stems
+        seed: Random seed
+        
+    Returns:
+        Sorted list of unique surface forms
+    """
+    words = set()
+    for stem in synthetic_words(stems, seed, min_len=2, max_len=4):
+        for prefix in PREFIXES:
+            for suffix in SUFFIXES:
+                words.add(prefix + stem + suffix)
+    return sorted(words)
+
+
+def misspell(word: str, rng: random.Random, edits: int = 1) -> str:
+    """
+    Apply random substitutions, insertions and deletions to a word.
+    
+    Args:
+        word: The word to corrupt
+        rng: Random number generator
+        edits: Number of edits to apply
+        
+    Returns:
+        The corrupted word
+    """
+    chars = list(word)
+    for _ in range(edits):
+        op = rng.randrange(3)
+        pos = rng.randrange(len(chars) + (op == 1)) if chars else 0
+        if op == 0 and chars:
+            chars[pos] = chr(rng.choice(FIDEL_BASES) + rng.randrange(7))
+        elif op == 1 or not chars:
+            chars.insert(pos, chr(rng.choice(FIDEL_BASES) + rng.randrange(7)))
+        elif len(chars) > 1:
+            del chars[pos]
+    return ''.join(chars)
+
+
+def zipf_corpus(words: List[str], tokens: int, seed: int = 0, typo_rate: float = 0.05,
+                line_length: int = 12) -> str:
+    """
+    Generate a Zipf-distributed text from a word list with occasional typos.
+    
+    Args:
+        words: Vocabulary; earlier words are more frequent
+        tokens: Number of tokens to generate
+        seed: Random seed
+        typo_rate: Fraction of tokens that are misspelled
+        line_length: Tokens per line; lines end with the Ethiopic full stop
+        
+    Returns:
+        The generated text
+    """
+    rng = random.Random(seed)
+    weights = [1.0 / rank for rank in range(1, len(words) + 1)]
+    # A fixed pool of typos keeps their frequencies Zipfian as well
+    typos = [misspell(word, rng) for word in rng.choices(words, weights, k=max(1, len(words) // 2))]
+    typo_weights = [1.0 / rank for rank in range(1, len(typos) + 1)]
+    lines = []
+    for start in range(0, tokens, line_length):
+        count = min(line_length, tokens - start)
+        line = [rng.choices(typos, typo_weights)[0] if rng.random() < typo_rate else word
+                for word in rng.choices(words, weights, k=count)]
+        lines.append(' '.join(line) + ' ።')
+    return '\n'.join(lines)
+
+
+def write_dictionary(words: List[str]) -> str:
+    """
+    Write words to a temporary dictionary file.
+    
+    Args:
+        words: Words to write, one per line
+        
+    Returns:
+        Path to the temporary file; the caller removes it
+    """
+    fd, path = tempfile.mkstemp(suffix='.txt', prefix='tigrigna_bench_')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(words))
+    return path
+
+
+def measure(func: Callable[[], object], repeat: int = 1) -> Tuple[float, object]:
+    """
+    Time a callable.
+    
+    Args:
+        func: Callable without arguments
+        repeat: Number of runs; the fastest is reported
+        
+    Returns:
+        Tuple of (best time in seconds, result of the last run)
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
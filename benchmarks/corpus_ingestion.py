@@ -0,0 +1,76 @@
+"""
+Benchmark corpus ingestion: throughput and peak RSS of process_corpus for
+growing corpus sizes, compared with reading the whole file at once.
+Each run happens in a fresh process so peak RSS is measured in isolation.
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+from utils.update_dictionary import load_dictionary, process_corpus, tokenize_text
+from benchmarks.common import DICTIONARY_PATH, zipf_corpus
+
+
+def read_whole_file(corpus_file, dictionary_file):
+    """process_corpus as it worked before streaming, without the final write."""
+    existing_dictionary = load_dictionary(dictionary_file)
+    with open(corpus_file, 'r', encoding='utf-8') as file:
+        tokens = tokenize_text(file.read())
+    new_words = {word for word in tokens if word not in existing_dictionary and len(word) > 1}
+    return len(tokens), len(new_words)
+
+
+def child(mode, corpus_file, dictionary_file, queue):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == 'streaming':
+            total, _ = process_corpus(corpus_file, dictionary_file)
+        else:
+            total, _ = read_whole_file(corpus_file, dictionary_file)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux
+    queue.put((total, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+
+
+def write_corpus(path, size_mb):
+    words = [line.strip() for line in open(DICTIONARY_PATH, encoding='utf-8') if line.strip()]
+    block = zipf_corpus(words, 100000) + '\n'
+    target = size_mb * 1e6
+    with open(path, 'w', encoding='utf-8') as f:
+        while f.tell() < target:
+            f.write(block)
+
+
+def run(sizes=(10, 50, 200)):
+    context = multiprocessing.get_context('spawn')
+    workdir = tempfile.mkdtemp(prefix='tigrigna_corpus_')
+    try:
+        for size_mb in sizes:
+            corpus_file = os.path.join(workdir, 'corpus.txt')
+            write_corpus(corpus_file, size_mb)
+            actual_mb = os.path.getsize(corpus_file) / 1e6
+            print(f"\nCorpus: {actual_mb:.0f} MB")
+            for mode in ('whole-file', 'streaming'):
+                dictionary_file = os.path.join(workdir, 'dictionary.txt')
+                shutil.copy(DICTIONARY_PATH, dictionary_file)
+                queue = context.Queue()
+                process = context.Process(target=child, args=(mode, corpus_file, dictionary_file, queue))
+                process.start()
+                total, elapsed, peak_mb = queue.get()
+                process.join()
+                print(f"  {mode:<11} {actual_mb / elapsed:7.1f} MB/s   {total / elapsed:12,.0f} tokens/s   "
+                      f"peak RSS {peak_mb:8.1f} MB")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (10, 50, 200)
+    run(sizes)
@@ -0,0 +1,79 @@
+"""
+Benchmark the DAWG lexicon against a Python set plus the notebooks' prefix
+dictionary: retained memory, membership, prefix enumeration and fuzzy lookup.
+"""
+
+import gc
+import random
+import sys
+import tracemalloc
+from collections import defaultdict
+
+from utils.dawg import DAWG
+from utils.distances import bounded_edit_distance
+from utils.symspell import SymSpellIndex
+from benchmarks.common import inflected_words, misspell, measure
+
+
+def build_prefix_index(words):
+    """The prefix dictionary built by tigrigna_autocomplete_final.ipynb."""
+    index = defaultdict(list)
+    for word in words:
+        for i in range(1, len(word) + 1):
+            index[word[:i]].append(word)
+    for prefix in index:
+        index[prefix] = sorted(set(index[prefix]))
+    return index
+
+
+def retained(func):
+    """Return (result, MB still allocated after func returns)."""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 1e6
+
+
+def run(stems=3000, queries=2000):
+    words = inflected_words(stems)
+    rng = random.Random(7)
+    print(f"Lexicon: {len(words)} inflected forms from {stems} stems")
+
+    (word_set, prefix_index), set_mb = retained(lambda: (set(words), build_prefix_index(words)))
+    build_time, dawg = measure(lambda: DAWG(words))
+    dawg, dawg_mb = retained(lambda: DAWG(words))
+    print(f"  set + prefix dict   {set_mb:8.1f} MB")
+    print(f"  DAWG                {dawg_mb:8.1f} MB   {dawg.node_count} nodes, "
+          f"{len(dawg.labels)} edges, built in {build_time:.2f} s")
+
+    members = [rng.choice(words) if rng.random() < 0.5 else misspell(rng.choice(words), rng)
+               for _ in range(queries)]
+    prefixes = [word[:rng.randint(1, 3)] for word in rng.sample(words, queries)]
+    typos = [misspell(rng.choice(words), rng) for _ in range(queries // 20)]
+
+    set_member, _ = measure(lambda: [word in word_set for word in members])
+    dawg_member, _ = measure(lambda: [word in dawg for word in members])
+    dict_prefix, expected = measure(lambda: [prefix_index.get(prefix, [])[:10] for prefix in prefixes])
+    dawg_prefix, actual = measure(lambda: [dawg.words_with_prefix(prefix, 10) for prefix in prefixes])
+    assert expected == actual
+
+    linear_fuzzy, _ = measure(lambda: [[w for w in word_set if bounded_edit_distance(typo, w, 1) <= 1]
+                                       for typo in typos[:3]])
+    symspell = SymSpellIndex(words, lambda a, b: bounded_edit_distance(a, b, 1), 1)
+    symspell_fuzzy, expected = measure(lambda: [sorted(symspell.lookup(typo, 1)) for typo in typos])
+    dawg_fuzzy, actual = measure(lambda: [sorted(dawg.lookup(typo, 1)) for typo in typos])
+    assert expected == actual
+
+    print(f"  membership          set {set_member / queries * 1e6:8.2f} us   "
+          f"DAWG {dawg_member / queries * 1e6:8.2f} us")
+    print(f"  prefix top-10       dict {dict_prefix / queries * 1e6:7.2f} us   "
+          f"DAWG {dawg_prefix / queries * 1e6:8.2f} us")
+    print(f"  fuzzy, distance 1   linear scan {linear_fuzzy / 3 * 1e3:8.2f} ms   "
+          f"symspell {symspell_fuzzy / len(typos) * 1e3:6.2f} ms   DAWG {dawg_fuzzy / len(typos) * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:]))
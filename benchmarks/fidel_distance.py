@@ -0,0 +1,45 @@
+"""
+Benchmark the fidel-aware edit distance against the plain Levenshtein
+distance, both scalar per word pair and vectorised over a whole lexicon.
+"""
+
+import contextlib
+import io
+import random
+import sys
+
+from utils.fidel import encode_word, encode_words, fidel_edit_distance, batch_edit_distance
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import DICTIONARY_PATH, synthetic_words, misspell, measure
+
+
+def run(size=20000, queries=20):
+    with contextlib.redirect_stdout(io.StringIO()):
+        checker = TigrignaSpellChecker(DICTIONARY_PATH)
+    rng = random.Random(2)
+    words = synthetic_words(size)
+    query_words = [misspell(rng.choice(words), rng) for _ in range(queries)]
+    print(f"Scanning {size} words for {queries} queries")
+
+    scalar_time, _ = measure(lambda: [[checker.edit_distance(q, w) for w in words] for q in query_words])
+    fidel_time, _ = measure(lambda: [[fidel_edit_distance(q, w) for w in words] for q in query_words])
+    encode_time, (matrix, lengths) = measure(lambda: encode_words(words))
+    batch_time, _ = measure(
+        lambda: [batch_edit_distance(encode_word(q), matrix, lengths) for q in query_words], repeat=3)
+
+    for name, elapsed in (('edit_distance (scalar)', scalar_time),
+                          ('fidel_edit_distance (scalar)', fidel_time),
+                          ('batch_edit_distance (numpy)', batch_time)):
+        per_pair = elapsed / (size * queries) * 1e9
+        print(f"  {name:<30} {elapsed / queries * 1000:9.2f} ms/query   {per_pair:8.1f} ns/pair")
+    print(f"  one-off encoding of the lexicon: {encode_time * 1000:.1f} ms")
+
+    # Ranking quality: a vowel slip should outrank a consonant slip
+    for typo in ('ሰላሞ', 'ጽቡቅ', 'ኣለኸ'):
+        plain = sorted(checker.word_dict, key=lambda w: (checker.edit_distance(typo, w), w))[:3]
+        fidel = sorted(checker.word_dict, key=lambda w: (fidel_edit_distance(typo, w), w))[:3]
+        print(f"  {typo}: levenshtein {plain}   fidel {fidel}")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:]))
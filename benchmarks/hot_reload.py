@@ -0,0 +1,77 @@
+"""
+Measure what readers see while the dictionary is reloaded: reloading in
+place with load_dictionary against a copy-on-write HotReloader swap.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import threading
+import time
+
+from utils.hot_reload import HotReloader
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import synthetic_words, misspell, write_dictionary
+
+
+def readers(check, text, expected, stop, count=2):
+    """Run check(text) in a loop, recording latencies and wrong answers."""
+    results = {'latencies': [], 'inconsistent': 0}
+
+    def loop():
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                correct = check(text) == expected
+            except Exception:
+                correct = False
+            results['latencies'].append(time.perf_counter() - start)
+            if not correct:
+                results['inconsistent'] += 1
+
+    threads = [threading.Thread(target=loop) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def observe(name, check, reload, text, expected):
+    stop = threading.Event()
+    threads, results = readers(check, text, expected, stop)
+    time.sleep(0.2)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        reload()
+    elapsed = time.perf_counter() - start
+    time.sleep(0.2)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    latencies = sorted(results['latencies'])
+    print(f"  {name:24} reload {elapsed * 1000:8.0f} ms   reader max {latencies[-1] * 1000:8.1f} ms   "
+          f"p50 {latencies[len(latencies) // 2] * 1000:6.2f} ms   "
+          f"wrong answers {results['inconsistent']}/{len(latencies)}")
+
+
+def run(size=50000, engine='symspell'):
+    rng = random.Random(3)
+    words = synthetic_words(size)
+    path = write_dictionary(words)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            checker = TigrignaSpellChecker(path, engine=engine, cache_size=0)
+        text = ' '.join(rng.sample(words, 40) + [misspell(rng.choice(words), rng)])
+        expected = checker.check_text(text)
+        print(f"Dictionary: {size} words, {engine} engine; 2 reader threads checking {len(text.split())} tokens")
+        observe('load_dictionary in place', checker.check_text, checker.load_dictionary, text, expected)
+        reloader = HotReloader(checker)
+        observe('HotReloader swap', lambda t: reloader.checker.check_text(t), reloader.reload, text, expected)
+        print(f"  {reloader.stats()}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:2]), *sys.argv[2:3])
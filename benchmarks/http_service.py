@@ -0,0 +1,85 @@
+"""
+Throughput and latency client for the HTTP spell-check service. Starts
+``python -m utils.server`` on a free localhost port, sends batched /check
+requests over keep-alive connections from several client threads and
+compares the cost with loading a checker in every process.
+"""
+
+import contextlib
+import http.client
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import REPO_ROOT, synthetic_words, write_dictionary, zipf_corpus
+
+
+def start_server(path, engine, workers):
+    process = subprocess.Popen(
+        [sys.executable, '-u', '-m', 'utils.server', '--dictionary', path, '--engine', engine,
+         '--port', '0', '--workers', str(workers)],
+        cwd=REPO_ROOT, stdout=subprocess.PIPE, text=True)
+    for line in process.stdout:
+        if line.startswith('Serving on'):
+            port = int(line.split()[2].rsplit(':', 1)[1])
+            return process, port
+    raise RuntimeError("Server did not start")
+
+
+def client(port, documents, batch, requests, latencies):
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    headers = {'Content-Type': 'application/json'}
+    for i in range(requests):
+        start = i * batch % len(documents)
+        body = json.dumps({'documents': documents[start:start + batch]})
+        began = time.perf_counter()
+        connection.request('POST', '/check', body, headers)
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - began)
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}")
+    connection.close()
+
+
+def run(clients=4, batch=16, requests=100, workers=8, size=50000, engine='symspell'):
+    words = synthetic_words(size)
+    path = write_dictionary(words)
+    documents = zipf_corpus(words, 20000, line_length=20).splitlines()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        TigrignaSpellChecker(path, engine=engine)
+    load_time = time.perf_counter() - started
+
+    process, port = start_server(path, engine, workers)
+    try:
+        latencies = []
+        threads = [threading.Thread(target=client, args=(port, documents, batch, requests, latencies))
+                   for _ in range(clients)]
+        began = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - began
+    finally:
+        process.terminate()
+        process.wait()
+        os.remove(path)
+
+    latencies.sort()
+    total = clients * requests
+    print(f"Dictionary: {size} words, {engine} engine")
+    print(f"{clients} clients x {requests} requests of {batch} documents (20 tokens each), {workers} server workers")
+    print(f"  throughput  {total / elapsed:8.0f} requests/s   {total * batch / elapsed:8.0f} documents/s")
+    print(f"  latency     p50 {latencies[total // 2] * 1000:.2f} ms   p99 {latencies[int(total * 0.99)] * 1000:.2f} ms")
+    print(f"  loading a checker per process instead costs {load_time * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:6]), *sys.argv[6:7])
@@ -0,0 +1,55 @@
+"""
+Benchmark per-keystroke cost of incremental re-checking against re-checking
+the whole buffer, for growing document lengths.
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+
+from utils.incremental import IncrementalChecker
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import DICTIONARY_PATH, zipf_corpus
+
+
+def run(lengths=(1000, 10000, 100000), keystrokes=200):
+    with contextlib.redirect_stdout(io.StringIO()):
+        checker = TigrignaSpellChecker(DICTIONARY_PATH)
+    words = sorted(checker.word_dict)
+    rng = random.Random(10)
+    print(f"{'tokens':>8} {'full re-check':>15} {'edit()':>12} {'update()':>12}   per keystroke")
+    for length in lengths:
+        text = zipf_corpus(words, length, seed=length)
+        typed = ' '.join(rng.choice(words) for _ in range(keystrokes // 4))[:keystrokes]
+        position = len(text) // 2
+
+        start = time.perf_counter()
+        buffer = text
+        for i in range(1, 21):
+            buffer = text[:position] + typed[:i] + text[position:]
+            checker.check_text(buffer)
+        full = (time.perf_counter() - start) / 20
+
+        incremental = IncrementalChecker(checker, text)
+        # Moving the cursor to the middle shifts the gap once; typing then stays local
+        incremental.edit(position, 0, '')
+        start = time.perf_counter()
+        for i, char in enumerate(typed):
+            incremental.edit(position + i, 0, char)
+        edit = (time.perf_counter() - start) / len(typed)
+
+        incremental = IncrementalChecker(checker, text)
+        buffers = [text[:position] + typed[:i] + text[position:] for i in range(1, len(typed) + 1)]
+        start = time.perf_counter()
+        for buffer in buffers:
+            incremental.update(buffer)
+        update = (time.perf_counter() - start) / len(typed)
+
+        print(f"{length:>8} {full * 1e3:12.2f} ms {edit * 1e6:9.1f} us {update * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    lengths = tuple(int(arg) for arg in sys.argv[1:]) or (1000, 10000, 100000)
+    run(lengths)
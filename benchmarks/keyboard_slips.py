@@ -0,0 +1,76 @@
+"""
+Benchmark the on-screen keyboard's slip-first suggestions against its full
+dictionary scan: latency and top-1 accuracy for words mistyped by a vowel
+variant or neighbouring key slip, and the cost of falling back for other
+typos. The keyboard's methods are called unbound, so no window is opened.
+"""
+
+import random
+import sys
+
+from utils.keyboard_slips import SlipTable, VARIANT_COST
+from utils.local_tigrigna_keyboard import TigrignaKeyboard
+from benchmarks.common import synthetic_words, misspell, measure
+
+
+class HeadlessKeyboard:
+    """The parts of TigrignaKeyboard get_suggestions needs, without Tk."""
+
+    levenshtein_distance = TigrignaKeyboard.levenshtein_distance
+    get_suggestions = TigrignaKeyboard.get_suggestions
+
+    def __init__(self, dictionary, slips=True):
+        self.dictionary = dictionary
+        table = SlipTable(TigrignaKeyboard.KEYBOARD_LAYOUT, TigrignaKeyboard.generate_variants)
+        # An empty table always falls back: the scan the keyboard used before
+        self.slip_table = table if slips else SlipTable([], TigrignaKeyboard.generate_variants)
+
+
+def slip_typo(word, table, rng):
+    """Replace one character of a word by one of its slips, variants twice as often."""
+    positions = [i for i, char in enumerate(word) if char in table.substitutes]
+    position = rng.choice(positions)
+    slips = table.substitutes[word[position]]
+    variants = [char for char, cost in slips if cost == VARIANT_COST]
+    keys = [char for char, cost in slips if cost != VARIANT_COST]
+    choices = variants if not keys or (variants and rng.random() < 2 / 3) else keys
+    return word[:position] + rng.choice(choices) + word[position + 1:]
+
+
+def run(size=20000, queries=100):
+    rng = random.Random(25)
+    dictionary = set(synthetic_words(size))
+    words = sorted(dictionary)
+    scan = HeadlessKeyboard(dictionary, slips=False)
+    slip_first = HeadlessKeyboard(dictionary)
+    table = slip_first.slip_table
+    print(f"Dictionary: {size} words, {queries} queries; slip table of {len(table)} pairs "
+          f"over {len(table.substitutes)} characters")
+
+    typos = {'key/variant slips': [], 'random edits': []}
+    while len(typos['key/variant slips']) < queries:
+        word = rng.choice(words)
+        typo = slip_typo(word, table, rng)
+        if typo not in dictionary:
+            typos['key/variant slips'].append((typo, word))
+    while len(typos['random edits']) < queries:
+        word = rng.choice(words)
+        typo = misspell(word, rng)
+        if typo not in dictionary:
+            typos['random edits'].append((typo, word))
+
+    for kind, sample in typos.items():
+        print(f"\n  {kind}:")
+        for name, keyboard in (('full scan', scan), ('slip-first', slip_first)):
+            elapsed, results = measure(lambda: [keyboard.get_suggestions(typo) for typo, _ in sample])
+            top1 = sum(bool(found) and found[0] == word for found, (_, word) in zip(results, sample)) / queries
+            found = sum(word in suggestions for suggestions, (_, word) in zip(results, sample)) / queries
+            line = f"    {name:<11} {elapsed / queries * 1000:8.2f} ms/query  top-1 {top1:4.0%}  in top 5 {found:4.0%}"
+            if keyboard is slip_first:
+                fallbacks = sum(not table.suggestions(typo, dictionary) for typo, _ in sample) / queries
+                line += f"  fell back {fallbacks:4.0%}"
+            print(line)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]))
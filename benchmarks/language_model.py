@@ -0,0 +1,123 @@
+"""
+Benchmark context checking with the word n-gram language model: model size,
+real-word error detection, re-ranking of non-word suggestions and the time
+check_text spends per sentence against the context budget.
+Sentences come from a synthetic Markov chain, so word context carries signal;
+some words have a rarer valid twin one vowel slip away.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+from utils.spell_checker import TigrignaSpellChecker
+from utils.update_dictionary import build_language_model
+from benchmarks.common import synthetic_words, misspell, write_dictionary
+
+
+def vowel_twin(word, rng):
+    """Change the vowel order of one syllable of a word."""
+    position = rng.randrange(len(word))
+    char = word[position]
+    order = (ord(char) - 0x1200) % 8
+    twin = chr(ord(char) - order + (order + rng.randrange(1, 7)) % 7)
+    return word[:position] + twin + word[position + 1:]
+
+
+def markov_sentences(vocabulary, count, rng, successors=4):
+    """Generate sentences in which every word is followed by one of a few fixed words."""
+    following = {word: rng.sample(vocabulary, successors) for word in vocabulary}
+    weights = [1.0 / rank for rank in range(1, len(vocabulary) + 1)]
+    result = []
+    for _ in range(count):
+        word = rng.choices(vocabulary, weights)[0]
+        sentence = [word]
+        for _ in range(rng.randint(6, 12)):
+            word = rng.choice(following[word])
+            sentence.append(word)
+        result.append(sentence)
+    return result
+
+
+def run(vocabulary_size=3000, training=40000, tests=300, budget_ms=10.0):
+    rng = random.Random(4)
+    vocabulary = synthetic_words(vocabulary_size, min_len=3, max_len=6)
+    twins = {word: vowel_twin(word, rng) for word in rng.sample(vocabulary, vocabulary_size // 3)}
+    twins = {word: twin for word, twin in twins.items() if twin not in vocabulary}
+    train = markov_sentences(vocabulary, training + tests, rng)
+    test = train[training:]
+    train = train[:training]
+
+    fd, corpus_path = tempfile.mkstemp(suffix='.txt')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(' '.join(sentence) + ' ።' for sentence in train))
+    model_path = corpus_path + '.tglm'
+    # Twins are valid words that the corpus never uses in these contexts
+    dictionary_path = write_dictionary(vocabulary + sorted(set(twins.values())))
+    try:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_language_model([corpus_path], model_path, order=3, workers=1)
+        build_time = time.perf_counter() - start
+        tokens = sum(len(sentence) for sentence in train)
+        print(f"Corpus: {len(train)} sentences, {tokens} tokens; model built in {build_time:.1f} s, "
+              f"{os.path.getsize(model_path) / 1024:.0f} KB "
+              f"({os.path.getsize(model_path) / os.path.getsize(corpus_path):.0%} of the corpus)")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            plain = TigrignaSpellChecker(dictionary_path, engine='symspell', cache_size=0)
+            contextual = TigrignaSpellChecker(dictionary_path, engine='symspell', cache_size=0,
+                                              language_model=model_path, context_budget=budget_ms / 1000)
+        print(f"  {len(contextual.language_model)} n-grams; context budget {budget_ms:.0f} ms per sentence")
+
+        # Real-word errors: one word replaced by its valid twin
+        cases = [(sentence, position) for sentence in test for position, word in enumerate(sentence)
+                 if word in twins]
+        cases = rng.sample(cases, min(tests, len(cases)))
+        detected = corrected = 0
+        times = []
+        for sentence, position in cases:
+            words = list(sentence)
+            intended, words[position] = words[position], twins[words[position]]
+            start = time.perf_counter()
+            result = contextual.check_text(' '.join(words) + ' ።')
+            times.append(time.perf_counter() - start)
+            if words[position] in result:
+                detected += 1
+                corrected += result[words[position]][:1] == [intended]
+        false_alarms = sum(len(contextual.check_text(' '.join(sentence) + ' ።')) for sentence in test)
+        clean_tokens = sum(len(sentence) for sentence in test)
+        print(f"  real-word errors: {detected / len(cases):.0%} detected, {corrected / len(cases):.0%} "
+              f"corrected at rank 1; {false_alarms} false alarms in {clean_tokens} clean tokens")
+
+        # Non-word errors: suggestions re-ranked by context
+        plain_top = context_top = 0
+        for sentence in rng.sample(test, tests):
+            words = list(sentence)
+            position = rng.randrange(len(words))
+            intended = words[position]
+            words[position] = typo = misspell(intended, rng)
+            if plain.check_word(typo):
+                continue
+            text = ' '.join(words) + ' ።'
+            plain_top += plain.check_text(text).get(typo, [None])[:1] == [intended]
+            start = time.perf_counter()
+            context_top += contextual.check_text(text).get(typo, [None])[:1] == [intended]
+            times.append(time.perf_counter() - start)
+        print(f"  non-word errors corrected at rank 1: {plain_top / tests:.0%} by distance, "
+              f"{context_top / tests:.0%} with context")
+        times.sort()
+        print(f"  check_text per sentence: median {times[len(times) // 2] * 1000:.2f} ms, "
+              f"max {times[-1] * 1000:.2f} ms")
+    finally:
+        for path in (corpus_path, model_path, dictionary_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:4]), *(float(arg) for arg in sys.argv[4:5]))
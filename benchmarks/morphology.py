@@ -0,0 +1,76 @@
+"""
+Benchmark the affix-rule lexicon against the fully expanded set of surface
+forms: memory held by the checker, check_word latency and suggestion latency.
+"""
+
+import contextlib
+import gc
+import io
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import PREFIXES, SUFFIXES, inflected_words, misspell, measure, synthetic_words, write_dictionary
+
+
+def write_affix_files(stems):
+    """Write an affix file for PREFIXES and SUFFIXES and a stem dictionary flagged with both."""
+    fd, affix_path = tempfile.mkstemp(suffix='.aff')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(f"PFX P Y {len(PREFIXES) - 1}\n")
+        f.writelines(f"PFX P 0 {prefix} .\n" for prefix in PREFIXES if prefix)
+        f.write(f"SFX S Y {len(SUFFIXES) - 1}\n")
+        f.writelines(f"SFX S 0 {suffix} .\n" for suffix in SUFFIXES if suffix)
+    fd, stem_path = tempfile.mkstemp(suffix='.dic')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.writelines(f"{stem}/PS\n" for stem in stems)
+    return affix_path, stem_path
+
+
+def load(path, engine, **options):
+    """Build a checker with its index, returning it and the MB it retains."""
+    gc.collect()
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        checker = TigrignaSpellChecker(path, engine=engine, **options)
+        checker.index
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return checker, current / 1e6
+
+
+def run(stems=1000, queries=200, engine='symspell'):
+    stem_words = synthetic_words(stems, min_len=2, max_len=4)
+    forms = inflected_words(stems)
+    affix_path, stem_path = write_affix_files(stem_words)
+    full_path = write_dictionary(forms)
+    rng = random.Random(5)
+    members = [rng.choice(forms) if rng.random() < 0.5 else misspell(rng.choice(forms), rng)
+               for _ in range(queries * 10)]
+    typos = [misspell(rng.choice(forms), rng) for _ in range(queries)]
+    print(f"Lexicon: {stems} stems x {len(PREFIXES)} prefixes x {len(SUFFIXES)} suffixes "
+          f"= {len(forms)} surface forms; engine {engine}")
+    try:
+        full, full_mb = load(full_path, engine)
+        affixed, affixed_mb = load(stem_path, engine, affix_path=affix_path)
+        print(f"  {'lexicon':9} {'entries':>8} {'memory':>9} {'check_word':>12} {'suggest':>10}")
+        results = []
+        for name, checker, mb in (('expanded', full, full_mb), ('affixed', affixed, affixed_mb)):
+            check_time, checked = measure(lambda: [checker.check_word(word) for word in members], repeat=3)
+            suggest_time, suggested = measure(lambda: [checker.generate_suggestions(word) for word in typos])
+            results.append((checked, suggested))
+            print(f"  {name:9} {len(checker.word_dict):8} {mb:7.1f} MB "
+                  f"{check_time / len(members) * 1e6:9.2f} us {suggest_time / len(typos) * 1000:7.2f} ms")
+        print(f"  memory saved: {full_mb - affixed_mb:.1f} MB ({1 - affixed_mb / full_mb:.0%}); "
+              f"same checks: {results[0][0] == results[1][0]}, same suggestions: {results[0][1] == results[1][1]}")
+    finally:
+        for path in (affix_path, stem_path, full_path):
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]), *sys.argv[3:4])
@@ -0,0 +1,84 @@
+"""
+Benchmark the character n-gram inverted index against the notebook's
+bigram Counter (enhanced_tigrigna_spell_checker.ipynb): build time, memory,
+candidates reaching the exact distance check and lookup latency, with the
+linear scan as the reference for exact results.
+"""
+
+import gc
+import heapq
+import random
+import sys
+import tracemalloc
+from collections import Counter
+
+from utils.distances import bounded_edit_distance
+from utils.ngram_index import NGramIndex
+from benchmarks.common import synthetic_words, misspell, measure
+
+
+def build_notebook_index(words, n=2):
+    """build_ngram_index from the notebook."""
+    index = {}
+    for word in words:
+        for i in range(len(word) - n + 1):
+            index.setdefault(word[i:i + n], set()).add(word)
+    return index
+
+
+def notebook_lookup(word, index, max_suggestions=5, n=2):
+    """get_enhanced_suggestions from the notebook, returning its verified candidates."""
+    candidates = Counter()
+    for i in range(len(word) - n + 1):
+        for candidate in index.get(word[i:i + n], ()):
+            candidates[candidate] += 1
+    top = heapq.nlargest(max_suggestions * 2, candidates.items(), key=lambda x: x[1])
+    return len(candidates), [(candidate, bounded_edit_distance(word, candidate, 2)) for candidate, _ in top]
+
+
+def retained(func):
+    """Return (result, MB still allocated after func returns)."""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 1e6
+
+
+def run(size=20000, queries=100):
+    rng = random.Random(9)
+    words = synthetic_words(size)
+    build_time, _ = measure(lambda: build_notebook_index(words))
+    notebook, notebook_mb = retained(lambda: build_notebook_index(words))
+    print(f"Dictionary: {size} words, {queries} queries")
+    print(f"  notebook index     build {build_time:5.2f} s  {notebook_mb:5.1f} MB")
+    indexes = {}
+    for q in (2, 3):
+        build_time, _ = measure(lambda: NGramIndex(words, q=q))
+        indexes[q], index_mb = retained(lambda: NGramIndex(words, q=q))
+        print(f"  NGramIndex q={q}     build {build_time:5.2f} s  {index_mb:5.1f} MB")
+
+    for max_distance in (1, 2):
+        typos = [misspell(rng.choice(words), rng, rng.randint(1, max_distance)) for _ in range(queries)]
+        linear_time, expected = measure(lambda: [sorted((word, d) for word in words
+                                                        if (d := bounded_edit_distance(typo, word, max_distance))
+                                                        <= max_distance) for typo in typos])
+        print(f"\n  max_distance={max_distance}: linear scan {linear_time / queries * 1000:.2f} ms/query")
+        query_time, results = measure(lambda: [notebook_lookup(typo, notebook) for typo in typos])
+        recall = sum(len({w for w, d in found if d <= max_distance} & {w for w, _ in exact}) / max(1, len(exact))
+                     for (_, found), exact in zip(results, expected)) / queries
+        print(f"  notebook Counter   {sum(count for count, _ in results) / queries:7.0f} candidates tallied/query  "
+              f"{query_time / queries * 1000:7.2f} ms/query  recall {recall:.0%}")
+        for q, index in indexes.items():
+            before = index.comparisons
+            query_time, results = measure(lambda: [sorted(index.lookup(typo, max_distance)) for typo in typos])
+            checked = (index.comparisons - before) / queries
+            print(f"  NGramIndex q={q}     {checked:7.0f} exact checks/query       "
+                  f"{query_time / queries * 1000:7.2f} ms/query  exact results: "
+                  f"{'yes' if results == expected else 'NO'}")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,64 @@
+"""
+Benchmark noisy-channel ranking against ordering by edit distance: top-1
+accuracy on typos of Zipf-distributed words, and the cost of scoring many
+candidates in one vectorised pass against one candidate at a time.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+
+from utils.fidel import decompose
+from utils.noisy_channel import NoisyChannelRanker
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import synthetic_words, misspell, write_dictionary, measure
+
+
+def vowel_slip(word, rng):
+    """Change the vowel order of one syllable, the commonest fidel typo."""
+    position = rng.randrange(len(word))
+    char = word[position]
+    order = decompose(char)[1]
+    if order >= 7:
+        return misspell(word, rng)
+    slipped = chr(ord(char) - order + rng.choice([other for other in range(7) if other != order]))
+    return word[:position] + slipped + word[position + 1:]
+
+
+def run(size=20000, queries=300, engine='symspell'):
+    rng = random.Random(11)
+    words = synthetic_words(size)
+    rng.shuffle(words)
+    counts = {word: max(1, int(1e6 / rank)) for rank, word in enumerate(words, 1)}
+    path = write_dictionary([f"{word}\t{count}" for word, count in counts.items()])
+    intended = rng.choices(words, [1.0 / rank for rank in range(1, size + 1)], k=queries)
+    typos = [vowel_slip(word, rng) if rng.random() < 0.6 else misspell(word, rng) for word in intended]
+    print(f"Dictionary: {size} words with Zipf counts, {queries} typos, engine {engine}")
+    try:
+        for ranking in ('distance', 'noisy_channel'):
+            with contextlib.redirect_stdout(io.StringIO()):
+                checker = TigrignaSpellChecker(path, engine=engine, ranking=ranking, cache_size=0)
+            checker.generate_suggestions(typos[0])
+            elapsed, results = measure(lambda: [checker.generate_suggestions(typo) for typo in typos])
+            top1 = sum(bool(result) and result[0] == word for result, word in zip(results, intended))
+            top5 = sum(word in result for result, word in zip(results, intended))
+            print(f"  {ranking:14} top-1 {top1 / queries:6.1%}   top-5 {top5 / queries:6.1%}   "
+                  f"{elapsed / queries * 1000:7.2f} ms/query")
+    finally:
+        os.remove(path)
+
+    ranker = NoisyChannelRanker(counts)
+    print("Scoring candidates (times in ms)")
+    for count in (10, 100, 1000):
+        candidates = rng.sample(words, count)
+        typo = typos[0]
+        vectorised, scores = measure(lambda: ranker.scores(typo, candidates), repeat=5)
+        looped, _ = measure(lambda: [ranker.scores(typo, [candidate]) for candidate in candidates], repeat=1)
+        print(f"  {count:5} candidates   one pass {vectorised * 1000:8.2f}   "
+              f"one at a time {looped * 1000:8.2f}   speedup {looped / vectorised:6.1f}x")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]), *sys.argv[3:4])
@@ -0,0 +1,43 @@
+"""
+Benchmark parallel corpus counting with count_corpus for 1 to N worker
+processes and report the speedup over a single worker.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from utils.update_dictionary import count_corpus
+from benchmarks.common import DICTIONARY_PATH, zipf_corpus, measure
+
+
+def run(size_mb=100, files=4):
+    workdir = tempfile.mkdtemp(prefix='tigrigna_parallel_')
+    try:
+        words = [line.strip() for line in open(DICTIONARY_PATH, encoding='utf-8') if line.strip()]
+        block = zipf_corpus(words, 100000) + '\n'
+        paths = []
+        for index in range(files):
+            path = os.path.join(workdir, f'corpus_{index}.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                while f.tell() < size_mb * 1e6 / files:
+                    f.write(block)
+            paths.append(path)
+        total_mb = sum(os.path.getsize(path) for path in paths) / 1e6
+        cpus = os.cpu_count() or 1
+        print(f"Corpus: {files} files, {total_mb:.0f} MB, {cpus} CPUs available")
+
+        worker_counts = sorted({1, 2, 4, cpus})
+        baseline = None
+        for workers in worker_counts:
+            elapsed, counts = measure(lambda: count_corpus(paths, workers, range_size=8 << 20))
+            baseline = baseline or elapsed
+            print(f"  {workers:>2} workers   {elapsed:7.2f} s   {total_mb / elapsed:7.1f} MB/s   "
+                  f"{sum(counts.values()) / elapsed:12,.0f} tokens/s   speedup {baseline / elapsed:.2f}x")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:]))
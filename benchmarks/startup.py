@@ -0,0 +1,62 @@
+"""
+Benchmark checker startup: eager construction, lazy construction with the
+cost moved to the first check and first suggestion, and startup from a
+persisted index cache.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import synthetic_words, write_dictionary, measure
+
+
+def first_use(path, engine, **options):
+    """Time construction, the first check_word and the first suggestion separately."""
+    times = []
+    start = time.perf_counter()
+    checker = TigrignaSpellChecker(path, engine=engine, **options)
+    times.append(time.perf_counter() - start)
+    start = time.perf_counter()
+    checker.check_word('ሰላም')
+    times.append(time.perf_counter() - start)
+    start = time.perf_counter()
+    checker.generate_suggestions('ሰላምታ')
+    times.append(time.perf_counter() - start)
+    return times
+
+
+def run(size=30000, engines=('linear', 'symspell', 'bktree', 'dawg')):
+    words = synthetic_words(size)
+    path = write_dictionary(words)
+    cache_path = path + '.cache'
+    print(f"Dictionary: {size} words; times in ms")
+    print(f"  {'engine':9} {'mode':13} {'construct':>10} {'1st check':>10} {'1st suggest':>12}")
+    try:
+        for engine in engines:
+            with contextlib.redirect_stdout(io.StringIO()):
+                # Write the cache once so the cached rows measure a warm start
+                TigrignaSpellChecker(path, engine=engine, index_cache=cache_path)
+                modes = [
+                    ('eager', {}),
+                    ('lazy', {'lazy': True}),
+                    ('cached', {'index_cache': cache_path}),
+                    ('lazy+cached', {'lazy': True, 'index_cache': cache_path}),
+                ]
+                rows = [(mode, measure(lambda: first_use(path, engine, **options), repeat=1)[1])
+                        for mode, options in modes]
+            for mode, times in rows:
+                print(f"  {engine:9} {mode:13} " + ' '.join(f"{t * 1000:10.1f}" for t in times[:2])
+                      + f" {times[2] * 1000:12.1f}")
+            os.remove(cache_path)
+    finally:
+        os.remove(path)
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:2]), *([sys.argv[2:]] if sys.argv[2:] else []))
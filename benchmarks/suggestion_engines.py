@@ -0,0 +1,57 @@
+"""
+Benchmark candidate retrieval engines of TigrignaSpellChecker.generate_suggestions
+against the linear dictionary scan on synthetic lexicons.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+
+from utils.spell_checker import TigrignaSpellChecker, SUGGESTION_ENGINES
+from benchmarks.common import synthetic_words, misspell, write_dictionary, measure
+
+
+def build_checker(path, engine):
+    """Construct a checker without the load message cluttering the report."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return TigrignaSpellChecker(path, engine=engine)
+
+
+def run(sizes=(1000, 10000), queries=50, max_distance=2):
+    rng = random.Random(1)
+    for size in sizes:
+        words = synthetic_words(size)
+        path = write_dictionary(words)
+        try:
+            query_words = [misspell(rng.choice(words), rng, rng.randint(1, max_distance)) for _ in range(queries)]
+            print(f"\nDictionary size: {size}, {queries} queries, max_distance={max_distance}")
+
+            baseline = None
+            for engine in SUGGESTION_ENGINES:
+                build_time, checker = measure(lambda: build_checker(path, engine))
+                before = checker.index.comparisons if checker.index is not None else 0
+                query_time, results = measure(
+                    lambda: [checker.generate_suggestions(q, max_distance) for q in query_words])
+                if baseline is None:
+                    baseline = (query_time, results)
+                    speedup = 1.0
+                else:
+                    speedup = baseline[0] / query_time if query_time else float('inf')
+                if checker.index is not None:
+                    comparisons = (checker.index.comparisons - before) / queries
+                else:
+                    comparisons = len(checker.word_dict)
+                same = 'yes' if results == baseline[1] else 'NO'
+                print(f"  {engine:<10} build {build_time * 1000:9.1f} ms   "
+                      f"{query_time / queries * 1000:9.3f} ms/query   "
+                      f"{comparisons:9.0f} comparisons/query   "
+                      f"speedup {speedup:7.1f}x   same results: {same}")
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (1000, 10000)
+    run(sizes)
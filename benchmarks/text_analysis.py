@@ -0,0 +1,52 @@
+"""
+Benchmark single-pass text analysis against the per-token check_text and
+get_statistics loops on a large Zipf-distributed corpus.
+"""
+
+import contextlib
+import io
+import sys
+
+from utils.spell_checker import TigrignaSpellChecker
+from benchmarks.common import DICTIONARY_PATH, zipf_corpus, measure
+
+
+def per_token_check(checker, text):
+    """check_text and get_statistics as they worked before deduplication."""
+    words = checker.tokenize_text(text)
+    result = {}
+    for word in words:
+        if word and not checker.check_word(word):
+            result[word] = checker.generate_suggestions(word)
+    words = checker.tokenize_text(text)
+    misspelled = [word for word in words if word and not checker.check_word(word)]
+    stats = {
+        'total_words': len(words),
+        'unique_words': len(set(words)),
+        'misspelled_words': len(misspelled),
+        'unique_misspelled': len(set(misspelled))
+    }
+    return result, stats
+
+
+def single_pass_check(checker, text):
+    analysis = checker.analyze_text(text)
+    return analysis.misspellings, analysis.statistics()
+
+
+def run(tokens=200000):
+    with contextlib.redirect_stdout(io.StringIO()):
+        checker = TigrignaSpellChecker(DICTIONARY_PATH, cache_size=0)
+    text = zipf_corpus(sorted(checker.word_dict), tokens)
+    print(f"Corpus: {tokens} tokens, {len(text) / 1e6:.1f} MB, dictionary of {len(checker.word_dict)} words")
+
+    old_time, old = measure(lambda: per_token_check(checker, text))
+    new_time, new = measure(lambda: single_pass_check(checker, text))
+    print(f"  per-token loops   {old_time:8.2f} s")
+    print(f"  single pass       {new_time:8.2f} s   speedup {old_time / new_time:.1f}x   "
+          f"same results: {'yes' if old == new else 'NO'}")
+    print(f"  statistics: {new[1]}")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:]))
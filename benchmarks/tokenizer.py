@@ -0,0 +1,72 @@
+"""
+Benchmark the shared single-pass tokenizer against the three tokenizers it
+replaced: tokens per second and peak memory allocated while tokenizing.
+"""
+
+import re
+import sys
+import time
+import tracemalloc
+
+from utils.tokenizer import iter_tokens, tokenize
+from benchmarks.common import synthetic_words, zipf_corpus
+
+
+def checker_two_pass(text):
+    """TigrignaSpellChecker.tokenize_text before the shared tokenizer."""
+    cleaned_text = re.sub(r'[፡።፣፤፥፧፦፨፠፟]', ' ', text)
+    words = re.split(r'\s+', cleaned_text)
+    return [word for word in words if word]
+
+
+def updater_findall_strip(text):
+    """update_dictionary.tokenize_text before the shared tokenizer."""
+    words = re.findall(r'[\u1200-\u137F\u1380-\u139F\u2D80-\u2DDF]+', text)
+    return [word.strip() for word in words if word.strip()]
+
+
+def keyboard_findall(text):
+    """TigrignaKeyboard.check_spelling before the shared tokenizer."""
+    words = re.findall(r'[\u1200-\u137F\u1380-\u139F\u2D80-\u2DDF]+', text)
+    return [word for word in words if word.strip()]
+
+
+def spans(text):
+    """Consume iter_tokens lazily, as the incremental checker does."""
+    count = 0
+    for token, start, end in iter_tokens(text):
+        count += 1
+    return count
+
+
+def profile(func, text, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(text)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func(text)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def run(tokens=500000):
+    words = synthetic_words(20000)
+    # Punctuation and Latin snippets exercise the separators
+    text = zipf_corpus(words, tokens).replace('\n', '። ') + ' word 2024 '
+    print(f"Text: {tokens} tokens, {len(text) / 1e6:.1f} M characters")
+    print(f"  {'tokenizer':36} {'Mtokens/s':>10} {'peak MB':>9} {'tokens':>8}")
+    for name, func in [('checker (sub + split)', checker_two_pass),
+                       ('update_dictionary (findall + strip)', updater_findall_strip),
+                       ('keyboard (findall + filter)', keyboard_findall),
+                       ('tokenize (single findall)', tokenize),
+                       ('iter_tokens (lazy spans)', spans)]:
+        elapsed, peak, result = profile(func, text)
+        count = result if isinstance(result, int) else len(result)
+        print(f"  {name:36} {count / elapsed / 1e6:10.2f} {peak / 1e6:9.1f} {count:8}")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:]))
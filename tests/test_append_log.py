@@ -0,0 +1,53 @@
+from utils.append_log import WordLog, read_log
+
+
+def write_dictionary(tmp_path, words=('ሰላም', 'ሰብ')):
+    path = tmp_path / 'words.txt'
+    path.write_text(''.join(f"{word}\n" for word in words), encoding='utf-8')
+    return str(path)
+
+
+def test_add_is_logged_once(tmp_path):
+    path = write_dictionary(tmp_path)
+    log = WordLog(path, 'always')
+    assert log.add('ኣለ')
+    assert not log.add('ኣለ')
+    log.close()
+    assert read_log(path) == ['ኣለ']
+
+
+def test_catch_up_reads_words_other_writers_logged(tmp_path):
+    path = write_dictionary(tmp_path)
+    first, second = WordLog(path, 'always'), WordLog(path, 'always')
+    second.add('ኣለ')
+    # The first writer has not seen the word but must not log it twice
+    first.add('ኣለ')
+    first.add('ኣለኹ')
+    assert read_log(path) == ['ኣለ', 'ኣለኹ']
+    first.close()
+    second.close()
+
+
+def test_compaction_by_another_writer_is_detected(tmp_path):
+    path = write_dictionary(tmp_path)
+    first, second = WordLog(path, 'always'), WordLog(path, 'always')
+    first.add('ab')
+    second.compact()
+    # Appended past the first writer's old offset
+    second.add('ሀሀሀሀሀሀ')
+    first.add('ለለ')
+    assert first.add('ሀሀሀሀሀ')
+    first.close()
+    second.close()
+    assert read_log(path) == ['ሀሀሀሀሀሀ', 'ለለ', 'ሀሀሀሀሀ']
+    assert 'ab' in open(path, encoding='utf-8').read().split()
+
+
+def test_compaction_merges_log_into_dictionary(tmp_path):
+    path = write_dictionary(tmp_path)
+    log = WordLog(path, 'always')
+    log.add('ኣለ')
+    assert log.compact() == 3
+    log.close()
+    assert read_log(path) == []
+    assert open(path, encoding='utf-8').read().split() == sorted(['ሰላም', 'ሰብ', 'ኣለ'])
@@ -0,0 +1,25 @@
+from utils.batch import BatchIndex
+from utils.distances import bounded_edit_distance
+from utils.fidel import fidel_edit_distance
+
+WORDS = ['ሰላም', 'ሰላማ', 'ሰለም', 'ሰብ', 'ሰባት', 'ኣለ', 'ኣለኹ', 'ሓበሬታ', 'ሀ']
+
+
+def test_lookup_matches_linear_scan():
+    index = BatchIndex(WORDS)
+    for word in ('ሰላሞ', 'ሰ', 'ኣለኹም', 'ሓበሬ'):
+        for max_distance in (1, 2):
+            expected = sorted((candidate, distance) for candidate in WORDS
+                              if (distance := bounded_edit_distance(word, candidate, max_distance)) <= max_distance)
+            assert sorted(index.lookup(word, max_distance)) == expected
+
+
+def test_added_words_are_scored_without_re_encoding():
+    index = BatchIndex(WORDS, vowel_cost=0.5, merge_size=2)
+    index.add('ሰላምታ')
+    matrix = index.matrix
+    assert ('ሰላምታ', fidel_edit_distance('ሰላምቶ', 'ሰላምታ', 0.5)) in index.lookup('ሰላምቶ', 1)
+    assert index.matrix is matrix
+    index.add('ሰላምት')
+    assert index.matrix is not matrix and index.pending == []
+    assert sorted(word for word, _ in index.lookup('ሰላምቶ', 1)) == ['ሰላም', 'ሰላምታ', 'ሰላምት']
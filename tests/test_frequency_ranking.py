@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from utils.binary_dictionary import compile_dictionary
+from utils.noisy_channel import NoisyChannelRanker
+from utils.spell_checker import TigrignaSpellChecker
+
+FREQUENCIES = {'ሰላም': 90, 'ሰላሞ': 40, 'ሰባት': 30, 'ሰብ': 1, 'ሰላማ': 2}
+
+
+@pytest.fixture
+def compiled(tmp_path):
+    path = str(tmp_path / 'words.tgdb')
+    compile_dictionary(FREQUENCIES, path)
+    return path
+
+
+@pytest.mark.parametrize('engine', ['linear', 'symspell', 'dawg'])
+def test_compiled_frequencies_rank_completions(compiled, engine):
+    checker = TigrignaSpellChecker(compiled, engine=engine)
+    assert checker.word_frequency('ሰላም') == 90
+    assert checker.complete('ሰ', 3) == ['ሰላም', 'ሰላሞ', 'ሰባት']
+
+
+@pytest.mark.parametrize('engine', ['linear', 'dawg'])
+def test_compiled_frequencies_rank_noisy_channel(compiled, engine):
+    checker = TigrignaSpellChecker(compiled, engine=engine, ranking='noisy_channel', cache_size=0)
+    # All three are one vowel slip from the typed word, so frequency decides
+    assert checker.generate_suggestions('ሰላሚ', 1, 3) == ['ሰላም', 'ሰላሞ', 'ሰላማ']
+
+
+def test_text_frequencies_rank_noisy_channel(tmp_path):
+    path = tmp_path / 'words.txt'
+    path.write_text(''.join(f"{word}\t{count}\n" for word, count in FREQUENCIES.items()), encoding='utf-8')
+    checker = TigrignaSpellChecker(str(path), ranking='noisy_channel', cache_size=0)
+    assert checker.generate_suggestions('ሰላሚ', 1, 3) == ['ሰላም', 'ሰላሞ', 'ሰላማ']
+
+
+def test_compiled_and_text_priors_agree():
+    word_ids = {word: word_id for word_id, word in enumerate(FREQUENCIES)}
+    counts = np.fromiter(FREQUENCIES.values(), dtype='<u4')
+    dense = NoisyChannelRanker.from_counts(counts, lambda word: word_ids.get(word, -1))
+    text = NoisyChannelRanker(FREQUENCIES)
+    # ሰላሚ has no count and gets the smoothing prior in both
+    candidates = ['ሰላም', 'ሰብ', 'ሰላሚ']
+    assert np.allclose(dense.scores('ሰላሜ', candidates), text.scores('ሰላሜ', candidates))
+    assert text.log_priors[-1] == pytest.approx(np.log(1 / (sum(FREQUENCIES.values()) + len(FREQUENCIES) + 1)))
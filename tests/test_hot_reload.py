@@ -0,0 +1,65 @@
+import pytest
+
+from utils import spell_checker
+from utils.append_log import WordLog
+from utils.hot_reload import HotReloader
+from utils.spell_checker import TigrignaSpellChecker
+
+WORDS = ('ሰላም', 'ሰላማ', 'ሰባት', 'ሰብ', 'ኣለ')
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    path = tmp_path / 'words.txt'
+    path.write_text(''.join(f"{word}\n" for word in WORDS), encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('engine', ['linear', 'symspell', 'bktree', 'batch', 'dawg', 'ngram'])
+def test_added_word_is_swapped_in_without_changing_the_old_snapshot(dictionary, engine):
+    reloader = HotReloader(TigrignaSpellChecker(dictionary, engine=engine, durability='always'))
+    old = reloader.checker
+    old.complete('ሰ')
+    reloader.add_to_dictionary('ሰላሞ')
+    new = reloader.checker
+    assert new is not old
+    assert new.check_word('ሰላሞ') and not old.check_word('ሰላሞ')
+    assert 'ሰላሞ' in new.generate_suggestions('ሰላሚ', 1)
+    assert 'ሰላሞ' not in old.generate_suggestions('ሰላሚ', 1)
+    # The new snapshot shares the old index and trie instead of rebuilding them
+    assert new.index is None or new.index.base is old.index
+    assert new.completions is not None and 'ሰላሞ' in new.complete('ሰላ')
+    assert 'ሰላሞ' not in old.complete('ሰላ')
+    assert len(new.word_dict) == len(old.word_dict) + 1
+
+
+def test_words_logged_by_another_process_are_picked_up(dictionary):
+    reloader = HotReloader(TigrignaSpellChecker(dictionary, engine='symspell'))
+    other = WordLog(dictionary, 'always')
+    other.add('ሰላሞ')
+    other.close()
+    reloader.poll()
+    assert reloader.checker.check_word('ሰላሞ')
+    assert reloader.reloads == 0
+
+
+def test_overlay_is_merged_once_it_is_large(dictionary, monkeypatch):
+    monkeypatch.setattr(spell_checker, 'OVERLAY_MERGE_SIZE', 3)
+    reloader = HotReloader(TigrignaSpellChecker(dictionary, engine='symspell', durability='none'))
+    first = reloader.checker
+    for word in ('ሰላሞ', 'ሰላሚ'):
+        reloader.add_to_dictionary(word)
+    assert reloader.checker.index.base is first.index
+    reloader.add_to_dictionary('ሰላሜ')
+    merged = reloader.checker
+    assert isinstance(merged.word_dict, set) and merged.index is not first.index
+    assert {'ሰላሞ', 'ሰላሚ', 'ሰላሜ'} <= set(merged.generate_suggestions('ሰላሙ', 1, 10))
+    assert not first.check_word('ሰላሜ')
+
+
+def test_reload_keeps_words_added_meanwhile(dictionary):
+    reloader = HotReloader(TigrignaSpellChecker(dictionary, engine='symspell', durability='always'))
+    reloader.add_to_dictionary('ሰላሞ')
+    reloader.reload()
+    assert reloader.checker.check_word('ሰላሞ')
+    assert reloader.reloads == 1
@@ -0,0 +1,22 @@
+import pytest
+
+pytest.importorskip('tkinter')
+
+from utils.keyboard_slips import SlipTable
+from utils.local_tigrigna_keyboard import TigrignaKeyboard
+
+
+def test_loads_frequency_annotated_dictionary(tmp_path):
+    path = tmp_path / 'words.txt'
+    path.write_text('ሰላም\t5\nሰብ\t2\nኣለ\n', encoding='utf-8')
+    dictionary = TigrignaKeyboard.load_dictionary(None, str(path))
+    assert {'ሰላም', 'ሰብ', 'ኣለ'} <= set(dictionary)
+    assert not any('\t' in word for word in dictionary)
+
+
+def test_slip_suggestions_rank_vowel_variants_first():
+    table = SlipTable(TigrignaKeyboard.KEYBOARD_LAYOUT, TigrignaKeyboard.generate_variants)
+    # ሳ is another vowel order of the ሰ key; ረ and ሸ sit next to it
+    assert table.suggestions('ሳላም', {'ሰላም', 'ረላም'}) == ['ሰላም']
+    assert table.suggestions('ረላም', {'ሰላም'}) == ['ሰላም']
+    assert table.suggestions('ሰላም', {'ቀቀቀ'}) == []
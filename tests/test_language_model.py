@@ -0,0 +1,26 @@
+from utils.spell_checker import TigrignaSpellChecker
+from utils.update_dictionary import build_language_model
+
+SENTENCES = ('ሰላም ኣለኹ ሎሚ', 'ሎሚ ኣለኹ ጽቡቕ', 'ሰላም ኣለኹ ጽቡቕ')
+
+
+def test_default_engine_flags_real_word_errors(tmp_path):
+    corpus = tmp_path / 'corpus.txt'
+    corpus.write_text(' ።\n'.join(SENTENCES * 50) + ' ።\n', encoding='utf-8')
+    dictionary = tmp_path / 'words.txt'
+    # ኣለኸ is spelled correctly but never follows ሰላም
+    dictionary.write_text('ሰላም\nኣለኹ\nኣለኸ\nሎሚ\nጽቡቕ\n', encoding='utf-8')
+    model = str(tmp_path / 'model.tglm')
+    build_language_model([str(corpus)], model, order=3, workers=1)
+    checker = TigrignaSpellChecker(str(dictionary), language_model=model, context_budget=1.0)
+    assert checker.engine == 'symspell'
+    assert checker.check_text('ሰላም ኣለኸ ሎሚ ።') == {'ኣለኸ': ['ኣለኹ']}
+    assert checker.check_text('ሰላም ኣለኹ ሎሚ ።') == {}
+
+
+def test_linear_scan_stops_at_the_deadline(tmp_path):
+    dictionary = tmp_path / 'words.txt'
+    dictionary.write_text('ሰላም\nሰላሞ\n', encoding='utf-8')
+    checker = TigrignaSpellChecker(str(dictionary))
+    assert sorted(checker.find_candidates('ሰላሚ', 1)) == [('ሰላም', 1), ('ሰላሞ', 1)]
+    assert checker.find_candidates('ሰላሚ', 1, deadline=0.0) == []
@@ -0,0 +1,37 @@
+import pytest
+
+from utils.spell_checker import TigrignaSpellChecker
+
+AFFIXES = """SFX A Y 1
+SFX A 0 ኹ .
+"""
+
+
+@pytest.fixture
+def affixed(tmp_path):
+    affix_path = tmp_path / 'words.aff'
+    affix_path.write_text(AFFIXES, encoding='utf-8')
+    dictionary = tmp_path / 'words.txt'
+    dictionary.write_text('ኣለ/A\nሰላም\n', encoding='utf-8')
+    return str(dictionary), str(affix_path)
+
+
+def test_inflected_forms_are_recognised(affixed):
+    dictionary, affix_path = affixed
+    checker = TigrignaSpellChecker(dictionary, affix_path=affix_path)
+    assert checker.check_word('ኣለኹ')
+    assert not checker.check_word('ሰላምኹ')
+
+
+@pytest.mark.parametrize('index_cache', [False, True])
+def test_reload_forgets_stems_removed_from_the_dictionary(affixed, tmp_path, index_cache):
+    dictionary, affix_path = affixed
+    cache = str(tmp_path / 'words.cache') if index_cache else None
+    checker = TigrignaSpellChecker(dictionary, affix_path=affix_path, index_cache=cache)
+    assert checker.check_word('ኣለ')
+    with open(dictionary, 'w', encoding='utf-8') as f:
+        f.write('ሰላም\n')
+    checker.load_dictionary()
+    assert not checker.check_word('ኣለ')
+    assert not checker.check_word('ኣለኹ')
+    assert checker.check_word('ሰላም')
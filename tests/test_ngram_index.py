@@ -0,0 +1,36 @@
+from utils.distances import bounded_edit_distance
+from utils.ngram_index import NGramIndex
+
+WORDS = ['ሰላም', 'ሰላማ', 'ሰለም', 'ሰብ', 'ሰባት', 'ኣለ', 'ኣለኹ', 'ሓበሬታ', 'ሀ']
+
+
+def linear(words, word, max_distance):
+    return sorted((candidate, distance) for candidate in words
+                  if (distance := bounded_edit_distance(word, candidate, max_distance)) <= max_distance)
+
+
+def test_lookup_matches_linear_scan():
+    for q in (2, 3):
+        index = NGramIndex(WORDS, q=q)
+        for word in ('ሰላሞ', 'ሰ', 'ኣለኹም', 'ሓበሬ', 'ሀሀሀሀ', ''):
+            for max_distance in (1, 2):
+                assert sorted(index.lookup(word, max_distance)) == linear(WORDS, word, max_distance)
+
+
+def test_added_words_are_found():
+    index = NGramIndex(WORDS, merge_size=2)
+    added = ['ሰላምታ', 'ሰላምት', 'ሰላምቲ']
+    for word in added:
+        index.add(word)
+    assert sorted(index.lookup('ሰላምቶ', 1)) == linear(WORDS + added, 'ሰላምቶ', 1)
+
+
+def test_lookups_never_rebuild_the_postings():
+    index = NGramIndex(WORDS, merge_size=2)
+    index.add('ሰላምታ')
+    postings = index.postings
+    assert ('ሰላምታ', 1) in index.lookup('ሰላምቶ', 1)
+    assert index.postings is postings and index.pending == ['ሰላምታ']
+    # The write that fills the pending list merges it
+    index.add('ሰላምት')
+    assert index.postings is not postings and index.pending == []
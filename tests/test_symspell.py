@@ -0,0 +1,28 @@
+from utils.distances import bounded_edit_distance
+from utils.symspell import SymSpellIndex
+
+WORDS = ['ሰላም', 'ሰላማ', 'ሰለም', 'ሰብ', 'ሰባት', 'ኣለ', 'ኣለኹ', 'ሓበሬታ']
+
+
+def linear(word, max_distance):
+    return sorted((candidate, distance) for candidate in WORDS
+                  if (distance := bounded_edit_distance(word, candidate, max_distance)) <= max_distance)
+
+
+def test_lookup_matches_linear_scan():
+    index = SymSpellIndex(WORDS)
+    for word in ('ሰላሞ', 'ሰ', 'ኣለኹም', 'ሓበሬ', 'ሀሀሀሀ'):
+        for max_distance in (1, 2):
+            assert sorted(index.lookup(word, max_distance)) == linear(word, max_distance)
+
+
+def test_custom_distance_verifies_candidates():
+    calls = []
+
+    def distance(a, b):
+        calls.append((a, b))
+        return bounded_edit_distance(a, b, 2)
+
+    index = SymSpellIndex(WORDS, distance)
+    assert ('ሰላም', 1) in index.lookup('ሰላሞ', 1)
+    assert calls
@@ -0,0 +1,354 @@
+"""
+Crash-safe append log for words added to a Tigrigna dictionary.
+Added words go to a log next to the dictionary (the ADDED_SUFFIX file)
+rather than into the dictionary itself. Each record is one word ended by a
+newline, so a record torn by a crash has no newline; readers ignore it and
+the next writer cuts it off. Words are written in group commits that share
+one write and, depending on the durability mode, one fsync. An exclusive
+lock on a file next to the dictionary serialises writers and compaction
+across processes. Compaction merges the log into the dictionary, sorted
+and deduplicated, and replaces the log with a new empty file; other
+processes notice the new inode and start reading it from the beginning.
+
+Compact a dictionary by hand with:
+    python -m utils.append_log data/tigrigna_words.txt
+"""
+
+import argparse
+import atexit
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Set
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks on this platform; only one process may write at a time
+    fcntl = None
+
+try:
+    from .binary_dictionary import (ADDED_SUFFIX, BinaryDictionary, compile_dictionary, is_binary_dictionary,
+                                    read_text_dictionary)
+except ImportError:
+    # Imported from a module run directly as a script
+    from binary_dictionary import (ADDED_SUFFIX, BinaryDictionary, compile_dictionary, is_binary_dictionary,
+                                   read_text_dictionary)
+
+# always: add() returns once its word is fsynced; batch: groups are fsynced
+# in the background; none: groups are written but left to the OS to flush
+DURABILITY_MODES = ('always', 'batch', 'none')
+
+# Lock file taken by writers and compaction
+LOCK_SUFFIX = '.lock'
+
+# Logs with words to flush at exit; weak, so dropped checkers are not kept alive
+_open_logs: 'weakref.WeakSet[WordLog]' = weakref.WeakSet()
+
+
+def _close_open_logs() -> None:
+    for log in list(_open_logs):
+        log.close()
+
+
+atexit.register(_close_open_logs)
+
+
+def parse_records(data: bytes) -> List[str]:
+    """
+    Decode complete log records, ignoring a torn record at the end.
+    
+    Args:
+        data: Raw log contents
+    
+    Returns:
+        Words of the newline-terminated records
+    """
+    end = data.rfind(b'\n') + 1
+    words = []
+    for line in data[:end].decode('utf-8', errors='replace').split('\n'):
+        word = line.strip()
+        if word:
+            words.append(word)
+    return words
+
+
+def read_log(dictionary_path: str) -> List[str]:
+    """
+    Read the words logged for a dictionary since its last compaction.
+    
+    Args:
+        dictionary_path: Path of the dictionary
+    
+    Returns:
+        Logged words in the order they were added
+    """
+    try:
+        with open(dictionary_path + ADDED_SUFFIX, 'rb') as f:
+            return parse_records(f.read())
+    except FileNotFoundError:
+        return []
+
+
+class WordLog:
+    """
+    Appends added words to a dictionary's log with group commit and
+    periodic compaction.
+    """
+
+    def __init__(self, dictionary_path: str, durability: str = 'batch', group_size: int = 256,
+                 group_delay: float = 0.05, compact_size: int = 1 << 20):
+        """
+        Prepare the log of a dictionary; files are opened on the first write.
+        
+        Args:
+            dictionary_path: Path of the text or compiled dictionary
+            durability: One of DURABILITY_MODES
+            group_size: Pending words that trigger a group commit
+            group_delay: Seconds a pending word waits for more words in batch and none modes
+            compact_size: Log size in bytes that triggers compaction, 0 disables it
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability '{durability}', expected one of {DURABILITY_MODES}")
+        self.dictionary_path = dictionary_path
+        self.log_path = dictionary_path + ADDED_SUFFIX
+        self.lock_path = dictionary_path + LOCK_SUFFIX
+        self.durability = durability
+        self.group_size = group_size
+        self.group_delay = group_delay
+        self.compact_size = compact_size
+        self.condition = threading.Condition()
+        self.pending: List[str] = []
+        # Words logged or pending, so repeated adds are dropped without reading the file
+        self.seen: Set[str] = set()
+        # Bytes of the log already read into seen
+        self.offset = 0
+        # Sequence numbers of the last added and the last written word
+        self.appended = 0
+        self.written = 0
+        self.flushing = False
+        self.timer: Optional[threading.Timer] = None
+        self.log_fd: Optional[int] = None
+        self.lock_fd: Optional[int] = None
+        self.groups = 0
+        self.records = 0
+        self.compactions = 0
+        _open_logs.add(self)
+
+    def add(self, word: str) -> bool:
+        """
+        Log a word added to the dictionary.
+        
+        Args:
+            word: The word to log
+        
+        Returns:
+            False if the word was already logged
+        """
+        with self.condition:
+            if word in self.seen:
+                return False
+            self.seen.add(word)
+            self.pending.append(word)
+            self.appended += 1
+            if self.durability == 'always' or len(self.pending) >= self.group_size:
+                self.wait_written(self.appended)
+            elif self.timer is None:
+                self.timer = threading.Timer(self.group_delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+        return True
+
+    def flush(self) -> None:
+        """Write every pending word as one group."""
+        with self.condition:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            self.wait_written(self.appended)
+
+    def wait_written(self, sequence: int) -> None:
+        """
+        Block until a word is written, committing the pending group if no
+        other thread is doing so. Threads arriving during a commit wait and
+        share the next one. The caller holds the condition.
+        
+        Args:
+            sequence: Sequence number of the word
+        """
+        while self.written < sequence:
+            if self.flushing:
+                self.condition.wait()
+                continue
+            group, upto = self.pending, self.appended
+            self.pending = []
+            self.flushing = True
+            self.condition.release()
+            try:
+                self.write_group(group)
+            except OSError as e:
+                print(f"Could not save words to the dictionary log: {str(e)}")
+                self.seen.difference_update(group)
+            finally:
+                self.condition.acquire()
+                self.flushing = False
+                self.written = upto
+                self.condition.notify_all()
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the exclusive lock shared by all processes using this dictionary."""
+        if self.lock_fd is None:
+            self.lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self.lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
+
+    def catch_up(self) -> Set[str]:
+        """
+        Read records other processes appended since the last read and cut off
+        a torn record left by a crashed writer. The caller holds the lock.
+        
+        Returns:
+            Words read
+        """
+        if self.log_fd is not None:
+            try:
+                replaced = os.stat(self.log_path).st_ino != os.fstat(self.log_fd).st_ino
+            except FileNotFoundError:
+                replaced = True
+            if replaced:
+                # Another process compacted the log; its words are in the dictionary now
+                os.close(self.log_fd)
+                self.log_fd = None
+        if self.log_fd is None:
+            self.log_fd = os.open(self.log_path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+            self.offset = 0
+        size = os.fstat(self.log_fd).st_size
+        if size == self.offset:
+            return set()
+        data = os.pread(self.log_fd, size - self.offset, self.offset)
+        complete = data.rfind(b'\n') + 1
+        if complete < len(data):
+            # Nobody else can be writing while we hold the lock
+            os.ftruncate(self.log_fd, self.offset + complete)
+        self.offset += complete
+        words = set(parse_records(data[:complete]))
+        self.seen.update(words)
+        return words
+
+    def write_group(self, group: List[str]) -> None:
+        """
+        Append a group of words to the log in one write.
+        
+        Args:
+            group: Words to append
+        """
+        with self.locked():
+            logged = self.catch_up()
+            data = ''.join(f"{word}\n" for word in group if word not in logged).encode('utf-8')
+            if data:
+                os.write(self.log_fd, data)
+                if self.durability != 'none':
+                    os.fsync(self.log_fd)
+                self.offset += len(data)
+                self.groups += 1
+                self.records += data.count(b'\n')
+            if self.compact_size and self.offset >= self.compact_size:
+                self.compact_locked()
+
+    def compact(self) -> int:
+        """
+        Write pending words, then merge the log into the dictionary.
+        
+        Returns:
+            Number of words in the compacted dictionary
+        """
+        self.flush()
+        with self.condition, self.locked():
+            return self.compact_locked()
+
+    def compact_locked(self) -> int:
+        """
+        Merge the log into the dictionary and empty the log. The caller
+        holds the lock.
+        
+        Returns:
+            Number of words in the compacted dictionary
+        """
+        self.catch_up()
+        logged = read_log(self.dictionary_path)
+        if is_binary_dictionary(self.dictionary_path):
+            dictionary = BinaryDictionary(self.dictionary_path)
+            frequencies = {word: dictionary.frequency(word) for word in dictionary}
+            max_distance = dictionary.max_distance
+            dictionary.close()
+            for word in logged:
+                frequencies.setdefault(word, 0)
+            count = compile_dictionary(frequencies, self.dictionary_path, max_distance)
+        else:
+            frequencies = read_text_dictionary(self.dictionary_path) if os.path.exists(self.dictionary_path) else {}
+            for word in logged:
+                frequencies.setdefault(word, 0)
+            temporary = f"{self.dictionary_path}.tmp{os.getpid()}"
+            with open(temporary, 'w', encoding='utf-8') as f:
+                for word in sorted(frequencies):
+                    frequency = frequencies[word]
+                    f.write(f"{word}\t{frequency}\n" if frequency else f"{word}\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, self.dictionary_path)
+            count = len(frequencies)
+        # A crash before this point leaves words in both files, which the
+        # next compaction deduplicates. The log is replaced, not truncated,
+        # so readers holding the old one see a new inode rather than a
+        # size they could mistake for their offset.
+        temporary = f"{self.log_path}.tmp{os.getpid()}"
+        fd = os.open(temporary, os.O_RDWR | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+        os.fsync(fd)
+        os.replace(temporary, self.log_path)
+        os.close(self.log_fd)
+        self.log_fd = fd
+        self.offset = 0
+        self.compactions += 1
+        return count
+
+    def close(self) -> None:
+        """Write pending words and release the files."""
+        self.flush()
+        with self.condition:
+            for fd in (self.log_fd, self.lock_fd):
+                if fd is not None:
+                    os.close(fd)
+            self.log_fd = self.lock_fd = None
+        _open_logs.discard(self)
+
+    def stats(self) -> dict:
+        """
+        Get the log counters.
+        
+        Returns:
+            Dictionary with the number of group commits, records written and compactions
+        """
+        return {'groups': self.groups, 'records': self.records, 'compactions': self.compactions}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge the append log of a dictionary into the dictionary.")
+    parser.add_argument('dictionary', help="text or compiled dictionary")
+    args = parser.parse_args()
+
+    log = WordLog(args.dictionary)
+    pending = len(read_log(args.dictionary))
+    count = log.compact()
+    log.close()
+    print(f"Compacted {pending} logged words; {args.dictionary} now holds {count} words")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Asynchronous, cancellable front end to TigrignaSpellChecker for interactive UIs.
+Requests are debounced per input field and run in a worker executor, so the
+UI thread never blocks on suggestion generation, and a request superseded
+by newer input for the same field is dropped instead of computed.
+
+In Jupyter, ipywidgets callbacks run on the kernel's event loop and can
+schedule ``service.suggest(...)`` with ``asyncio.ensure_future``. Tk has no
+event loop of its own, so ``start()`` runs one in a background thread and
+``submit()`` returns a concurrent.futures.Future that can be polled with
+``root.after``.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+
+class SuggestionService:
+    """
+    Debounces, cancels and offloads spell-check work for one checker.
+    """
+
+    def __init__(self, checker, debounce: float = 0.15, max_workers: int = 1,
+                 executor: Optional[concurrent.futures.Executor] = None):
+        """
+        Wrap a checker.
+        
+        Args:
+            checker: A TigrignaSpellChecker
+            debounce: Seconds a request waits for newer input before running
+            max_workers: Worker threads when no executor is given
+            executor: Executor that runs the checker calls
+        """
+        self.checker = checker
+        self.debounce = debounce
+        self.executor = executor or concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='tigrigna-suggest')
+        # Newest request number per input field
+        self.latest: Dict[Hashable, int] = {}
+        self.counter = 0
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+        # Seconds between a request leaving the debounce and starting in a worker
+        self.queue_latencies: Deque[float] = deque(maxlen=1000)
+        self.requests = 0
+        self.cancelled = 0
+        self.discarded = 0
+        self.completed = 0
+
+    async def run(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Optional[Any]:
+        """
+        Debounce a call for an input field and run it in the executor.
+        
+        Args:
+            key: Identifies the input field; a newer request with the same key
+                supersedes this one
+            func: Checker method to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            The result, or None if the request was superseded
+        """
+        with self.lock:
+            self.counter += 1
+            request = self.counter
+            self.latest[key] = request
+            self.requests += 1
+
+        if self.debounce > 0:
+            await asyncio.sleep(self.debounce)
+        if self.latest.get(key) != request:
+            with self.lock:
+                self.cancelled += 1
+            return None
+
+        queued = time.perf_counter()
+
+        def work():
+            self.queue_latencies.append(time.perf_counter() - queued)
+            # Skip work that became stale while waiting for a worker
+            if self.latest.get(key) != request:
+                return None, False
+            return func(*args, **kwargs), True
+
+        result, ran = await asyncio.get_running_loop().run_in_executor(self.executor, work)
+        with self.lock:
+            if not ran:
+                self.cancelled += 1
+                return None
+            if self.latest.get(key) != request:
+                # Finished, but newer input already arrived
+                self.discarded += 1
+                return None
+            self.completed += 1
+        return result
+
+    async def suggest(self, word: str, key: Hashable = 'default', max_distance: int = 2,
+                      max_suggestions: int = 5) -> Optional[List[str]]:
+        """
+        Get suggestions for a word without blocking the event loop.
+        
+        Args:
+            word: The word to correct
+            key: Identifies the input field
+            max_distance: Maximum edit distance for suggestions
+            max_suggestions: Maximum number of suggestions to return
+            
+        Returns:
+            List of suggestions, or None if superseded by newer input
+        """
+        return await self.run(key, self.checker.generate_suggestions, word, max_distance, max_suggestions)
+
+    async def check_text(self, text: str, key: Hashable = 'default') -> Optional[Dict[str, List[str]]]:
+        """
+        Check a text without blocking the event loop.
+        
+        Args:
+            text: The Tigrigna text to check
+            key: Identifies the input field
+            
+        Returns:
+            Dictionary mapping misspelled words to suggestions, or None if superseded
+        """
+        return await self.run(key, self.checker.check_text, text)
+
+    async def complete(self, prefix: str, key: Hashable = 'default', k: int = 10) -> Optional[List[str]]:
+        """
+        Get autocomplete suggestions without blocking the event loop.
+        
+        Args:
+            prefix: The beginning of a word
+            key: Identifies the input field
+            k: Maximum number of completions
+            
+        Returns:
+            List of completions, or None if superseded
+        """
+        return await self.run(key, self.checker.complete, prefix, k)
+
+    def start(self) -> None:
+        """Run an event loop in a background thread for callers without one, such as Tk."""
+        if self.thread is not None:
+            return
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='tigrigna-service', daemon=True)
+        self.thread.start()
+
+    def submit(self, coroutine) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine of this service on the background loop.
+        
+        Args:
+            coroutine: For example ``service.suggest(word, key='editor')``
+            
+        Returns:
+            A future that resolves to the coroutine's result
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def stop(self) -> None:
+        """Stop the background loop and the executor."""
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+            self.loop = self.thread = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get request counters and queue latency.
+        
+        Returns:
+            Dictionary with requests, cancelled, discarded and completed
+            counts and the p50/p99 queue latency in milliseconds
+        """
+        latencies = sorted(self.queue_latencies)
+
+        def percentile(fraction):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+        return {
+            'requests': self.requests,
+            'cancelled': self.cancelled,
+            'discarded': self.discarded,
+            'completed': self.completed,
+            'queue_latency_p50_ms': percentile(0.5),
+            'queue_latency_p99_ms': percentile(0.99),
+        }
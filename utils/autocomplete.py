@@ -0,0 +1,161 @@
+"""
+Frequency-ranked autocomplete for Tigrigna words.
+A trie over the sorted dictionary stores, for every node, the best
+completions below it, so a query only walks the prefix and reads a short
+precomputed list no matter how many words share the prefix.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+
+class CompletionTrie:
+    """
+    A read-only trie in flat arrays with the top-k completions cached per node.
+    Words added after construction are kept in a small overlay.
+    """
+
+    def __init__(self, frequencies: Dict[str, int], top_k: int = 10):
+        """
+        Build the trie.
+        
+        Args:
+            frequencies: Dictionary mapping each word to its corpus frequency
+            top_k: Number of completions cached per node
+        """
+        self.top_k = top_k
+        self.words: List[str] = sorted(frequencies)
+        self.frequencies = frequencies
+        self.added: Dict[str, int] = {}
+        # rank[word_id] orders words by frequency, then length, then alphabet
+        by_rank = sorted(range(len(self.words)),
+                         key=lambda i: (-frequencies[self.words[i]], len(self.words[i]), self.words[i]))
+        self.rank = array('I', bytes(4 * len(self.words)))
+        for position, word_id in enumerate(by_rank):
+            self.rank[word_id] = position
+        self.build()
+
+    def build(self) -> None:
+        """
+        Build the trie in one pass over the sorted words. Nodes are numbered
+        in preorder; a node's edges and top completions are written out when
+        its subtree is finished.
+        """
+        self.edge_first = array('I')
+        self.edge_count = array('I')
+        self.top_first = array('I')
+        self.top_count = array('I')
+        self.labels = array('I')
+        self.targets = array('I')
+        self.top_ids = array('I')
+
+        def new_node() -> int:
+            for column in (self.edge_first, self.edge_count, self.top_first, self.top_count):
+                column.append(0)
+            return len(self.edge_first) - 1
+
+        rank = self.rank
+        top_k = self.top_k
+
+        def close(entry) -> List[int]:
+            """Write out a finished node and return its top completions."""
+            node, children, candidates = entry
+            self.edge_first[node] = len(self.labels)
+            self.edge_count[node] = len(children)
+            for code, child in children:
+                self.labels.append(code)
+                self.targets.append(child)
+            best = sorted(candidates, key=rank.__getitem__)[:top_k]
+            self.top_first[node] = len(self.top_ids)
+            self.top_count[node] = len(best)
+            self.top_ids.extend(best)
+            return best
+
+        # Open path from the root: [node, [(label, child)], candidate word ids]
+        path = [[new_node(), [], []]]
+        previous = ''
+        for word_id, word in enumerate(self.words):
+            common = 0
+            for a, b in zip(word, previous):
+                if a != b:
+                    break
+                common += 1
+            while len(path) > common + 1:
+                best = close(path.pop())
+                path[-1][2].extend(best)
+            for char in word[common:]:
+                child = new_node()
+                path[-1][1].append((ord(char), child))
+                path.append([child, [], []])
+            path[-1][2].append(word_id)
+            previous = word
+        while len(path) > 1:
+            best = close(path.pop())
+            path[-1][2].extend(best)
+        close(path.pop())
+
+    def __len__(self) -> int:
+        return len(self.words) + len(self.added)
+
+    def add(self, word: str, frequency: int = 0) -> None:
+        """
+        Add a word to the overlay.
+        
+        Args:
+            word: The word to add
+            frequency: Its corpus frequency
+        """
+        if word not in self.frequencies:
+            self.added[word] = frequency
+
+    def walk(self, prefix: str) -> Optional[int]:
+        """
+        Follow a prefix from the root.
+        
+        Args:
+            prefix: Characters to follow
+            
+        Returns:
+            The node reached, or None if no word has this prefix
+        """
+        node = 0
+        for char in prefix:
+            start = self.edge_first[node]
+            end = start + self.edge_count[node]
+            code = ord(char)
+            position = bisect_left(self.labels, code, start, end)
+            if position == end or self.labels[position] != code:
+                return None
+            node = self.targets[position]
+        return node
+
+    def complete(self, prefix: str, k: int = 10) -> List[str]:
+        """
+        Get the most frequent words starting with a prefix.
+        
+        Args:
+            prefix: The prefix typed so far
+            k: Maximum number of completions
+            
+        Returns:
+            Words ordered by frequency, then length, then alphabetically
+        """
+        results: List[Tuple[tuple, str]] = []
+        node = self.walk(prefix)
+        if node is not None:
+            first = self.top_first[node]
+            if k <= self.top_k:
+                ids = self.top_ids[first:first + min(k, self.top_count[node])]
+            else:
+                # Beyond the cached lists: the subtree is a contiguous run of sorted words
+                start = bisect_left(self.words, prefix)
+                end = bisect_left(self.words, prefix + chr(0x10FFFF), start)
+                ids = sorted(range(start, end), key=self.rank.__getitem__)[:k]
+            results = [((-self.frequencies[self.words[i]], len(self.words[i]), self.words[i]), self.words[i])
+                       for i in ids]
+        if self.added:
+            results.extend(((-frequency, len(word), word), word)
+                           for word, frequency in self.added.items() if word.startswith(prefix))
+            results.sort()
+        return [word for _, word in results[:k]]
@@ -0,0 +1,118 @@
+"""
+Vectorised batch edit distance over a whole Tigrigna lexicon.
+The dictionary is encoded once into a padded integer matrix, sorted by word
+length, so a query only scores the rows whose length can possibly match.
+"""
+
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from .fidel import encode_word, encode_words, batch_edit_distance
+
+
+class BatchIndex:
+    """
+    A NumPy-encoded lexicon answering distance queries with one vectorised
+    DP over all dictionary words of a compatible length.
+    """
+
+    # Any search radius can be answered
+    max_distance = float('inf')
+
+    def __init__(self, words: Iterable[str], vowel_cost: float = 1, merge_size: int = 1024):
+        """
+        Encode a collection of words.
+        
+        Args:
+            words: Dictionary words to encode
+            vowel_cost: Cost of a vowel-only change; 1 gives Levenshtein distance
+            merge_size: Number of added words scored apart from the matrix
+                before it is re-encoded
+        """
+        self.vowel_cost = vowel_cost
+        self.merge_size = merge_size
+        self.words: List[str] = sorted(set(words), key=lambda w: (len(w), w))
+        # Added words, scored on their own until the next re-encoding
+        self.pending: List[str] = []
+        # Distance evaluations made by lookups, for measuring pruning
+        self.comparisons = 0
+        self.encode()
+
+    def __len__(self) -> int:
+        return len(self.words) + len(self.pending)
+
+    def encode(self) -> None:
+        """Encode the word list and the pending words into the matrix, length vector and length offsets."""
+        words = self.words
+        if self.pending:
+            words = sorted(set(words).union(self.pending), key=lambda w: (len(w), w))
+        matrix, lengths = encode_words(words)
+        # offsets[n] is the first row holding a word longer than n - 1
+        longest = int(lengths[-1]) if len(words) else 0
+        offsets = np.searchsorted(lengths, np.arange(longest + 2), side='left')
+        self.words, self.matrix, self.lengths, self.offsets = words, matrix, lengths, offsets
+        self.pending = []
+
+    def add(self, word: str) -> None:
+        """
+        Add a word; the matrix is re-encoded here once merge_size words are
+        pending, never by a lookup.
+        
+        Args:
+            word: The word to add
+        """
+        self.pending.append(word)
+        if len(self.pending) >= self.merge_size:
+            self.encode()
+
+    def row_range(self, length: int, max_distance: float) -> Tuple[int, int]:
+        """
+        Rows whose word length is within ``max_distance`` of a length.
+        
+        Args:
+            length: Length of the query word
+            max_distance: Maximum edit distance
+            
+        Returns:
+            Tuple of (first row, end row)
+        """
+        longest = len(self.offsets) - 2
+        low = max(0, length - int(max_distance))
+        high = min(longest, length + int(max_distance))
+        if low > high:
+            return 0, 0
+        return int(self.offsets[low]), int(self.offsets[high + 1])
+
+    def lookup(self, word: str, max_distance: float) -> List[Tuple[str, float]]:
+        """
+        Find all words within ``max_distance`` of a word.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum edit distance
+            
+        Returns:
+            Unordered list of (word, distance) pairs
+        """
+        query = encode_word(word)
+        results = []
+        start, end = self.row_range(len(word), max_distance)
+        if start < end:
+            # Rows are sorted by length, so nothing past this column is ever read
+            width = min(self.matrix.shape[1], len(word) + int(max_distance))
+            distances = batch_edit_distance(query, self.matrix[start:end, :width],
+                                            self.lengths[start:end], self.vowel_cost)
+            self.comparisons += end - start
+            matches = np.flatnonzero(distances <= max_distance)
+            results = [(self.words[start + row], distance)
+                       for row, distance in zip(matches.tolist(), distances[matches].tolist())]
+
+        pending = [candidate for candidate in self.pending if abs(len(candidate) - len(word)) <= max_distance]
+        if pending:
+            matrix, lengths = encode_words(pending)
+            distances = batch_edit_distance(query, matrix, lengths, self.vowel_cost)
+            self.comparisons += len(pending)
+            results.extend((candidate, distance) for candidate, distance in zip(pending, distances.tolist())
+                           if distance <= max_distance)
+        return results
@@ -0,0 +1,373 @@
+"""
+Compiled binary Tigrigna dictionary with memory-mapped loading.
+A compiled file holds a sorted UTF-8 string table with offsets, word
+frequencies, an open-addressing membership hash table and a prebuilt
+symmetric-deletion suggestion index. Opening it
+maps the file into memory without parsing, and lookups read the mapped
+arrays directly instead of building a Python set of every word.
+
+Convert a text dictionary with:
+    python -m utils.binary_dictionary data/tigrigna_words.txt data/tigrigna_words.tgdb
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    from .distances import bounded_edit_distance
+    from .symspell import SymSpellIndex
+except ImportError:
+    # Imported from a module run directly as a script
+    from distances import bounded_edit_distance
+    from symspell import SymSpellIndex
+
+MAGIC = b'TGDB'
+FORMAT_VERSION = 1
+
+# Words added after compiling are appended to this text file next to the dictionary
+ADDED_SUFFIX = '.added.txt'
+
+# magic, version, word count, index max distance, delete hash count, postings count,
+# membership slot count, then the byte offsets of the seven sections
+HEADER = struct.Struct('<4sIIIQQQ7Q')
+SECTIONS = ('offsets', 'frequencies', 'strings', 'slots', 'hashes', 'starts', 'postings')
+
+
+def delete_hash(variant: str) -> int:
+    """
+    Hash a deletion variant to 64 bits, stable across processes.
+    
+    Args:
+        variant: A deletion variant of a word
+        
+    Returns:
+        Unsigned 64-bit hash
+    """
+    return int.from_bytes(hashlib.blake2b(variant.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def slot_count(word_count: int) -> int:
+    """Size of the membership hash table: a power of two at least twice the word count."""
+    size = 8
+    while size < 2 * word_count:
+        size *= 2
+    return size
+
+
+def is_binary_dictionary(path: str) -> bool:
+    """
+    Check whether a file is a compiled dictionary.
+    
+    Args:
+        path: Path to a dictionary file
+        
+    Returns:
+        True if the file starts with the compiled dictionary magic bytes
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def read_text_dictionary(path: str) -> Dict[str, int]:
+    """
+    Read a text dictionary with optional tab-separated word counts.
+    
+    Args:
+        path: Path to the text dictionary
+        
+    Returns:
+        Dictionary mapping each word to its count, 0 when absent
+    """
+    frequencies = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            word, _, count = line.strip().partition('\t')
+            if word:
+                frequencies[word] = max(frequencies.get(word, 0), int(count) if count.isdigit() else 0)
+    return frequencies
+
+
+def compile_dictionary(frequencies: Dict[str, int], output_path: str, max_distance: int = 2) -> int:
+    """
+    Write words and frequencies to a compiled dictionary file.
+    
+    Args:
+        frequencies: Dictionary mapping each word to its count
+        output_path: Path of the compiled file
+        max_distance: Largest edit distance the suggestion index answers
+        
+    Returns:
+        Number of words written
+    """
+    encoded = sorted((word.encode('utf-8'), word) for word in frequencies)
+    offsets = np.zeros(len(encoded) + 1, dtype='<u4')
+    offsets[1:] = np.cumsum([len(key) for key, _ in encoded])
+    counts = np.array([min(frequencies[word], 0xFFFFFFFF) for _, word in encoded], dtype='<u4')
+
+    # Open-addressing membership table of word id + 1, 0 marking an empty slot
+    slots = np.zeros(slot_count(len(encoded)), dtype='<u4')
+    mask = len(slots) - 1
+    for word_id, (key, _) in enumerate(encoded):
+        slot = zlib.crc32(key) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = word_id + 1
+
+    # Deletion index: sorted variant hashes, each with a run of word ids
+    hash_list: List[int] = []
+    id_list: List[int] = []
+    for word_id, (_, word) in enumerate(encoded):
+        for variant in SymSpellIndex.generate_deletes(word, max_distance):
+            hash_list.append(delete_hash(variant))
+            id_list.append(word_id)
+    hashes = np.array(hash_list, dtype='<u8')
+    ids = np.array(id_list, dtype='<u4')
+    order = np.argsort(hashes, kind='stable')
+    hashes, ids = hashes[order], ids[order]
+    unique_hashes, starts = np.unique(hashes, return_index=True)
+    starts = np.append(starts, len(ids)).astype('<u4')
+
+    sections = [offsets.tobytes(), counts.tobytes(), b''.join(key for key, _ in encoded), slots.tobytes(),
+                unique_hashes.astype('<u8').tobytes(), starts.tobytes(), ids.tobytes()]
+    positions = []
+    position = HEADER.size
+    for data in sections:
+        position += -position % 8
+        positions.append(position)
+        position += len(data)
+
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded), max_distance,
+                            len(unique_hashes), len(ids), len(slots), *positions))
+        for data, section_position in zip(sections, positions):
+            f.write(b'\0' * (section_position - f.tell()))
+            f.write(data)
+    os.replace(temp_path, output_path)
+    return len(encoded)
+
+
+class BinaryDictionary:
+    """
+    A read-only, memory-mapped compiled dictionary that behaves like a set of
+    words. Words added at runtime are kept in a small in-memory overlay.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a compiled dictionary file.
+        
+        Args:
+            path: Path to the compiled dictionary
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        fields = HEADER.unpack_from(self.mmap)
+        magic, version, self.word_count, self.max_distance, hash_count, postings_count, slot_total = fields[:7]
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} compiled dictionary")
+        position = dict(zip(SECTIONS, fields[7:]))
+        buffer = memoryview(self.mmap)
+        n = self.word_count
+        self.offsets = buffer[position['offsets']:position['offsets'] + 4 * (n + 1)].cast('I')
+        self.frequencies = buffer[position['frequencies']:position['frequencies'] + 4 * n].cast('I')
+        self.strings = buffer[position['strings']:position['strings'] + self.offsets[n]]
+        self.slots = buffer[position['slots']:position['slots'] + 4 * slot_total].cast('I')
+        self.slot_mask = slot_total - 1
+        self.hashes = np.frombuffer(self.mmap, dtype='<u8', count=hash_count, offset=position['hashes'])
+        self.starts = np.frombuffer(self.mmap, dtype='<u4', count=hash_count + 1, offset=position['starts'])
+        self.postings = np.frombuffer(self.mmap, dtype='<u4', count=postings_count, offset=position['postings'])
+        self.added: Set[str] = set()
+        self.load_added_words()
+
+    def load_added_words(self) -> None:
+        """Load words added since compiling from the text file next to the dictionary."""
+        try:
+            with open(self.path + ADDED_SUFFIX, 'r', encoding='utf-8') as f:
+                for line in f:
+                    word = line.split('\t', 1)[0].strip()
+                    # A last line without a newline is a torn append-log record
+                    if word and line.endswith('\n'):
+                        self.add(word)
+        except FileNotFoundError:
+            pass
+
+    def __len__(self) -> int:
+        return self.word_count + len(self.added)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.added or self.find(word) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for word_id in range(self.word_count):
+            yield self.word(word_id)
+        yield from self.added
+
+    def word(self, word_id: int) -> str:
+        """
+        Decode the word with a given id.
+        
+        Args:
+            word_id: Position of the word in the sorted string table
+            
+        Returns:
+            The word
+        """
+        return bytes(self.strings[self.offsets[word_id]:self.offsets[word_id + 1]]).decode('utf-8')
+
+    def find(self, word: str) -> int:
+        """
+        Look a word up in the membership hash table.
+        
+        Args:
+            word: The word to find
+            
+        Returns:
+            The word id, or -1 if the word is not in the compiled table
+        """
+        key = word.encode('utf-8')
+        offsets, strings, slots, mask = self.offsets, self.strings, self.slots, self.slot_mask
+        slot = zlib.crc32(key) & mask
+        while True:
+            entry = slots[slot]
+            if not entry:
+                return -1
+            if strings[offsets[entry - 1]:offsets[entry]] == key:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def frequency(self, word: str) -> int:
+        """
+        Get the stored corpus frequency of a word.
+        
+        Args:
+            word: The word to look up
+            
+        Returns:
+            The frequency, 0 for unknown or runtime-added words
+        """
+        word_id = self.find(word)
+        return self.frequencies[word_id] if word_id >= 0 else 0
+
+    def add(self, word: str) -> None:
+        """
+        Add a word to the in-memory overlay; callers persist it to the
+        ADDED_SUFFIX file through utils.append_log.
+        
+        Args:
+            word: The word to add
+        """
+        if word not in self:
+            self.added.add(word)
+
+    def candidate_ids(self, word: str, max_distance: int) -> np.ndarray:
+        """
+        Find ids of compiled words sharing a deletion variant with a word.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum edit distance
+            
+        Returns:
+            Array of unique word ids, a superset of the matches
+        """
+        variant_hashes = np.array([delete_hash(variant)
+                                   for variant in SymSpellIndex.generate_deletes(word, max_distance)],
+                                  dtype='<u8')
+        slots = np.searchsorted(self.hashes, variant_hashes)
+        found = slots < len(self.hashes)
+        found[found] = self.hashes[slots[found]] == variant_hashes[found]
+        slots = slots[found]
+        runs = [self.postings[self.starts[slot]:self.starts[slot + 1]] for slot in slots.tolist()]
+        return np.unique(np.concatenate(runs)) if runs else np.empty(0, dtype='<u4')
+
+    def suggestion_index(self, distance: Optional[Callable[[str, str], float]] = None) -> 'BinarySuggestionIndex':
+        """
+        Get a suggestion index backed by the prebuilt deletion index.
+        
+        Args:
+            distance: Function used to verify candidates, defaults to Levenshtein distance
+            
+        Returns:
+            Index with the same lookup interface as SymSpellIndex
+        """
+        return BinarySuggestionIndex(self, distance)
+
+    def close(self) -> None:
+        """Release the memory map."""
+        for view in (self.offsets, self.frequencies, self.strings, self.slots):
+            view.release()
+        self.hashes = self.starts = self.postings = None
+        self.mmap.close()
+
+
+class BinarySuggestionIndex:
+    """
+    Suggestion lookups over a compiled dictionary's deletion index.
+    """
+
+    def __init__(self, dictionary: BinaryDictionary, distance: Optional[Callable[[str, str], float]] = None):
+        self.dictionary = dictionary
+        self.distance = distance
+        self.max_distance = dictionary.max_distance
+        # Distance evaluations made by lookups, for measuring pruning
+        self.comparisons = 0
+
+    def add(self, word: str) -> None:
+        self.dictionary.add(word)
+
+    def lookup(self, word: str, max_distance: int) -> List[Tuple[str, float]]:
+        """
+        Find all words within ``max_distance`` of a word.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum edit distance, at most the index's max_distance
+            
+        Returns:
+            Unordered list of (word, distance) pairs
+        """
+        if max_distance > self.max_distance:
+            raise ValueError(f"Index was built for max_distance={self.max_distance}, got {max_distance}")
+        candidates = [self.dictionary.word(word_id)
+                      for word_id in self.dictionary.candidate_ids(word, max_distance).tolist()]
+        candidates.extend(self.dictionary.added)
+
+        results = []
+        for candidate in candidates:
+            if abs(len(candidate) - len(word)) > max_distance:
+                continue
+            if self.distance is None:
+                distance = bounded_edit_distance(word, candidate, int(max_distance))
+            else:
+                distance = self.distance(word, candidate)
+            self.comparisons += 1
+            if distance <= max_distance:
+                results.append((candidate, distance))
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a text dictionary into the binary format.")
+    parser.add_argument('input', help="text dictionary, one word per line with an optional tab and count")
+    parser.add_argument('output', help="path of the compiled dictionary")
+    parser.add_argument('--max-distance', type=int, default=2, help="edit distance of the suggestion index")
+    args = parser.parse_args()
+
+    written = compile_dictionary(read_text_dictionary(args.input), args.output, args.max_distance)
+    print(f"Compiled {written} words into {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Burkhard-Keller tree for Tigrigna word suggestions.
+Words are arranged by their distance to each node, so the triangle inequality
+lets a search skip every subtree that cannot contain a close enough word.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class BKTree:
+    """
+    A metric tree over dictionary words with a pluggable distance function.
+    """
+
+    # Unlike the deletion index, the tree can answer any search radius
+    max_distance = float('inf')
+
+    def __init__(self, words: Iterable[str], distance: Callable[[str, str], float]):
+        """
+        Build the tree for a collection of words.
+        
+        Args:
+            words: Dictionary words to index
+            distance: Metric used to arrange and search the tree
+        """
+        self.distance = distance
+        self.root: Optional[Tuple[str, Dict[float, tuple]]] = None
+        self.size = 0
+        # Distance evaluations made by lookups, for measuring pruning
+        self.comparisons = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, word: str) -> None:
+        """
+        Insert a word into the tree.
+        
+        Args:
+            word: The word to add
+        """
+        if self.root is None:
+            self.root = (word, {})
+            self.size = 1
+            return
+
+        node_word, children = self.root
+        while True:
+            distance = self.distance(word, node_word)
+            if distance == 0:
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (word, {})
+                self.size += 1
+                return
+            node_word, children = child
+
+    def lookup(self, word: str, max_distance: float) -> List[Tuple[str, float]]:
+        """
+        Find all words in the tree within ``max_distance`` of a word.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum distance
+            
+        Returns:
+            Unordered list of (word, distance) pairs
+        """
+        if self.root is None:
+            return []
+
+        results = []
+        stack = [self.root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = self.distance(word, node_word)
+            self.comparisons += 1
+            if distance <= max_distance:
+                results.append((node_word, distance))
+            low, high = distance - max_distance, distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+        return results
@@ -0,0 +1,321 @@
+"""
+Minimal acyclic word graph (DAWG) for Tigrigna words.
+Words share both prefixes and suffixes, which suits a heavily inflected
+language. One structure answers membership, prefix enumeration for
+autocomplete and fuzzy lookups by walking a Levenshtein automaton over the
+graph.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class _BuildNode:
+    """Mutable node used only while constructing the graph."""
+
+    __slots__ = ('edges', 'final', 'number')
+
+    def __init__(self):
+        self.edges: Dict[str, '_BuildNode'] = {}
+        self.final = False
+        self.number = -1
+
+    def signature(self) -> tuple:
+        return (self.final, tuple((char, id(child)) for char, child in sorted(self.edges.items())))
+
+
+class DAWG:
+    """
+    A minimised, read-only word graph stored in flat arrays. Words added after
+    construction are kept in a small overlay set.
+    """
+
+    # Any search radius can be answered
+    max_distance = float('inf')
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Build the minimal graph for a collection of words.
+        
+        Args:
+            words: Dictionary words; duplicates are ignored
+        """
+        self.word_count = 0
+        self.added: Set[str] = set()
+        # Trie nodes visited by lookups, for measuring pruning
+        self.comparisons = 0
+        self.build(sorted(set(words)))
+
+    def build(self, words: List[str]) -> None:
+        """
+        Construct the graph with the incremental algorithm for sorted input
+        (Daciuk et al.), then flatten it into arrays.
+        
+        Args:
+            words: Sorted, unique words
+        """
+        root = _BuildNode()
+        register: Dict[tuple, _BuildNode] = {}
+        # Path of (parent, char, child) for the previous word not yet minimised
+        unchecked: List[Tuple[_BuildNode, str, _BuildNode]] = []
+        previous = ''
+
+        def minimise(down_to: int) -> None:
+            while len(unchecked) > down_to:
+                parent, char, child = unchecked.pop()
+                signature = child.signature()
+                existing = register.get(signature)
+                if existing is not None:
+                    parent.edges[char] = existing
+                else:
+                    register[signature] = child
+
+        for word in words:
+            common = 0
+            for a, b in zip(word, previous):
+                if a != b:
+                    break
+                common += 1
+            minimise(common)
+            node = unchecked[-1][2] if unchecked else root
+            for char in word[common:]:
+                child = _BuildNode()
+                node.edges[char] = child
+                unchecked.append((node, char, child))
+                node = child
+            node.final = True
+            previous = word
+        minimise(0)
+        self.word_count = len(words)
+        self.flatten(root)
+
+    def flatten(self, root: _BuildNode) -> None:
+        """
+        Store the graph as arrays: per node an edge range and a final flag,
+        per edge a label code point and a target node, labels sorted per node.
+        
+        Args:
+            root: Root of the built graph
+        """
+        order: List[_BuildNode] = []
+        seen = {id(root)}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            for _, child in sorted(node.edges.items(), reverse=True):
+                if id(child) not in seen:
+                    seen.add(id(child))
+                    stack.append(child)
+        for number, node in enumerate(order):
+            node.number = number
+
+        self.edge_start = array('I', [0])
+        self.labels = array('I')
+        self.targets = array('I')
+        self.final = bytearray(len(order))
+        for node in order:
+            for char, child in sorted(node.edges.items()):
+                self.labels.append(ord(char))
+                self.targets.append(child.number)
+            self.edge_start.append(len(self.labels))
+            self.final[node.number] = node.final
+
+    @property
+    def node_count(self) -> int:
+        return len(self.final)
+
+    def __len__(self) -> int:
+        return self.word_count + len(self.added)
+
+    def __contains__(self, word: str) -> bool:
+        node = self.walk(word)
+        return (node is not None and self.final[node] == 1) or word in self.added
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.iter_from(0, '')
+        yield from self.added
+
+    def add(self, word: str) -> None:
+        """
+        Add a word to the overlay set.
+        
+        Args:
+            word: The word to add
+        """
+        if word not in self:
+            self.added.add(word)
+
+    def child(self, node: int, char: str) -> Optional[int]:
+        """
+        Follow the edge labelled ``char`` out of a node.
+        
+        Args:
+            node: Node number
+            char: Edge label
+            
+        Returns:
+            The target node, or None if there is no such edge
+        """
+        start, end = self.edge_start[node], self.edge_start[node + 1]
+        code = ord(char)
+        position = bisect_left(self.labels, code, start, end)
+        if position < end and self.labels[position] == code:
+            return self.targets[position]
+        return None
+
+    def walk(self, prefix: str) -> Optional[int]:
+        """
+        Follow a prefix from the root.
+        
+        Args:
+            prefix: Characters to follow
+            
+        Returns:
+            The node reached, or None if the prefix leaves the graph
+        """
+        node = 0
+        for char in prefix:
+            node = self.child(node, char)
+            if node is None:
+                return None
+        return node
+
+    def iter_from(self, node: int, prefix: str) -> Iterator[str]:
+        """
+        Enumerate the words below a node in lexicographic order.
+        
+        Args:
+            node: Starting node
+            prefix: Characters leading to the node
+            
+        Yields:
+            Each complete word
+        """
+        labels, targets, edge_start, final = self.labels, self.targets, self.edge_start, self.final
+        if final[node]:
+            yield prefix
+        # Each entry is (next edge to follow, end of the node's edges, word so far)
+        stack = [(edge_start[node], edge_start[node + 1], prefix)]
+        while stack:
+            edge, end, word = stack[-1]
+            if edge == end:
+                stack.pop()
+                continue
+            stack[-1] = (edge + 1, end, word)
+            target = targets[edge]
+            child_word = word + chr(labels[edge])
+            if final[target]:
+                yield child_word
+            stack.append((edge_start[target], edge_start[target + 1], child_word))
+
+    def words_with_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """
+        List words starting with a prefix in lexicographic order.
+        
+        Args:
+            prefix: The prefix typed so far
+            limit: Maximum number of words to return
+            
+        Returns:
+            Matching words, including runtime-added ones
+        """
+        results = []
+        node = self.walk(prefix)
+        if node is not None:
+            for word in self.iter_from(node, prefix):
+                results.append(word)
+                if limit is not None and len(results) >= limit:
+                    return results
+        extra = sorted(word for word in self.added if word.startswith(prefix))
+        results.extend(extra)
+        return results[:limit] if limit is not None else results
+
+    def lookup(self, word: str, max_distance: float) -> List[Tuple[str, int]]:
+        """
+        Find all words within ``max_distance`` Levenshtein distance of a word.
+        
+        The graph is walked depth-first while carrying one DP row per path;
+        a branch is abandoned once every cell of its row exceeds the bound,
+        which is the Levenshtein-automaton walk over the graph. The row is the
+        automaton state, so (node, row) pairs reached along different paths
+        are explored only once.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum edit distance
+            
+        Returns:
+            Unordered list of (word, distance) pairs
+        """
+        labels, targets, edge_start, final = self.labels, self.targets, self.edge_start, self.final
+        size = len(word)
+        # Cells above the bound are capped so equivalent states share one memo entry
+        cap = int(max_distance) + 1
+        query_codes = sorted({ord(char) for char in word})
+        memo: Dict[Tuple[int, tuple], List[Tuple[str, int]]] = {}
+
+        def step(row: tuple, char: Optional[str]) -> tuple:
+            """DP row after reading one more character; None stands for any character not in the word."""
+            next_row = [min(row[0] + 1, cap)]
+            for j in range(1, size + 1):
+                value = row[j - 1] + (word[j - 1] != char)
+                if row[j] + 1 < value:
+                    value = row[j] + 1
+                if next_row[j - 1] + 1 < value:
+                    value = next_row[j - 1] + 1
+                next_row.append(value if value < cap else cap)
+            return tuple(next_row)
+
+        def explore(node: int, row: tuple) -> List[Tuple[str, int]]:
+            """Suffixes below a node that complete a match, given the DP row so far."""
+            key = (node, row)
+            found = memo.get(key)
+            if found is not None:
+                return found
+            self.comparisons += 1
+            found = []
+            if final[node] and row[size] <= max_distance:
+                found.append(('', row[size]))
+            start, end = edge_start[node], edge_start[node + 1]
+            # Every label absent from the word leads to the same row
+            other_row = step(row, None)
+            if min(other_row) <= max_distance:
+                edges = range(start, end)
+            else:
+                # Only edges labelled with a character of the word can survive
+                edges = []
+                for code in query_codes:
+                    position = bisect_left(labels, code, start, end)
+                    if position < end and labels[position] == code:
+                        edges.append(position)
+            for edge in edges:
+                char = chr(labels[edge])
+                next_row = step(row, char) if labels[edge] in query_set else other_row
+                if min(next_row) <= max_distance:
+                    found.extend((char + suffix, distance)
+                                 for suffix, distance in explore(targets[edge], next_row))
+            memo[key] = found
+            return found
+
+        query_set = set(query_codes)
+        initial = tuple(min(j, cap) for j in range(size + 1))
+        results = list(explore(0, initial))
+
+        for extra in self.added:
+            distance = _levenshtein(word, extra)
+            if distance <= max_distance:
+                results.append((extra, distance))
+        return results
+
+
+def _levenshtein(s1: str, s2: str) -> int:
+    """Plain Levenshtein distance for the small overlay set."""
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            current_row.append(min(previous_row[j + 1] + 1, current_row[j] + 1, previous_row[j] + (c1 != c2)))
+        previous_row = current_row
+    return previous_row[-1]
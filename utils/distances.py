@@ -0,0 +1,138 @@
+"""
+Edit distance functions for Tigrigna words.
+The weighted distances can be passed as the ``distance`` of
+TigrignaSpellChecker or of its suggestion indexes; the bounded distance is
+used internally wherever only matches within a threshold matter.
+"""
+
+
+def weighted_edit_distance(s1: str, s2: str, insert_cost: float = 1.0, delete_cost: float = 1.0,
+                           substitute_cost: float = 1.0) -> float:
+    """
+    Calculate edit distance with weighted operations.
+    
+    With equal insert and delete costs and a substitute cost no larger than
+    their sum the result is a metric, so it can key a BK-tree.
+    
+    Args:
+        s1: First word
+        s2: Second word
+        insert_cost: Cost of inserting a character
+        delete_cost: Cost of deleting a character
+        substitute_cost: Cost of substituting a character
+        
+    Returns:
+        The weighted edit distance
+    """
+    if len(s1) < len(s2):
+        return weighted_edit_distance(s2, s1, delete_cost, insert_cost, substitute_cost)
+    
+    if len(s2) == 0:
+        return len(s1) * delete_cost
+    
+    previous_row = [float(j) * insert_cost for j in range(len(s2) + 1)]
+    
+    for i, c1 in enumerate(s1):
+        current_row = [float(i + 1) * delete_cost]
+        for j, c2 in enumerate(s2):
+            insertions = current_row[j] + insert_cost
+            deletions = previous_row[j + 1] + delete_cost
+            substitutions = previous_row[j] + (substitute_cost if c1 != c2 else 0)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+    
+    return previous_row[-1]
+
+
+def context_aware_edit_distance(s1: str, s2: str) -> float:
+    """
+    Calculate edit distance with position-based substitution weights.
+    
+    Substitutions near the beginning and end of a word cost more than in the
+    middle. The weights depend on position, so this is not a strict metric and
+    a BK-tree search with it may miss a few borderline candidates.
+    
+    Args:
+        s1: First word
+        s2: Second word
+        
+    Returns:
+        The weighted edit distance
+    """
+    if len(s1) < len(s2):
+        return context_aware_edit_distance(s2, s1)
+    
+    if len(s2) == 0:
+        return len(s1)
+    
+    def position_weight(pos, length):
+        if pos < length / 3:
+            return 1.5  # Beginning of word
+        elif pos > (2 * length) / 3:
+            return 1.2  # End of word
+        else:
+            return 1.0  # Middle of word
+    
+    previous_row = list(range(len(s2) + 1))
+    
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            weight = position_weight(j, len(s2))
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (weight if c1 != c2 else 0)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+    
+    return previous_row[-1]
+
+
+def bounded_edit_distance(s1: str, s2: str, max_distance: int) -> int:
+    """
+    Calculate the Levenshtein distance only if it is at most ``max_distance``.
+    
+    Only the diagonal band of width 2 * max_distance + 1 is filled (Ukkonen's
+    cut-off), and the computation stops as soon as a whole row exceeds the
+    bound, so hopeless candidates cost little.
+    
+    Args:
+        s1: First word
+        s2: Second word
+        max_distance: Largest distance of interest
+        
+    Returns:
+        The edit distance, or max_distance + 1 if it is larger than max_distance
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    
+    too_far = max_distance + 1
+    if len(s1) - len(s2) > max_distance:
+        return too_far
+    if len(s2) == 0:
+        return len(s1)
+    
+    width = len(s2)
+    previous_row = [j if j <= max_distance else too_far for j in range(width + 1)]
+    for i, c1 in enumerate(s1, 1):
+        current_row = [too_far] * (width + 1)
+        if i <= max_distance:
+            current_row[0] = i
+        row_min = current_row[0]
+        for j in range(max(1, i - max_distance), min(width, i + max_distance) + 1):
+            value = previous_row[j - 1] + (c1 != s2[j - 1])
+            if previous_row[j] + 1 < value:
+                value = previous_row[j] + 1
+            if current_row[j - 1] + 1 < value:
+                value = current_row[j - 1] + 1
+            if value > too_far:
+                value = too_far
+            current_row[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return too_far
+        previous_row = current_row
+    
+    return previous_row[width]
@@ -0,0 +1,197 @@
+"""
+Copy-on-write hot reload of the Tigrigna dictionary.
+A reload builds a complete new checker (word set, index and caches) in a
+background thread while the current one keeps serving, then swaps the
+reference to it. Callers that take ``reloader.checker`` once per request
+see one consistent snapshot for the whole request, however long a reload
+takes; the only pause is the swap itself. An optional watcher polls the
+dictionary and its append log: a rewritten dictionary, for example after
+compaction, triggers a reload, and words other processes append to the
+log go into a copy of the current snapshot that is swapped in the same
+way, without re-reading the dictionary; the copy shares the snapshot's
+index and keeps the new words in a small overlay (see utils.overlay). A
+snapshot is never changed once it serves requests.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .append_log import read_log
+from .binary_dictionary import ADDED_SUFFIX
+
+
+class HotReloader:
+    """
+    Holds the current checker snapshot and replaces it with freshly built ones.
+    """
+
+    def __init__(self, checker, watch_interval: Optional[float] = None):
+        """
+        Start serving a loaded checker.
+        
+        Args:
+            checker: The initial TigrignaSpellChecker snapshot
+            watch_interval: Seconds between checks of the dictionary files,
+                None to reload only when reload() is called
+        """
+        self.checker = checker
+        # Serialises reloads and the swap against words added meanwhile
+        self.lock = threading.Lock()
+        self.reload_lock = threading.Lock()
+        # Words added while a reload is building, replayed into the new snapshot
+        self.replay: Optional[List[str]] = None
+        self.dictionary_stamp = self.stamp(checker.dictionary_path)
+        self.log_stamp = self.stamp(checker.dictionary_path + ADDED_SUFFIX)
+        self.reloads = 0
+        self.build_times: List[float] = []
+        self.pause_times: List[float] = []
+        self.stop_event = threading.Event()
+        self.watcher: Optional[threading.Thread] = None
+        if watch_interval is not None:
+            self.watcher = threading.Thread(target=self.watch, args=(watch_interval,),
+                                            name='tigrigna-reload', daemon=True)
+            self.watcher.start()
+
+    @staticmethod
+    def stamp(path: str) -> Tuple[int, int]:
+        """
+        Get the size and mtime of a file.
+        
+        Args:
+            path: File to stat
+        
+        Returns:
+            Tuple of size and mtime in nanoseconds, (0, 0) if it does not exist
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return 0, 0
+        return stat.st_size, stat.st_mtime_ns
+
+    def reload(self) -> None:
+        """Build a new snapshot from the dictionary files and swap it in."""
+        with self.reload_lock:
+            with self.lock:
+                self.replay = []
+                old = self.checker
+            dictionary_stamp = self.stamp(old.dictionary_path)
+            log_stamp = self.stamp(old.dictionary_path + ADDED_SUFFIX)
+            start = time.perf_counter()
+            try:
+                new = old.reloaded()
+            except Exception:
+                with self.lock:
+                    self.replay = None
+                raise
+            built = time.perf_counter()
+            with self.lock:
+                for word in self.replay:
+                    new.add_to_dictionary(word, persist=False)
+                self.checker = new
+                self.replay = None
+            self.pause_times.append(time.perf_counter() - built)
+            self.build_times.append(built - start)
+            self.dictionary_stamp, self.log_stamp = dictionary_stamp, log_stamp
+            self.reloads += 1
+
+    def reload_in_background(self) -> threading.Thread:
+        """
+        Run reload() in a new thread.
+        
+        Returns:
+            The started thread
+        """
+        thread = threading.Thread(target=self.reload, name='tigrigna-reload-build', daemon=True)
+        thread.start()
+        return thread
+
+    def add_to_dictionary(self, word: str) -> None:
+        """
+        Log a word and swap in a copy of the current snapshot that has it,
+        and add it to the next one if a reload is building.
+        
+        Args:
+            word: The word to add
+        """
+        word = word.strip()
+        with self.lock:
+            checker = self.checker
+            if not word or word in checker.word_dict:
+                return
+            checker.word_log.add(word)
+            self.swap_extended(checker, [word])
+
+    def swap_extended(self, checker, words: List[str]) -> None:
+        """
+        Swap in a copy of a snapshot with extra words; the caller holds self.lock.
+        
+        Args:
+            checker: The current snapshot
+            words: Words to add
+        """
+        self.checker = checker.extended(words)
+        if self.replay is not None:
+            self.replay.extend(words)
+
+    def poll(self) -> None:
+        """Reload if the dictionary was rewritten, and pick up words other processes logged."""
+        path = self.checker.dictionary_path
+        if self.stamp(path) != self.dictionary_stamp:
+            self.reload()
+            return
+        log_stamp = self.stamp(path + ADDED_SUFFIX)
+        if log_stamp != self.log_stamp:
+            self.log_stamp = log_stamp
+            with self.lock:
+                checker = self.checker
+                words = [word for word in dict.fromkeys(read_log(path)) if word not in checker.word_dict]
+                if words:
+                    self.swap_extended(checker, words)
+
+    def watch(self, interval: float) -> None:
+        """Poll the dictionary files until stop() is called."""
+        while not self.stop_event.wait(interval):
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"Error reloading dictionary: {str(e)}")
+
+    def stop(self) -> None:
+        """Stop the watcher thread."""
+        self.stop_event.set()
+        if self.watcher is not None:
+            self.watcher.join()
+            self.watcher = None
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get reload counters.
+        
+        Returns:
+            Dictionary with the number of reloads, the last build time and
+            the longest pause in milliseconds
+        """
+        return {
+            'reloads': self.reloads,
+            'last_build_ms': self.build_times[-1] * 1000 if self.build_times else 0.0,
+            'max_pause_ms': max(self.pause_times, default=0.0) * 1000,
+        }
+
+    def check_text(self, text: str) -> Dict[str, List[str]]:
+        """Check a text against the current snapshot."""
+        return self.checker.check_text(text)
+
+    def generate_suggestions(self, word: str, max_distance: int = 2, max_suggestions: int = 5) -> List[str]:
+        """Generate suggestions from the current snapshot."""
+        return self.checker.generate_suggestions(word, max_distance, max_suggestions)
+
+    def get_statistics(self, text: str) -> Dict[str, int]:
+        """Get text statistics from the current snapshot."""
+        return self.checker.get_statistics(text)
+
+    def complete(self, prefix: str, k: int = 10) -> List[str]:
+        """Complete a prefix from the current snapshot."""
+        return self.checker.complete(prefix, k)
@@ -0,0 +1,205 @@
+"""
+Incremental spell checking for real-time editors.
+The checker keeps the token spans of a document with their verdicts and, on
+each edit, re-tokenizes and re-checks only the tokens touching the edited
+range. Text and spans are held in gap buffers: characters and tokens before
+the last edit are stored in order with absolute offsets, those after it in
+reverse with offsets from the end of the text, so an edit next to the
+previous one never copies or shifts the rest of the document.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from .tokenizer import iter_tokens
+
+# (start, end, word, correct)
+Token = Tuple[int, int, str, bool]
+Span = Tuple[int, int, str]
+
+
+@dataclass
+class SpanDiff:
+    """
+    Misspelling spans that disappeared (in old offsets) and appeared (in new
+    offsets) because of one edit.
+    """
+
+    removed: List[Span] = field(default_factory=list)
+    added: List[Span] = field(default_factory=list)
+
+
+class IncrementalChecker:
+    """
+    Tracks the misspelled words of one document across edits.
+    """
+
+    def __init__(self, checker, text: str = ''):
+        """
+        Check a document once and remember its token spans.
+        
+        Args:
+            checker: A TigrignaSpellChecker
+            text: Initial document text
+        """
+        self.checker = checker
+        # Characters before the gap in order, and after the gap in reverse
+        self.head: List[str] = []
+        self.tail: List[str] = []
+        # Tokens before the gap, absolute offsets, in document order
+        self.before: List[Token] = []
+        # Tokens after the gap, offsets from the end of the text, nearest last
+        self.after: List[Token] = []
+        # Last full text handed to update(), valid until the next edit()
+        self.cached_text: Optional[str] = None
+        if text:
+            self.edit(0, 0, text)
+
+    def __len__(self) -> int:
+        return len(self.head) + len(self.tail)
+
+    @property
+    def text(self) -> str:
+        """The current document text."""
+        if self.cached_text is None:
+            self.cached_text = ''.join(self.head) + ''.join(reversed(self.tail))
+        return self.cached_text
+
+    def to_after(self, token: Token) -> Token:
+        start, end, word, correct = token
+        return (len(self) - start, len(self) - end, word, correct)
+
+    def from_after(self, token: Token) -> Token:
+        start, end, word, correct = token
+        return (len(self) - start, len(self) - end, word, correct)
+
+    def move_gap(self, position: int) -> None:
+        """Move the text gap to a position."""
+        if position < len(self.head):
+            self.tail.extend(reversed(self.head[position:]))
+            del self.head[position:]
+        elif position > len(self.head):
+            count = position - len(self.head)
+            self.head.extend(reversed(self.tail[-count:]))
+            del self.tail[-count:]
+
+    def slice(self, start: int, end: int) -> str:
+        """Text between two offsets, read across the gap."""
+        gap = len(self.head)
+        if end <= gap:
+            return ''.join(self.head[start:end])
+        text = ''.join(self.head[start:]) if start < gap else ''
+        first = len(self.tail) - (end - gap)
+        last = len(self.tail) - max(0, start - gap)
+        return text + ''.join(reversed(self.tail[first:last]))
+
+    def edit(self, offset: int, deleted: int, inserted: str) -> SpanDiff:
+        """
+        Apply an edit and re-check only the affected window.
+        
+        Args:
+            offset: Position of the edit in the current text
+            deleted: Number of characters removed at offset
+            inserted: Text inserted at offset
+            
+        Returns:
+            SpanDiff of misspelling spans removed and added
+        """
+        low, high = offset, offset + deleted
+        if not 0 <= low <= high <= len(self):
+            raise ValueError(f"Edit {offset}+{deleted} is outside a text of length {len(self)}")
+
+        # Move the gap to the edit: before keeps tokens ending before it
+        while self.before and self.before[-1][1] >= low:
+            self.after.append(self.to_after(self.before.pop()))
+        while self.after and self.from_after(self.after[-1])[1] < low:
+            self.before.append(self.from_after(self.after.pop()))
+        # Tokens overlapping or touching the edited range are re-tokenized
+        affected = []
+        while self.after and self.from_after(self.after[-1])[0] <= high:
+            affected.append(self.from_after(self.after.pop()))
+
+        window_start = min([low] + [token[0] for token in affected])
+        window_end = max([high] + [token[1] for token in affected])
+
+        self.cached_text = None
+        self.move_gap(low)
+        if deleted:
+            del self.tail[-deleted:]
+        self.head.extend(inserted)
+        window_end += len(inserted) - deleted
+
+        diff = SpanDiff(removed=[(start, end, word) for start, end, word, correct in affected if not correct])
+        for word, start, end in iter_tokens(self.slice(window_start, window_end)):
+            start, end = window_start + start, window_start + end
+            correct = self.checker.check_word(word)
+            self.before.append((start, end, word, correct))
+            if not correct:
+                diff.added.append((start, end, word))
+
+        # Identical spans on both sides did not change
+        unchanged = set(diff.removed).intersection(diff.added)
+        if unchanged:
+            diff.removed = [span for span in diff.removed if span not in unchanged]
+            diff.added = [span for span in diff.added if span not in unchanged]
+        return diff
+
+    def update(self, text: str) -> SpanDiff:
+        """
+        Replace the whole text, re-checking only the region that changed.
+        
+        Suits UIs such as ipywidgets that report the new value rather than
+        the edit; the edit is recovered from the common prefix and suffix,
+        which costs a pass over the text that edit() avoids.
+        
+        Args:
+            text: The new document text
+            
+        Returns:
+            SpanDiff of misspelling spans removed and added
+        """
+        old = self.text
+        limit = min(len(old), len(text))
+        # Longest common prefix by binary search on C-level slice comparisons;
+        # only the still undecided part is compared, so the slices shrink
+        low, high = 0, limit
+        while low < high:
+            middle = (low + high + 1) // 2
+            if old[low:middle] == text[low:middle]:
+                low = middle
+            else:
+                high = middle - 1
+        prefix = low
+        low, high = 0, limit - prefix
+        while low < high:
+            middle = (low + high + 1) // 2
+            if old[len(old) - middle:len(old) - low] == text[len(text) - middle:len(text) - low]:
+                low = middle
+            else:
+                high = middle - 1
+        suffix = low
+        diff = self.edit(prefix, len(old) - prefix - suffix, text[prefix:len(text) - suffix])
+        self.cached_text = text
+        return diff
+
+    def tokens(self) -> List[Token]:
+        """
+        Get every token span with its verdict.
+        
+        Returns:
+            List of (start, end, word, correct) in document order
+        """
+        return self.before + [self.from_after(token) for token in reversed(self.after)]
+
+    def misspellings(self, suggestions: bool = False) -> List[Tuple[int, int, str, Optional[List[str]]]]:
+        """
+        Get every misspelled span of the document.
+        
+        Args:
+            suggestions: Whether to include suggestions for each word
+            
+        Returns:
+            List of (start, end, word, suggestions or None) in document order
+        """
+        return [(start, end, word, self.checker.generate_suggestions(word) if suggestions else None)
+                for start, end, word, correct in self.tokens() if not correct]
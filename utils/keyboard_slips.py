@@ -0,0 +1,92 @@
+"""
+Typing-slip candidates for the on-screen Tigrigna keyboard.
+A character is typed by pressing a base key and picking one of its vowel
+variants, so the likeliest slips are picking a neighbouring variant of the
+same key and pressing a key next to the intended one. The table lists, for
+every character the keyboard can produce, the characters such slips would
+have produced instead. Suggestions for a typed word are then the dictionary
+words one slip away: a few hundred generated strings, each checked with a
+single membership test.
+"""
+
+from typing import Callable, Container, Dict, Iterator, List, Sequence, Tuple
+
+# Cost of picking another vowel variant of the right key
+VARIANT_COST = 1
+
+# Cost of pressing a key next to the intended one
+KEY_COST = 2
+
+
+class SlipTable:
+    """
+    Characters confusable with each keyboard character, with slip costs.
+    """
+
+    def __init__(self, layout: Sequence[Sequence[str]], variants: Callable[[str], List[str]]):
+        """
+        Derive the table from a keyboard layout.
+        
+        Args:
+            layout: Rows of keys as shown on screen, columns aligned
+            variants: Function giving the characters a key produces, in
+                vowel order
+        """
+        # Character -> [(substitute, cost)], cheapest first
+        self.substitutes: Dict[str, List[Tuple[str, int]]] = {}
+        # Letter keys only: numbers, punctuation and editing keys never slip into words
+        keys = {(row, column): key for row, keys in enumerate(layout) for column, key in enumerate(keys)
+                if key.isalpha()}
+        costs: Dict[str, Dict[str, int]] = {}
+        for (row, column), key in keys.items():
+            family = variants(key)
+            neighbours = [variants(keys[position]) for position in
+                          ((row, column - 1), (row, column + 1), (row - 1, column), (row + 1, column))
+                          if position in keys]
+            for order, char in enumerate(family):
+                slips = costs.setdefault(char, {})
+                for other in family:
+                    if other != char:
+                        slips[other] = min(slips.get(other, VARIANT_COST), VARIANT_COST)
+                # The same vowel variant of an adjacent key
+                for neighbour in neighbours:
+                    if order < len(neighbour) and neighbour[order] != char:
+                        slips[neighbour[order]] = min(slips.get(neighbour[order], KEY_COST), KEY_COST)
+        for char, slips in costs.items():
+            self.substitutes[char] = sorted(slips.items(), key=lambda slip: (slip[1], slip[0]))
+
+    def __len__(self) -> int:
+        return sum(len(slips) for slips in self.substitutes.values())
+
+    def slips(self, word: str) -> Iterator[Tuple[str, int]]:
+        """
+        Generate the strings one slip away from a typed word.
+        
+        Args:
+            word: The typed word
+        
+        Returns:
+            Iterator of (string, slip cost) pairs
+        """
+        for position, char in enumerate(word):
+            for substitute, cost in self.substitutes.get(char, ()):
+                yield word[:position] + substitute + word[position + 1:], cost
+
+    def suggestions(self, word: str, dictionary: Container[str], max_suggestions: int = 5) -> List[str]:
+        """
+        Find dictionary words one slip away from a typed word.
+        
+        Args:
+            word: The typed word
+            dictionary: Set-like collection of words
+            max_suggestions: Maximum number of suggestions
+        
+        Returns:
+            Words ordered by slip cost, then alphabetically; empty if no
+            slip explains the word
+        """
+        found: Dict[str, int] = {}
+        for candidate, cost in self.slips(word):
+            if cost < found.get(candidate, KEY_COST + 1) and candidate in dictionary:
+                found[candidate] = cost
+        return sorted(found, key=lambda candidate: (found[candidate], candidate))[:max_suggestions]
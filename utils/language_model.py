@@ -0,0 +1,281 @@
+"""
+Compact word n-gram language model for context-sensitive checking.
+N-grams are stored as 64-bit hashes, sorted per order, each with a one-byte
+quantised log10 probability: the n-gram's count over its context's count,
+or over the number of tokens for unigrams. The file is memory-mapped, and
+all n-grams of a sentence, or of every candidate for one position, are
+looked up together with one binary search per order. Unseen n-grams back
+off to shorter ones with a fixed penalty ("stupid backoff"), which needs no
+normalisation and so suits a pruned, hashed table.
+
+Build a model from a corpus with:
+    python -m utils.update_dictionary corpus.txt --language-model data/tigrigna.tglm
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+MAGIC = b'TGLM'
+FORMAT_VERSION = 1
+
+# Highest n-gram order a file can hold
+MAX_ORDER = 4
+
+# Token standing for the start of a sentence
+SENTENCE_START = '<s>'
+
+# log10 probabilities are quantised to one byte over [QUANT_FLOOR, 0]
+QUANT_FLOOR = -8.0
+QUANT_LEVELS = 255
+
+# log10 penalty for each order backed off
+LOG_BACKOFF = float(np.log10(0.4))
+
+# Multiplier folding token hashes into n-gram hashes
+HASH_MULTIPLIER = 0x100000001B3
+HASH_MASK = (1 << 64) - 1
+
+# magic, version, order, total tokens, n-gram count per order, then the byte
+# offsets of the key and value sections of each order
+HEADER = struct.Struct(f'<4sIIQ{MAX_ORDER}Q{2 * MAX_ORDER}Q')
+
+
+def token_hash(word: str) -> int:
+    """
+    Hash a word to 64 bits, stable across processes.
+    
+    Args:
+        word: The word
+    
+    Returns:
+        Unsigned 64-bit hash
+    """
+    return int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def ngram_hash(words: Sequence[str]) -> int:
+    """
+    Hash an n-gram the way LanguageModel folds token hashes.
+    
+    Args:
+        words: The words of the n-gram in order
+    
+    Returns:
+        Unsigned 64-bit hash
+    """
+    value = 0
+    for word in words:
+        value = (value * HASH_MULTIPLIER + token_hash(word)) & HASH_MASK
+    return value
+
+
+def quantise(log_probs: np.ndarray) -> np.ndarray:
+    """Map log10 probabilities to bytes, 0 being probability 1."""
+    clipped = np.clip(log_probs, QUANT_FLOOR, 0)
+    return np.rint(clipped / QUANT_FLOOR * QUANT_LEVELS).astype(np.uint8)
+
+
+def compile_language_model(counts: Dict[Tuple[str, ...], int], output_path: str, order: int = 3,
+                           min_count: int = 2) -> int:
+    """
+    Write n-gram counts to a compiled language model.
+    
+    Args:
+        counts: Counts of n-grams up to the order, as word tuples; sentences
+            start with SENTENCE_START
+        output_path: Path of the compiled file
+        order: Highest n-gram order to keep, at most MAX_ORDER
+        min_count: N-grams longer than one word seen fewer times are pruned
+    
+    Returns:
+        Number of n-grams written
+    """
+    if not 1 <= order <= MAX_ORDER:
+        raise ValueError(f"Order must be between 1 and {MAX_ORDER}, got {order}")
+    total = sum(count for ngram, count in counts.items() if len(ngram) == 1 and ngram[0] != SENTENCE_START)
+    sections = []
+    sizes = []
+    for n in range(1, MAX_ORDER + 1):
+        entries = {}
+        if n <= order:
+            for ngram, count in counts.items():
+                if len(ngram) != n or (n > 1 and count < min_count):
+                    continue
+                context = counts.get(ngram[:-1], 0) if n > 1 else total
+                if context:
+                    entries[ngram_hash(ngram)] = np.log10(count / context)
+        keys = np.array(sorted(entries), dtype='<u8')
+        values = quantise(np.array([entries[key] for key in keys.tolist()], dtype=np.float64))
+        sections.extend([keys.tobytes(), values.tobytes()])
+        sizes.append(len(keys))
+
+    positions = []
+    position = HEADER.size
+    for data in sections:
+        position += -position % 8
+        positions.append(position)
+        position += len(data)
+
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, order, total, *sizes, *positions))
+        for data, section_position in zip(sections, positions):
+            f.write(b'\0' * (section_position - f.tell()))
+            f.write(data)
+    os.replace(temp_path, output_path)
+    return sum(sizes)
+
+
+def count_ngrams(sentences: Iterable[List[str]], order: int = 3) -> Dict[Tuple[str, ...], int]:
+    """
+    Count the n-grams of tokenized sentences.
+    
+    Args:
+        sentences: Lists of words
+        order: Highest n-gram order to count
+    
+    Returns:
+        Dictionary mapping n-gram tuples to counts
+    """
+    counts: Dict[Tuple[str, ...], int] = {}
+    for words in sentences:
+        tokens = [SENTENCE_START] + words
+        for n in range(1, order + 1):
+            for start in range(len(tokens) - n + 1):
+                ngram = tuple(tokens[start:start + n])
+                counts[ngram] = counts.get(ngram, 0) + 1
+    return counts
+
+
+class LanguageModel:
+    """
+    A read-only, memory-mapped n-gram model scoring words in context.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a compiled language model file.
+        
+        Args:
+            path: Path to the compiled model
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        fields = HEADER.unpack_from(self.mmap)
+        magic, version, self.order, self.total = fields[:4]
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} compiled language model")
+        sizes = fields[4:4 + MAX_ORDER]
+        positions = fields[4 + MAX_ORDER:]
+        self.keys: List[np.ndarray] = []
+        self.values: List[np.ndarray] = []
+        for n in range(self.order):
+            self.keys.append(np.frombuffer(self.mmap, dtype='<u8', count=sizes[n], offset=positions[2 * n]))
+            self.values.append(np.frombuffer(self.mmap, dtype=np.uint8, count=sizes[n], offset=positions[2 * n + 1]))
+        self.start_hash = token_hash(SENTENCE_START)
+
+    def __len__(self) -> int:
+        return sum(len(keys) for keys in self.keys)
+
+    def hashes(self, words: Sequence[str]) -> np.ndarray:
+        """
+        Hash the words of a sentence, preceded by the sentence start.
+        
+        Args:
+            words: The words
+        
+        Returns:
+            uint64 array with one hash per token
+        """
+        return np.array([self.start_hash] + [token_hash(word) for word in words], dtype=np.uint64)
+
+    def score_hashes(self, tokens: np.ndarray) -> np.ndarray:
+        """
+        Score every token of one or more token sequences given the tokens before it.
+        
+        Args:
+            tokens: uint64 token hashes, shape (sequences, length)
+        
+        Returns:
+            float array of the same shape with each token's log10 probability
+        """
+        scores = np.full(tokens.shape, QUANT_FLOOR)
+        ngrams = np.zeros(tokens.shape, dtype=np.uint64)
+        multiplier = np.uint64(HASH_MULTIPLIER)
+        for n in range(1, self.order + 1):
+            if n > tokens.shape[1]:
+                break
+            # The n-gram ending at column j extends the (n-1)-gram ending at j - 1
+            ngrams[:, n - 1:] = ngrams[:, n - 2:-1] * multiplier + tokens[:, n - 1:] if n > 1 else tokens
+            keys, values = self.keys[n - 1], self.values[n - 1]
+            if not len(keys):
+                continue
+            current = ngrams[:, n - 1:]
+            slots = np.minimum(np.searchsorted(keys, current), len(keys) - 1)
+            found = keys[slots] == current
+            probabilities = values[slots] * (QUANT_FLOOR / QUANT_LEVELS)
+            # Unknown words keep the floor; unseen longer n-grams back off
+            fallback = scores[:, n - 1:] + LOG_BACKOFF if n > 1 else scores[:, n - 1:]
+            scores[:, n - 1:] = np.where(found, probabilities, fallback)
+        return scores
+
+    def score(self, words: Sequence[str]) -> np.ndarray:
+        """
+        Score each word of a sentence given the words before it.
+        
+        Args:
+            words: The words of the sentence
+        
+        Returns:
+            Array of log10 probabilities, one per word
+        """
+        return self.score_hashes(self.hashes(words)[None, :])[0, 1:]
+
+    def window_scores(self, words: Sequence[str], position: int, candidates: Sequence[str]) -> np.ndarray:
+        """
+        Score replacing one word of a sentence by each candidate.
+        
+        Only the n-grams that contain the replaced position change, so each
+        candidate is scored on a window around it, all in one batch.
+        
+        Args:
+            words: The words of the sentence
+            position: Index of the word to replace
+            candidates: Replacement words
+        
+        Returns:
+            Array with the summed log10 probability of the affected words,
+            one per candidate
+        """
+        tokens = self.hashes(words)
+        column = position + 1
+        start = max(0, column - self.order + 1)
+        end = min(len(tokens), column + self.order)
+        window = np.repeat(tokens[None, start:end], len(candidates), axis=0)
+        window[:, column - start] = [token_hash(candidate) for candidate in candidates]
+        scores = self.score_hashes(window)
+        return scores[:, column - start:].sum(axis=1)
+
+    def unigram_scores(self, words: Sequence[str]) -> np.ndarray:
+        """
+        Score words without context.
+        
+        Args:
+            words: The words
+        
+        Returns:
+            Array of log10 unigram probabilities, one per word
+        """
+        tokens = np.array([token_hash(word) for word in words], dtype=np.uint64)
+        return self.score_hashes(tokens[:, None])[:, 0]
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self.keys = self.values = []
+        self.mmap.close()
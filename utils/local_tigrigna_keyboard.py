@@ -1,9 +1,30 @@
 import tkinter as tk
 from tkinter import scrolledtext, Button, Frame, Label
-import re
 import os
 
+try:
+    from .distances import bounded_edit_distance
+    from .keyboard_slips import SlipTable
+    from .tokenizer import tokenize
+    from .update_dictionary import load_dictionary as read_dictionary
+except ImportError:
+    # Running this file directly as a script
+    from distances import bounded_edit_distance
+    from keyboard_slips import SlipTable
+    from tokenizer import tokenize
+    from update_dictionary import load_dictionary as read_dictionary
+
 class TigrignaKeyboard:
+    # Keyboard rows as shown on screen: numbers, Tigrigna characters and special keys
+    KEYBOARD_LAYOUT = [
+        ['፩', '፪', '፫', '፬', '፭', '፮', '፯', '፰', '፱', '፲'],
+        ['ሀ', 'ሐ', 'ሠ', 'ረ', 'ሰ', 'ሸ', 'ቀ', 'ቐ', 'በ', 'ቨ'],
+        ['ተ', 'ቸ', 'ኀ', 'ነ', 'ኘ', 'አ', 'ከ', 'ኸ', 'ወ', 'ዐ'],
+        ['ዘ', 'ژ', 'የ', 'ደ', 'ጀ', 'ገ', 'ጠ', 'ጨ', 'ጰ', 'ጸ'],
+        ['ፀ', 'ፈ', 'ፐ', 'ቦ', 'ቱ', 'ሙ', 'ሉ', 'ኢ', 'ኣ', 'ኡ'],
+        ['⌫', ' ', '፡', '።', '↵'],
+    ]
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Tigrigna Keyboard and Spell Checker")
@@ -13,6 +34,9 @@ class TigrignaKeyboard:
         self.dictionary = self.load_dictionary()
         print(f"Loaded {len(self.dictionary)} words from dictionary")
         
+        # Key and variant slips the layout makes likely
+        self.slip_table = SlipTable(self.KEYBOARD_LAYOUT, self.generate_variants)
+        
         # Create main frames
         self.create_frames()
         
@@ -32,17 +56,8 @@ class TigrignaKeyboard:
         self.current_base = None
         
     def load_dictionary(self, file_path='tigrigna_dictionary.txt'):
-        """Load the Tigrigna dictionary"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                dictionary = {line.strip() for line in file if line.strip()}
-            return dictionary
-        except FileNotFoundError:
-            print(f"Error: Dictionary file '{file_path}' not found.")
-            return set()
-        except Exception as e:
-            print(f"Error loading dictionary: {e}")
-            return set()
+        """Load the Tigrigna dictionary (plain, frequency-annotated or compiled)"""
+        return read_dictionary(file_path)
     
     def create_frames(self):
         # Top frame for text area
@@ -74,30 +89,8 @@ class TigrignaKeyboard:
         self.text_area.pack(fill=tk.X, padx=5, pady=5)
     
     def create_keyboard(self):
-        # Define keyboard layout
-        # First row (numbers)
-        row1 = ['፩', '፪', '፫', '፬', '፭', '፮', '፯', '፰', '፱', '፲']
-        
-        # Second row (Tigrigna characters)
-        row2 = ['ሀ', 'ሐ', 'ሠ', 'ረ', 'ሰ', 'ሸ', 'ቀ', 'ቐ', 'በ', 'ቨ']
-        
-        # Third row
-        row3 = ['ተ', 'ቸ', 'ኀ', 'ነ', 'ኘ', 'አ', 'ከ', 'ኸ', 'ወ', 'ዐ']
-        
-        # Fourth row
-        row4 = ['ዘ', 'ژ', 'የ', 'ደ', 'ጀ', 'ገ', 'ጠ', 'ጨ', 'ጰ', 'ጸ']
-        
-        # Fifth row
-        row5 = ['ፀ', 'ፈ', 'ፐ', 'ቦ', 'ቱ', 'ሙ', 'ሉ', 'ኢ', 'ኣ', 'ኡ']
-        
-        # Special row
-        row6 = ['⌫', ' ', '፡', '።', '↵']
-        
-        # Create keyboard layout
-        keyboard_layout = [row1, row2, row3, row4, row5, row6]
-        
         # Create buttons for each row
-        for i, row in enumerate(keyboard_layout):
+        for i, row in enumerate(self.KEYBOARD_LAYOUT):
             row_frame = Frame(self.keyboard_frame, bg="#000000")
             row_frame.pack(pady=2)
             
@@ -169,7 +162,8 @@ class TigrignaKeyboard:
             btn.pack(side=tk.LEFT, padx=2, pady=2)
             self.variant_buttons.append(btn)
     
-    def is_tigrigna_char(self, char):
+    @staticmethod
+    def is_tigrigna_char(char):
         """Check if a character is a Tigrigna character"""
         if not char or len(char) != 1:
             return False
@@ -177,9 +171,10 @@ class TigrignaKeyboard:
         code = ord(char)
         return (0x1200 <= code <= 0x137F) or (0x1380 <= code <= 0x139F) or (0x2D80 <= code <= 0x2DDF)
     
-    def generate_variants(self, base_char):
+    @classmethod
+    def generate_variants(cls, base_char):
         """Generate vowel variants for a Tigrigna character"""
-        if not self.is_tigrigna_char(base_char):
+        if not cls.is_tigrigna_char(base_char):
             return [base_char]
         
         try:
@@ -211,8 +206,7 @@ class TigrignaKeyboard:
             return
         
         # Tokenize text
-        words = re.findall(r'[\u1200-\u137F\u1380-\u139F\u2D80-\u2DDF]+', text)
-        words = [word for word in words if word.strip()]
+        words = tokenize(text)
         
         if not words:
             self.results_text.delete("1.0", tk.END)
@@ -235,19 +229,34 @@ class TigrignaKeyboard:
         self.display_results(results)
     
     def get_suggestions(self, word, max_distance=2, max_suggestions=5):
-        """Get spelling suggestions for a word"""
+        """Get spelling suggestions for a word
+        
+        Words one key or variant slip away are looked up first; the whole
+        dictionary is scanned only when no slip explains the word.
+        """
+        slips = self.slip_table.suggestions(word, self.dictionary, max_suggestions)
+        if slips:
+            return slips
+        
         suggestions = []
         
         for dict_word in self.dictionary:
-            distance = self.levenshtein_distance(word, dict_word)
+            distance = self.levenshtein_distance(word, dict_word, max_distance)
             if distance <= max_distance:
                 suggestions.append((dict_word, distance))
         
         suggestions.sort(key=lambda x: x[1])
         return [word for word, _ in suggestions[:max_suggestions]]
     
-    def levenshtein_distance(self, s1, s2):
-        """Calculate Levenshtein distance between two strings"""
+    def levenshtein_distance(self, s1, s2, max_distance=None):
+        """Calculate Levenshtein distance between two strings
+        
+        With max_distance, stop early once the distance exceeds it and
+        return max_distance + 1.
+        """
+        if max_distance is not None:
+            return bounded_edit_distance(s1, s2, max_distance)
+        
         if len(s1) < len(s2):
             return self.levenshtein_distance(s2, s1)
         
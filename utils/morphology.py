@@ -0,0 +1,358 @@
+"""
+Affix-rule lexicon for inflected Tigrigna words, in the spirit of hunspell.
+Instead of listing every surface form, the dictionary lists stems with
+flags (``stem/PS``) and an affix file describes what each flag allows:
+
+    PFX P Y 2
+    PFX P 0 ም .
+    PFX P 0 ዝ .
+    SFX S Y 3
+    SFX S 0 ኹ .
+    SFX S 0 ኻ .
+    SFX S ረ ርኩ ረ
+
+Each rule block starts with a header giving the flag, whether the rules
+combine with affixes of the other kind (Y/N) and the number of rules. A
+rule names the characters stripped from the stem (0 for none), the affix
+added and a condition the stem must match at its end (suffixes) or start
+(prefixes), ``.`` accepting any stem. Checking a word strips candidate
+affixes and looks up the remaining stem; the full set of surface forms is
+never built.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+from .distances import bounded_edit_distance
+
+
+@dataclass
+class AffixRule:
+    """
+    One prefix or suffix rule of an affix file.
+    """
+
+    kind: str
+    flag: str
+    strip: str
+    add: str
+    condition: Optional[Pattern]
+    cross_product: bool
+
+    def accepts(self, stem: str) -> bool:
+        """
+        Check whether the rule applies to a stem.
+        
+        Args:
+            stem: The stem
+        
+        Returns:
+            True if the stem ends (suffixes) or starts (prefixes) with the
+            stripped characters and matches the condition
+        """
+        if self.kind == 'SFX':
+            if not stem.endswith(self.strip) or len(stem) <= len(self.strip):
+                return False
+        elif not stem.startswith(self.strip) or len(stem) <= len(self.strip):
+            return False
+        return self.condition is None or self.condition.search(stem) is not None
+
+    def apply(self, stem: str) -> str:
+        """
+        Attach the affix to a stem the rule accepts.
+        
+        Args:
+            stem: The stem
+        
+        Returns:
+            The inflected form
+        """
+        if self.kind == 'SFX':
+            return stem[:len(stem) - len(self.strip)] + self.add
+        return self.add + stem[len(self.strip):]
+
+    def remove(self, word: str) -> str:
+        """
+        Undo the rule on a word carrying its affix.
+        
+        Args:
+            word: A word ending (suffixes) or starting (prefixes) with the affix
+        
+        Returns:
+            The stem the word would come from
+        """
+        if self.kind == 'SFX':
+            return word[:len(word) - len(self.add)] + self.strip
+        return self.strip + word[len(self.add):]
+
+
+class AffixModel:
+    """
+    Stems with flags plus the prefix and suffix rules of an affix file.
+    """
+
+    def __init__(self, rules: Iterable[AffixRule] = ()):
+        """
+        Index affix rules by the text they add.
+        
+        Args:
+            rules: Prefix and suffix rules
+        """
+        # Stem -> flags it carries
+        self.stems: Dict[str, str] = {}
+        # Length -> stems of that length, built on the first short_stems() call
+        self.lengths: Optional[Dict[int, List[str]]] = None
+        self.rules: List[AffixRule] = []
+        self.flags: Dict[str, List[AffixRule]] = {}
+        self.prefixes: Dict[str, List[AffixRule]] = {}
+        self.suffixes: Dict[str, List[AffixRule]] = {}
+        for rule in rules:
+            self.add_rule(rule)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'AffixModel':
+        """
+        Read the PFX and SFX rules of a hunspell-style affix file; other
+        directives are ignored.
+        
+        Args:
+            path: Path to the affix file
+        
+        Returns:
+            The affix model without stems
+        """
+        model = cls()
+        cross_products: Dict[Tuple[str, str], bool] = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                fields = line.split('#', 1)[0].split()
+                if len(fields) < 4 or fields[0] not in ('PFX', 'SFX'):
+                    continue
+                kind, flag = fields[0], fields[1]
+                if (kind, flag) not in cross_products:
+                    # Header: kind, flag, cross product, rule count
+                    cross_products[(kind, flag)] = fields[2] == 'Y'
+                    continue
+                strip = '' if fields[2] == '0' else fields[2]
+                add = '' if fields[3] == '0' else fields[3].split('/', 1)[0]
+                condition = fields[4] if len(fields) > 4 else '.'
+                pattern = None
+                if condition != '.':
+                    pattern = re.compile(f"(?:{condition})$" if kind == 'SFX' else f"^(?:{condition})")
+                model.add_rule(AffixRule(kind, flag, strip, add, pattern, cross_products[(kind, flag)]))
+        return model
+
+    def add_rule(self, rule: AffixRule) -> None:
+        """
+        Add an affix rule.
+        
+        Args:
+            rule: The rule to add
+        """
+        self.rules.append(rule)
+        self.flags.setdefault(rule.flag, []).append(rule)
+        table = self.suffixes if rule.kind == 'SFX' else self.prefixes
+        table.setdefault(rule.add, []).append(rule)
+
+    def add_stem(self, stem: str, flags: str = '') -> None:
+        """
+        Add a stem with the flags of the affix rules it takes.
+        
+        Args:
+            stem: The stem
+            flags: One character per flag
+        """
+        known = self.stems.get(stem)
+        if known is None:
+            known = ''
+            if self.lengths is not None:
+                self.lengths.setdefault(len(stem), []).append(stem)
+        self.stems[stem] = known + ''.join(flag for flag in flags if flag not in known)
+
+    def set_stems(self, stems: Dict[str, str]) -> None:
+        """
+        Replace all stems, for example with ones restored from a cache.
+        
+        Args:
+            stems: Dictionary mapping each stem to its flags
+        """
+        self.stems = stems
+        self.lengths = None
+
+    def short_stems(self, max_length: int) -> Iterator[str]:
+        """
+        Generate the stems no longer than a length without scanning them all.
+        
+        Args:
+            max_length: Largest stem length
+        
+        Returns:
+            Iterator of stems
+        """
+        if self.lengths is None:
+            self.lengths = {}
+            for stem in self.stems:
+                self.lengths.setdefault(len(stem), []).append(stem)
+        for length in range(max_length + 1):
+            yield from self.lengths.get(length, ())
+
+    def __len__(self) -> int:
+        return len(self.stems)
+
+    def takes(self, stem: str, rule: AffixRule) -> bool:
+        """Whether a known stem carries the rule's flag and satisfies its condition."""
+        flags = self.stems.get(stem)
+        return flags is not None and rule.flag in flags and rule.accepts(stem)
+
+    def strip_affixes(self, word: str, table: Dict[str, List[AffixRule]]) -> Iterator[Tuple[str, AffixRule]]:
+        """
+        Undo every rule in a table whose affix the word carries.
+        
+        Args:
+            word: The word
+            table: self.prefixes or self.suffixes
+        
+        Returns:
+            Iterator of (candidate stem, rule) pairs
+        """
+        suffix = table is self.suffixes
+        for add, rules in table.items():
+            if len(add) < len(word) and (word.endswith(add) if suffix else word.startswith(add)):
+                for rule in rules:
+                    yield rule.remove(word), rule
+
+    def analyze(self, word: str) -> Optional[Tuple[Optional[AffixRule], str, Optional[AffixRule]]]:
+        """
+        Find a stem and rules that produce a word.
+        
+        Args:
+            word: The word to analyse
+        
+        Returns:
+            Tuple of (prefix rule, stem, suffix rule), with None for an absent
+            affix, or None if no stem produces the word
+        """
+        if word in self.stems:
+            return None, word, None
+        for stem, suffix in self.strip_affixes(word, self.suffixes):
+            if self.takes(stem, suffix):
+                return None, stem, suffix
+            if suffix.cross_product:
+                for inner, prefix in self.strip_affixes(stem, self.prefixes):
+                    if prefix.cross_product and self.takes(inner, prefix) and self.takes(inner, suffix):
+                        return prefix, inner, suffix
+        for stem, prefix in self.strip_affixes(word, self.prefixes):
+            if self.takes(stem, prefix):
+                return prefix, stem, None
+        return None
+
+    def __contains__(self, word: str) -> bool:
+        return self.analyze(word) is not None
+
+    def affix_edges(self, word: str, table: Dict[str, List[AffixRule]],
+                    max_distance: int) -> List[Tuple[int, Optional[AffixRule], int]]:
+        """
+        Find where a possibly misspelled affix of a word may end (prefixes) or
+        start (suffixes).
+        
+        Args:
+            word: The word
+            table: self.prefixes or self.suffixes
+            max_distance: Edit distance allowed between the word's edge and an affix
+            
+        Returns:
+            List of (position, rule, edit cost); the unaffixed edge is
+            included with rule None and cost 0
+        """
+        suffix = table is self.suffixes
+        edges = [(len(word) if suffix else 0, None, 0)]
+        for add, rules in table.items():
+            low, high = max(0, len(add) - max_distance), min(len(word), len(add) + max_distance)
+            for length in range(low, high + 1):
+                edge = word[len(word) - length:] if suffix else word[:length]
+                cost = bounded_edit_distance(edge, add, max_distance)
+                if cost <= max_distance:
+                    position = len(word) - length if suffix else length
+                    edges.extend((position, rule, cost) for rule in rules)
+        return edges
+
+    def splits(self, word: str, max_distance: int = 0) -> Dict[str, List[Tuple[Optional[AffixRule], Optional[AffixRule], int]]]:
+        """
+        Split a possibly misspelled word into affixes and a remaining stem.
+        
+        Affixes within max_distance of the word's edges count, so a word
+        with a misspelled affix still yields its stem. Whatever budget the
+        affixes leave is what the stem may differ by.
+        
+        Args:
+            word: A possibly misspelled word
+            max_distance: Edit distance allowed for the whole word
+            
+        Returns:
+            Dictionary mapping each candidate stem, known or not and possibly
+            empty, to its (prefix rule, suffix rule, remaining distance) splits
+        """
+        result: Dict[str, List[Tuple[Optional[AffixRule], Optional[AffixRule], int]]] = {}
+        heads = self.affix_edges(word, self.prefixes, max_distance)
+        tails = self.affix_edges(word, self.suffixes, max_distance)
+        for start, prefix, head_cost in heads:
+            for end, suffix, tail_cost in tails:
+                budget = max_distance - head_cost - tail_cost
+                if start > end or budget < 0:
+                    continue
+                if prefix is not None and suffix is not None and not (prefix.cross_product and suffix.cross_product):
+                    continue
+                stem = ((prefix.strip if prefix else '') + word[start:end]
+                        + (suffix.strip if suffix else ''))
+                result.setdefault(stem, []).append((prefix, suffix, budget))
+        return result
+
+    def inflect(self, stem: str, prefix: Optional[AffixRule], suffix: Optional[AffixRule]) -> Optional[str]:
+        """
+        Attach affixes to a known stem.
+        
+        Args:
+            stem: The stem
+            prefix: Prefix rule, or None
+            suffix: Suffix rule, or None
+            
+        Returns:
+            The inflected form, or None if the stem does not take the rules
+        """
+        if suffix is not None and not self.takes(stem, suffix):
+            return None
+        if prefix is not None and not self.takes(stem, prefix):
+            return None
+        form = suffix.apply(stem) if suffix is not None else stem
+        if prefix is not None:
+            form = prefix.add + form[len(prefix.strip):]
+        return form
+
+    def forms(self, stem: str) -> Set[str]:
+        """
+        Generate every surface form of a stem.
+        
+        Args:
+            stem: A known stem
+        
+        Returns:
+            The stem and all its inflected forms
+        """
+        result = {stem}
+        flags = self.stems.get(stem, '')
+        rules = [rule for flag in flags for rule in self.flags.get(flag, ()) if rule.accepts(stem)]
+        suffixes = [rule for rule in rules if rule.kind == 'SFX']
+        for rule in rules:
+            form = rule.apply(stem)
+            result.add(form)
+            if rule.kind == 'PFX' and rule.cross_product:
+                for suffix in suffixes:
+                    if suffix.cross_product:
+                        result.add(rule.add + suffix.apply(stem)[len(rule.strip):])
+        return result
+
+    def expand(self) -> Iterator[str]:
+        """Generate the surface forms of every stem."""
+        for stem in self.stems:
+            yield from self.forms(stem)
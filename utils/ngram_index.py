@@ -0,0 +1,193 @@
+"""
+Character n-gram inverted index for Tigrigna suggestion candidates.
+Each word is padded with q - 1 boundary markers on both sides and split into
+its q-grams; every q-gram maps to a sorted run of word ids in one NumPy
+postings array. Two words within edit distance k share at least
+max(|x|, |y|) + q - 1 - k*q q-grams, since one edit destroys at most q of
+them, so a lookup merges the runs of the query's q-grams, counts how many
+each word shares and only checks the exact distance of words meeting that
+bound.
+"""
+
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .distances import bounded_edit_distance
+
+# Boundary markers padding each word, outside any Tigrigna text
+START_MARK = '\x02'
+END_MARK = '\x03'
+
+
+class NGramIndex:
+    """
+    A q-gram inverted index with count filtering in front of the exact
+    distance check.
+    """
+
+    # The count bound holds for any search radius
+    max_distance = float('inf')
+
+    def __init__(self, words: Iterable[str], distance: Optional[Callable[[str, str], float]] = None, q: int = 2,
+                 merge_size: int = 1024):
+        """
+        Build the index for a collection of words.
+        
+        Args:
+            words: Dictionary words to index
+            distance: Function used to verify the distance of each candidate;
+                None uses the banded Levenshtein distance, which stops as
+                soon as the lookup's max_distance is exceeded
+            q: Length of the character grams
+            merge_size: Number of added words kept outside the postings
+                before the index is rebuilt
+        """
+        self.q = q
+        self.distance = distance
+        self.merge_size = merge_size
+        self.words: List[str] = []
+        # Added words, checked directly until the next rebuild
+        self.pending: List[str] = []
+        self.known: Set[str] = set()
+        # Distance evaluations made by lookups, for measuring pruning
+        self.comparisons = 0
+        self.build(words)
+
+    def __len__(self) -> int:
+        return len(self.words) + len(self.pending)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.known
+
+    def grams(self, word: str) -> List[str]:
+        """
+        Split a word into its padded q-grams.
+        
+        A q-gram occurring more than once is numbered from its second
+        occurrence on, so shared entries count the multiset intersection.
+        
+        Args:
+            word: The word to split
+        
+        Returns:
+            List of distinct q-gram keys
+        """
+        q = self.q
+        padded = START_MARK * (q - 1) + word + END_MARK * (q - 1)
+        seen: Dict[str, int] = {}
+        result = []
+        for i in range(len(padded) - q + 1):
+            gram = padded[i:i + q]
+            occurrence = seen.get(gram, 0)
+            seen[gram] = occurrence + 1
+            result.append(gram if not occurrence else f"{gram}\0{occurrence}")
+        return result
+
+    def build(self, words: Iterable[str]) -> None:
+        """
+        Rebuild the postings from a collection of words and the pending ones.
+        
+        The new arrays are built aside and then replace the old ones, which
+        lookups only ever read.
+        
+        Args:
+            words: Dictionary words to index
+        """
+        self.known.update(words)
+        self.known.update(self.pending)
+        # Ids follow length order, so the words of one length form a range
+        words = sorted(self.known, key=lambda w: (len(w), w))
+        gram_ids: Dict[str, int] = {}
+        gram_column = array('I')
+        id_column = array('I')
+        for word_id, word in enumerate(words):
+            for gram in self.grams(word):
+                gram_column.append(gram_ids.setdefault(gram, len(gram_ids)))
+                id_column.append(word_id)
+        grams = np.frombuffer(gram_column, dtype=np.uint32)
+        # A stable sort keeps each run of word ids in increasing order
+        order = np.argsort(grams, kind='stable')
+        postings = np.frombuffer(id_column, dtype=np.uint32)[order]
+        starts = np.zeros(len(gram_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(grams, minlength=len(gram_ids)), out=starts[1:])
+        lengths = np.fromiter((len(word) for word in words), dtype=np.int64, count=len(words))
+        longest = int(lengths[-1]) if len(words) else 0
+        # offsets[n] is the first id of a word longer than n - 1
+        offsets = np.searchsorted(lengths, np.arange(longest + 2), side='left')
+        self.words, self.gram_ids, self.postings, self.starts = words, gram_ids, postings, starts
+        self.lengths, self.offsets = lengths, offsets
+        self.pending = []
+
+    def add(self, word: str) -> None:
+        """
+        Add a word; the postings are rebuilt here once merge_size words are
+        pending, never by a lookup.
+        
+        Args:
+            word: The word to add
+        """
+        if word in self.known:
+            return
+        self.known.add(word)
+        self.pending.append(word)
+        if len(self.pending) >= self.merge_size:
+            self.build(())
+
+    def candidate_ids(self, word: str, max_distance: int) -> np.ndarray:
+        """
+        Find ids of indexed words that pass the length and q-gram count filters.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum edit distance
+        
+        Returns:
+            Sorted array of word ids, a superset of the matches
+        """
+        q, k = self.q, max_distance
+        query = self.grams(word)
+        runs = [self.postings[self.starts[gram_id]:self.starts[gram_id + 1]]
+                for gram_id in (self.gram_ids.get(gram) for gram in query) if gram_id is not None]
+        if runs:
+            ids, shared = np.unique(np.concatenate(runs), return_counts=True)
+        else:
+            ids = shared = np.empty(0, dtype=np.int64)
+        lengths = self.lengths[ids]
+        needed = np.maximum(len(query), lengths + q - 1) - k * q
+        ids = ids[(np.abs(lengths - len(word)) <= k) & (shared >= needed)]
+
+        # Where the bound falls to zero, words sharing no q-gram qualify too
+        unbounded = [np.arange(self.offsets[length], self.offsets[length + 1])
+                     for length in range(max(0, len(word) - k), min(len(word) + k, len(self.offsets) - 2) + 1)
+                     if max(len(query), length + q - 1) - k * q <= 0]
+        if unbounded:
+            ids = np.union1d(ids, np.concatenate(unbounded))
+        return ids
+
+    def lookup(self, word: str, max_distance: float) -> List[Tuple[str, float]]:
+        """
+        Find all indexed words within ``max_distance`` of a word.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum edit distance
+        
+        Returns:
+            Unordered list of (word, distance) pairs
+        """
+        bound = int(max_distance)
+        candidates = [self.words[word_id] for word_id in self.candidate_ids(word, bound).tolist()]
+        candidates.extend(candidate for candidate in self.pending if abs(len(candidate) - len(word)) <= bound)
+
+        results = []
+        for candidate in candidates:
+            if self.distance is None:
+                distance = bounded_edit_distance(word, candidate, bound)
+            else:
+                distance = self.distance(word, candidate)
+            self.comparisons += 1
+            if distance <= max_distance:
+                results.append((candidate, distance))
+        return results
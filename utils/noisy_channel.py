@@ -0,0 +1,380 @@
+"""
+Noisy-channel ranking of spelling suggestions.
+A candidate w for a typed word t is scored by log P(w) + log P(t | w). The
+prior P(w) comes from the corpus frequencies the dictionary carries, and
+the channel P(t | w) from a per-character confusion matrix: the cost of
+the likeliest alignment of t against w, with substitution, insertion and
+deletion costs taken from dense arrays. Both are NumPy arrays, so all
+candidates of a query are scored together in one vectorised DP. The
+ranker only scores candidates; any retrieval engine can supply them.
+
+Train a confusion matrix from tab-separated ``typo<TAB>correction`` pairs with:
+    python -m utils.noisy_channel pairs.tsv channel.npz
+"""
+
+import argparse
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .fidel import DECOMPOSITION
+
+# Alphabet ids reserved for the empty string (padding) and unknown characters
+EMPTY_ID = 0
+OTHER_ID = 1
+
+# Default probability that an intended character is not typed as itself
+ERROR_RATE = 0.02
+
+# Shares of ERROR_RATE taken by the kinds of error in the default channel
+VOWEL_SHARE = 0.5
+SUBSTITUTION_SHARE = 0.3
+DELETION_SHARE = 0.2
+
+# Default probability of an extra character being typed at any position
+INSERTION_RATE = 0.004
+
+
+def align(intended: str, typed: str) -> List[Tuple[str, str]]:
+    """
+    Align two words along one of their cheapest Levenshtein edit paths.
+    
+    Args:
+        intended: The correct word
+        typed: The word as typed
+    
+    Returns:
+        List of (intended character, typed character) pairs, with '' on
+        the intended side for insertions and on the typed side for deletions
+    """
+    rows, columns = len(intended) + 1, len(typed) + 1
+    table = [[0] * columns for _ in range(rows)]
+    for i in range(rows):
+        table[i][0] = i
+    for j in range(columns):
+        table[0][j] = j
+    for i in range(1, rows):
+        for j in range(1, columns):
+            table[i][j] = min(table[i - 1][j] + 1, table[i][j - 1] + 1,
+                              table[i - 1][j - 1] + (intended[i - 1] != typed[j - 1]))
+    pairs = []
+    i, j = len(intended), len(typed)
+    while i or j:
+        if i and j and table[i][j] == table[i - 1][j - 1] + (intended[i - 1] != typed[j - 1]):
+            pairs.append((intended[i - 1], typed[j - 1]))
+            i, j = i - 1, j - 1
+        elif i and table[i][j] == table[i - 1][j] + 1:
+            pairs.append((intended[i - 1], ''))
+            i -= 1
+        else:
+            pairs.append(('', typed[j - 1]))
+            j -= 1
+    pairs.reverse()
+    return pairs
+
+
+class ChannelModel:
+    """
+    Per-character error costs, as negative log probabilities, over the fidel
+    alphabet.
+    """
+
+    def __init__(self, substitution: np.ndarray, insertion: np.ndarray, deletion: np.ndarray):
+        """
+        Wrap cost arrays indexed by alphabet id.
+        
+        Args:
+            substitution: substitution[x, y] is -log P(y typed | x intended);
+                the diagonal holds the cost of typing a character correctly
+            insertion: insertion[y] is -log P(y typed where nothing was intended)
+            deletion: deletion[x] is -log P(x intended but not typed)
+        """
+        self.alphabet = self.build_alphabet()
+        size = len(self.alphabet) + 2
+        if substitution.shape != (size, size) or insertion.shape != (size,) or deletion.shape != (size,):
+            raise ValueError(f"Channel arrays do not match an alphabet of {size} ids")
+        self.substitution = substitution.astype(np.float64)
+        self.insertion = insertion.astype(np.float64)
+        self.deletion = deletion.astype(np.float64)
+        # Padding costs nothing, so padded columns never change a row's score
+        self.substitution[EMPTY_ID, :] = 0
+        self.deletion[EMPTY_ID] = 0
+
+    @staticmethod
+    def build_alphabet() -> Dict[str, int]:
+        """Map every fidel syllable to its alphabet id, after the reserved ids."""
+        return {char: position + 2 for position, char in enumerate(DECOMPOSITION)}
+
+    @classmethod
+    def default(cls, error_rate: float = ERROR_RATE, insertion_rate: float = INSERTION_RATE) -> 'ChannelModel':
+        """
+        Build a channel from the shape of the fidel: a slip to another vowel
+        order of the same consonant is far likelier than one to an unrelated
+        syllable.
+        
+        Args:
+            error_rate: Probability that an intended character is mistyped or dropped
+            insertion_rate: Probability of an extra character at any position
+        
+        Returns:
+            The channel model
+        """
+        alphabet = cls.build_alphabet()
+        size = len(alphabet) + 2
+        consonants = np.full(size, -1, dtype=np.int64)
+        for char, char_id in alphabet.items():
+            consonants[char_id] = DECOMPOSITION[char][0]
+        siblings = consonants[:, None] == consonants[None, :]
+        siblings[consonants < 0, :] = False
+        np.fill_diagonal(siblings, False)
+        sibling_counts = np.maximum(siblings.sum(axis=1, keepdims=True), 1)
+        others = size - 1 - sibling_counts
+        probabilities = np.where(siblings, error_rate * VOWEL_SHARE / sibling_counts,
+                                 error_rate * SUBSTITUTION_SHARE / others)
+        np.fill_diagonal(probabilities, 1 - error_rate)
+        insertion = np.full(size, insertion_rate / (size - 1))
+        deletion = np.full(size, error_rate * DELETION_SHARE)
+        return cls(-np.log(probabilities), -np.log(insertion), -np.log(deletion))
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[str, str]], smoothing: float = 0.5) -> 'ChannelModel':
+        """
+        Estimate a channel from observed misspellings.
+        
+        Each pair is aligned and its character substitutions, insertions and
+        deletions counted; counts are smoothed so unseen errors keep a small
+        probability.
+        
+        Args:
+            pairs: (typed word, intended word) pairs
+            smoothing: Count added to every possible outcome
+        
+        Returns:
+            The channel model
+        """
+        alphabet = cls.build_alphabet()
+        size = len(alphabet) + 2
+        substitutions = np.zeros((size, size))
+        insertions = np.zeros(size)
+        deletions = np.zeros(size)
+        positions = 0
+        for typed, intended in pairs:
+            positions += len(intended) + 1
+            for x, y in align(intended, typed):
+                if not x:
+                    insertions[alphabet.get(y, OTHER_ID)] += 1
+                elif not y:
+                    deletions[alphabet.get(x, OTHER_ID)] += 1
+                else:
+                    substitutions[alphabet.get(x, OTHER_ID), alphabet.get(y, OTHER_ID)] += 1
+        # Every intended character is either typed as some character or dropped
+        totals = substitutions.sum(axis=1) + deletions + smoothing * (size + 1)
+        substitution = -np.log((substitutions + smoothing) / totals[:, None])
+        deletion = -np.log((deletions + smoothing) / totals)
+        insertion = -np.log((insertions + smoothing) / (positions + smoothing * size))
+        return cls(substitution, insertion, deletion)
+
+    @classmethod
+    def load(cls, path: str) -> 'ChannelModel':
+        """
+        Load a channel saved by save().
+        
+        Args:
+            path: Path of the .npz file
+        
+        Returns:
+            The channel model
+        """
+        with np.load(path) as arrays:
+            return cls(arrays['substitution'], arrays['insertion'], arrays['deletion'])
+
+    def save(self, path: str) -> None:
+        """
+        Save the cost arrays.
+        
+        Args:
+            path: Path of the .npz file to write
+        """
+        np.savez(path, substitution=self.substitution, insertion=self.insertion, deletion=self.deletion)
+
+    def encode(self, word: str) -> List[int]:
+        """Map the characters of a word to alphabet ids."""
+        return [self.alphabet.get(char, OTHER_ID) for char in word]
+
+    def costs(self, typed: str, candidates: Sequence[str]) -> np.ndarray:
+        """
+        Calculate -log P(typed | candidate) for many candidates at once.
+        
+        The weighted edit DP runs over one typed character at a time for
+        every candidate together. Deletions along a row are resolved with
+        a running minimum over prefix sums of the deletion costs, so no
+        Python loop runs over candidates or their characters.
+        
+        Args:
+            typed: The word as typed
+            candidates: Intended words to score
+        
+        Returns:
+            Array of costs, one per candidate
+        """
+        lengths = np.fromiter((len(word) for word in candidates), dtype=np.int64, count=len(candidates))
+        width = int(lengths.max()) if len(candidates) else 0
+        matrix = np.full((len(candidates), width), EMPTY_ID, dtype=np.int64)
+        for row, word in enumerate(candidates):
+            matrix[row, :len(word)] = self.encode(word)
+        # dropped[:, j] is the cost of deleting the first j characters of a candidate
+        dropped = np.zeros((len(candidates), width + 1))
+        np.cumsum(self.deletion[matrix], axis=1, out=dropped[:, 1:])
+        previous = dropped
+        for char_id in self.encode(typed):
+            inserted = self.insertion[char_id]
+            current = np.empty_like(previous)
+            current[:, 0] = previous[:, 0] + inserted
+            np.minimum(previous[:, :-1] + self.substitution[matrix, char_id], previous[:, 1:] + inserted,
+                       out=current[:, 1:])
+            # current[j] = min over k <= j of current[k] + dropped[j] - dropped[k]
+            current -= dropped
+            np.minimum.accumulate(current, axis=1, out=current)
+            current += dropped
+            previous = current
+        return previous[np.arange(len(candidates)), lengths]
+
+
+class NoisyChannelRanker:
+    """
+    Scores candidate corrections by corpus prior plus channel likelihood.
+    """
+
+    def __init__(self, frequencies: Dict[str, int], channel: Optional[ChannelModel] = None,
+                 smoothing: float = 1.0, vocabulary: Optional[int] = None):
+        """
+        Turn corpus counts into a dense array of log priors.
+        
+        Args:
+            frequencies: Word -> corpus count, as produced by corpus ingestion
+            channel: Channel model, the fidel-shaped default if None
+            smoothing: Count added to every word, so unseen words keep a prior
+            vocabulary: Number of words sharing the smoothing, if the
+                dictionary has words without a count
+        """
+        self.channel = channel or ChannelModel.default()
+        self.word_ids: Optional[Dict[str, int]] = {word: word_id for word_id, word in enumerate(frequencies)}
+        # Finds word ids instead of word_ids, -1 for words without a count
+        self.find: Optional[Callable[[str], int]] = None
+        counts = np.fromiter(frequencies.values(), dtype=np.float64, count=len(frequencies))
+        self.log_priors = self.prior_table(counts, smoothing, vocabulary)
+
+    @staticmethod
+    def prior_table(counts: np.ndarray, smoothing: float, vocabulary: Optional[int] = None) -> np.ndarray:
+        """
+        Smooth counts into log priors by word id.
+        
+        Args:
+            counts: Corpus count of each word id
+            smoothing: Count added to every word
+            vocabulary: Number of words sharing the smoothing, len(counts) if None
+        
+        Returns:
+            Array of log priors; the last entry, at id -1, is the prior of a word without a count
+        """
+        if vocabulary is None:
+            vocabulary = len(counts)
+        total = counts.sum(dtype=np.float64) + smoothing * (vocabulary + 1)
+        return np.log(np.append(counts + smoothing, smoothing) / total)
+
+    @classmethod
+    def from_counts(cls, counts: np.ndarray, find: Callable[[str], int], channel: Optional[ChannelModel] = None,
+                    smoothing: float = 1.0, vocabulary: Optional[int] = None) -> 'NoisyChannelRanker':
+        """
+        Take priors from an array of counts by word id, such as the frequency
+        table of a memory-mapped compiled dictionary, without a word -> id map.
+        
+        Args:
+            counts: Corpus count of each word id
+            find: Function giving a word's id, -1 if it has none
+            channel: Channel model, the fidel-shaped default if None
+            smoothing: Count added to every word, so unseen words keep a prior
+            vocabulary: Number of words sharing the smoothing, len(counts) if None
+        
+        Returns:
+            The ranker
+        """
+        ranker = cls({}, channel)
+        ranker.word_ids = None
+        ranker.find = find
+        ranker.log_priors = cls.prior_table(counts.astype(np.float64), smoothing, vocabulary)
+        return ranker
+
+    def scores(self, typed: str, candidates: Sequence[str]) -> np.ndarray:
+        """
+        Calculate log P(candidate) + log P(typed | candidate).
+        
+        Args:
+            typed: The word as typed
+            candidates: Candidate corrections
+        
+        Returns:
+            Array of log scores, one per candidate
+        """
+        if self.word_ids is not None:
+            ids = (self.word_ids.get(word, -1) for word in candidates)
+        else:
+            ids = map(self.find, candidates)
+        # Gathered in one step; id -1 selects the prior of a word without a count
+        log_priors = self.log_priors[np.fromiter(ids, dtype=np.intp, count=len(candidates))]
+        return log_priors - self.channel.costs(typed, candidates)
+
+    def rank(self, typed: str, candidates: Sequence[str], limit: Optional[int] = None) -> List[str]:
+        """
+        Order candidates from most to least probable, ties alphabetically.
+        
+        Args:
+            typed: The word as typed
+            candidates: Candidate corrections
+            limit: Maximum number of candidates to return
+        
+        Returns:
+            The ranked candidates
+        """
+        if not candidates:
+            return []
+        candidates = sorted(candidates)
+        # A stable sort keeps the alphabetical order among equal scores
+        order = np.argsort(-self.scores(typed, candidates), kind='stable')
+        return [candidates[i] for i in order[:limit].tolist()]
+
+
+def read_pairs(path: str) -> List[Tuple[str, str]]:
+    """
+    Read tab-separated (typo, correction) pairs, one per line.
+    
+    Args:
+        path: Path of the pairs file
+    
+    Returns:
+        List of (typo, correction) pairs
+    """
+    pairs = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            fields = line.strip().split('\t')
+            if len(fields) >= 2 and fields[0] and fields[1]:
+                pairs.append((fields[0], fields[1]))
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train a noisy-channel confusion matrix from misspelling pairs.")
+    parser.add_argument('pairs', help="file of tab-separated typo and correction pairs")
+    parser.add_argument('output', help="channel file (.npz) to write")
+    parser.add_argument('--smoothing', type=float, default=0.5, help="count added to every outcome")
+    args = parser.parse_args()
+
+    pairs = read_pairs(args.pairs)
+    channel = ChannelModel.from_pairs(pairs, args.smoothing)
+    channel.save(args.output)
+    print(f"Wrote a channel trained on {len(pairs)} pairs to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
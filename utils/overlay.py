@@ -0,0 +1,105 @@
+"""
+Copy-on-write overlays of words added to a hot-reloaded dictionary.
+A snapshot that gains a few words shares the word set and suggestion index
+of the snapshot it was copied from, which are never modified again, and
+keeps the added words in a small set of its own. Membership tests and
+lookups check both. The spell checker merges the overlay into new base
+structures once it grows past a size, so adding a word costs a copy of the
+overlay instead of a rebuild of the index.
+"""
+
+from typing import Callable, Iterator, List, Optional, Set, Tuple
+
+try:
+    from .distances import bounded_edit_distance
+except ImportError:
+    # Imported from a module run directly as a script
+    from distances import bounded_edit_distance
+
+
+class OverlayWords:
+    """
+    A shared, read-only collection of words plus a small set of added words,
+    behaving like a set of both.
+    """
+
+    def __init__(self, base, added: Set[str]):
+        """
+        Layer added words over a base collection.
+        
+        Args:
+            base: Set-like collection of words that is no longer modified
+            added: Words missing from the base, owned by this overlay
+        """
+        self.base = base
+        self.added = added
+
+    def __len__(self) -> int:
+        return len(self.base) + len(self.added)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.added or word in self.base
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base
+        yield from self.added
+
+    def add(self, word: str) -> None:
+        """
+        Add a word to the overlay.
+        
+        Args:
+            word: The word to add
+        """
+        if word not in self:
+            self.added.add(word)
+
+
+class OverlayIndex:
+    """
+    Suggestion lookups over a shared, read-only index plus a linear scan of
+    the words added on top of it.
+    """
+
+    def __init__(self, base, added: Set[str], distance: Optional[Callable[[str, str], float]] = None):
+        """
+        Layer added words over a suggestion index.
+        
+        Args:
+            base: Index of any engine; its lookups must not include the added words
+            added: Words missing from the base index, usually the added set of
+                the snapshot's OverlayWords
+            distance: Distance of the base index's engine, used to measure the
+                added words; None selects the banded edit distance
+        """
+        self.base = base
+        self.added = added
+        self.distance = distance
+        self.max_distance = base.max_distance
+
+    def add(self, word: str) -> None:
+        self.added.add(word)
+
+    def lookup(self, word: str, max_distance: float) -> List[Tuple[str, float]]:
+        """
+        Find all words within ``max_distance`` of a word.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum distance, at most the base index's max_distance
+        
+        Returns:
+            Unordered list of (word, distance) pairs
+        """
+        results = self.base.lookup(word, max_distance)
+        for candidate in self.added:
+            if self.distance is None:
+                # Every inserted or deleted character costs at least one edit
+                if abs(len(candidate) - len(word)) > max_distance:
+                    continue
+                distance = bounded_edit_distance(word, candidate, int(max_distance))
+            else:
+                distance = self.distance(word, candidate)
+            if distance <= max_distance:
+                results.append((candidate, distance))
+        return results
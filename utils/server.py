@@ -0,0 +1,200 @@
+"""
+HTTP/JSON service around one long-lived TigrignaSpellChecker, so other
+processes can check text without loading the dictionary and building an
+index themselves. Uses only the standard library.
+
+Start it with:
+    python -m utils.server --dictionary data/tigrigna_words.txt --port 8765
+
+Every endpoint takes a POST with a JSON body holding a batch:
+    /check       {"documents": ["..."]}                      -> {"results": [{word: [suggestions]}]}
+    /suggest     {"words": ["..."], "max_distance": 2,
+                  "max_suggestions": 5}                      -> {"results": [[suggestions]]}
+    /statistics  {"documents": ["..."]}                      -> {"results": [{statistics}]}
+    /complete    {"prefixes": ["..."], "k": 10}              -> {"results": [[completions]]}
+and GET /health reports the dictionary size and engine. With --watch the
+dictionary is hot-reloaded when it changes; each request is answered from
+one dictionary snapshot. Connections are
+kept alive (HTTP/1.1), and each connection is served by a thread from a
+fixed pool, so the pool size bounds the number of concurrent clients.
+"""
+
+import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+from .hot_reload import HotReloader
+from .spell_checker import SUGGESTION_ENGINES, SUGGESTION_RANKINGS, TigrignaSpellChecker
+
+# Largest request body accepted, in bytes
+MAX_BODY_SIZE = 16 << 20
+
+
+class PooledHTTPServer(HTTPServer):
+    """
+    HTTPServer that handles each connection on a fixed thread pool instead of
+    starting a new thread per connection.
+    """
+
+    def __init__(self, address, handler, checker: TigrignaSpellChecker, workers: int = 8,
+                 watch_interval: Optional[float] = None):
+        super().__init__(address, handler)
+        self.reloader = HotReloader(checker, watch_interval)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tigrigna-http')
+
+    def process_request(self, request, client_address) -> None:
+        self.executor.submit(self.process_request_worker, request, client_address)
+
+    def process_request_worker(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.reloader.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SpellCheckHandler(BaseHTTPRequestHandler):
+    """Routes JSON batches to the server's checker."""
+
+    protocol_version = 'HTTP/1.1'
+    # Close idle keep-alive connections so they do not hold a pool thread forever
+    timeout = 30
+
+    def handle_check(self, body: Dict[str, Any]) -> List[Any]:
+        return [self.checker.check_text(text) for text in self.batch(body, 'documents')]
+
+    def handle_suggest(self, body: Dict[str, Any]) -> List[Any]:
+        max_distance = int(body.get('max_distance', 2))
+        max_suggestions = int(body.get('max_suggestions', 5))
+        return [self.checker.generate_suggestions(word, max_distance, max_suggestions)
+                for word in self.batch(body, 'words')]
+
+    def handle_statistics(self, body: Dict[str, Any]) -> List[Any]:
+        return [self.checker.get_statistics(text) for text in self.batch(body, 'documents')]
+
+    def handle_complete(self, body: Dict[str, Any]) -> List[Any]:
+        k = int(body.get('k', 10))
+        return [self.checker.complete(prefix, k) for prefix in self.batch(body, 'prefixes')]
+
+    ROUTES: Dict[str, Callable] = {
+        '/check': handle_check,
+        '/suggest': handle_suggest,
+        '/statistics': handle_statistics,
+        '/complete': handle_complete,
+    }
+
+    @staticmethod
+    def batch(body: Dict[str, Any], key: str) -> List[str]:
+        """
+        Get the batch of strings from a request body.
+        
+        Args:
+            body: Decoded JSON body
+            key: Name of the batch field
+        
+        Returns:
+            The list of strings
+        """
+        items = body.get(key)
+        if not isinstance(items, list) or not all(isinstance(item, str) for item in items):
+            raise ValueError(f"'{key}' must be a list of strings")
+        return items
+
+    def do_GET(self) -> None:
+        if self.path != '/health':
+            self.send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+            return
+        checker = self.server.reloader.checker
+        self.send_json(200, {'words': len(checker.word_dict), 'engine': checker.engine})
+
+    def do_POST(self) -> None:
+        route = self.ROUTES.get(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_SIZE:
+            self.send_json(413, {'error': "Request body too large"})
+            self.close_connection = True
+            return
+        raw = self.rfile.read(length)
+        if route is None:
+            self.send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+            return
+        # One snapshot for the whole batch, even if a reload swaps it meanwhile
+        self.checker = self.server.reloader.checker
+        try:
+            body = json.loads(raw or b'{}')
+            if not isinstance(body, dict):
+                raise ValueError("Request body must be a JSON object")
+            results = route(self, body)
+        except (ValueError, TypeError) as e:
+            self.send_json(400, {'error': str(e)})
+            return
+        self.send_json(200, {'results': results})
+
+    def send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        # Per-request logging costs more than checking a short document
+        pass
+
+
+def create_server(checker: TigrignaSpellChecker, host: str = '127.0.0.1', port: int = 8765,
+                  workers: int = 8, watch_interval: Optional[float] = None) -> PooledHTTPServer:
+    """
+    Create a server for an already loaded checker.
+    
+    Args:
+        checker: The checker to serve
+        host: Interface to bind
+        port: Port to bind, 0 picks a free one
+        workers: Number of connections served concurrently
+        watch_interval: Seconds between checks for dictionary changes, None disables reloading
+    
+    Returns:
+        The server; call serve_forever() to run it
+    """
+    return PooledHTTPServer((host, port), SpellCheckHandler, checker, workers, watch_interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Tigrigna spell checker over HTTP/JSON.")
+    parser.add_argument('--dictionary', help="text or compiled dictionary to load")
+    parser.add_argument('--engine', default='linear', choices=SUGGESTION_ENGINES, help="suggestion engine")
+    parser.add_argument('--vowel-cost', type=float, default=1,
+                        help="cost of a vowel-order change for the batch engine")
+    parser.add_argument('--ranking', default='distance', choices=SUGGESTION_RANKINGS, help="suggestion ranking")
+    parser.add_argument('--host', default='127.0.0.1', help="interface to bind")
+    parser.add_argument('--port', type=int, default=8765, help="port to bind")
+    parser.add_argument('--workers', type=int, default=8, help="connections served concurrently")
+    parser.add_argument('--watch', type=float, metavar='SECONDS', help="reload the dictionary when it changes")
+    args = parser.parse_args()
+
+    checker = TigrignaSpellChecker(args.dictionary, engine=args.engine, ranking=args.ranking,
+                                   vowel_cost=args.vowel_cost)
+    # Build lazily created structures now instead of on the first request
+    checker.complete(next(iter(checker.word_dict), '')[:1])
+    server = create_server(checker, args.host, args.port, args.workers, args.watch)
+    print(f"Serving on http://{args.host}:{server.server_address[1]} with {args.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
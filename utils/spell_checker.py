@@ -3,10 +3,102 @@ Tigrigna Spell Checker Utility Functions
 This module contains the core functionality for Tigrigna spell checking.
 """
 
-import re
+import copy
 import os
-from collections import Counter
-from typing import List, Dict, Set, Tuple, Optional
+import hashlib
+import multiprocessing
+import pickle
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Dict, Set, Tuple, Optional, Union
+
+import numpy as np
+
+from .append_log import WordLog, read_log
+from .autocomplete import CompletionTrie
+from .batch import BatchIndex
+from .binary_dictionary import ADDED_SUFFIX, BinaryDictionary, BinarySuggestionIndex, is_binary_dictionary
+from .bktree import BKTree
+from .dawg import DAWG
+from .distances import bounded_edit_distance
+from .fidel import fidel_edit_distance
+from .language_model import LanguageModel
+from .morphology import AffixModel
+from .ngram_index import NGramIndex
+from .noisy_channel import ChannelModel, NoisyChannelRanker
+from .overlay import OverlayIndex, OverlayWords
+from .suggestion_cache import SuggestionCache
+from .symspell import SymSpellIndex
+from .tokenizer import sentences, tokenize
+
+# Candidate retrieval engines accepted by TigrignaSpellChecker
+SUGGESTION_ENGINES = ('linear', 'symspell', 'bktree', 'batch', 'dawg', 'ngram')
+
+# Index types built for the engines
+SuggestionIndex = Union[SymSpellIndex, BKTree, BatchIndex, BinarySuggestionIndex, DAWG, NGramIndex]
+
+# Orderings of retrieved candidates accepted by TigrignaSpellChecker
+SUGGESTION_RANKINGS = ('distance', 'noisy_channel')
+
+# log10 margin by which a close alternative must be likelier in context
+# before a correctly spelled word is flagged as a real-word error
+REAL_WORD_MARGIN = 2.0
+
+# Bumped whenever the layout of persisted index caches changes
+INDEX_CACHE_VERSION = 1
+
+# Words an extended() snapshot keeps in its overlay before they are merged
+# into a rebuilt word set and index
+OVERLAY_MERGE_SIZE = 512
+
+# Checker inherited by forked check_many workers, so the dictionary and
+# index are shared copy-on-write instead of pickled per task
+_shared_checker = None
+
+
+def _suggest_words(words: List[str], max_distance: int, max_suggestions: int) -> List[List[str]]:
+    """Generate suggestions for a slice of words in a check_many worker."""
+    return [_shared_checker.generate_suggestions(word, max_distance, max_suggestions) for word in words]
+
+
+def _until(words: Iterable[str], deadline: float, step: int = 1024) -> Iterator[str]:
+    """Yield words until a time.perf_counter() deadline passes, reading the clock every step words."""
+    words = iter(words)
+    while time.perf_counter() < deadline:
+        chunk = list(islice(words, step))
+        if not chunk:
+            return
+        yield from chunk
+
+
+@dataclass
+class TextAnalysis:
+    """
+    Result of a single pass over a text: token counts, misspellings and the
+    statistics derived from them.
+    """
+
+    token_counts: Counter = field(default_factory=Counter)
+    misspellings: Dict[str, List[str]] = field(default_factory=dict)
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Get statistics about the analysed text.
+        
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'total_words': sum(self.token_counts.values()),
+            'unique_words': len(self.token_counts),
+            'misspelled_words': sum(self.token_counts[word] for word in self.misspellings),
+            'unique_misspelled': len(self.misspellings)
+        }
+
 
 class TigrignaSpellChecker:
     """
@@ -14,48 +106,512 @@ class TigrignaSpellChecker:
     and correction suggestions based on a dictionary of Tigrigna words.
     """
     
-    def __init__(self, dictionary_path: str = None):
+    def __init__(self, dictionary_path: str = None, engine: str = 'linear', index_max_distance: int = 2,
+                 distance: Optional[Callable[[str, str], float]] = None, cache_size: int = 1024,
+                 lazy: bool = False, index_cache: Optional[str] = None, durability: str = 'batch',
+                 affix_path: Optional[str] = None, ranking: str = 'distance',
+                 channel_path: Optional[str] = None, language_model: Optional[str] = None,
+                 context_budget: float = 0.01, vowel_cost: float = 1):
         """
         Initialize the spell checker with a dictionary of Tigrigna words.
         
         Args:
-            dictionary_path: Path to a file containing Tigrigna words, one per line
+            dictionary_path: Path to a file containing Tigrigna words, one per line,
+                or to a dictionary compiled with utils.binary_dictionary
+            engine: Candidate retrieval engine for suggestions, one of SUGGESTION_ENGINES
+            index_max_distance: Largest edit distance answered by the symspell index
+            distance: Distance used to rank suggestions, defaults to edit_distance.
+                The symspell and ngram engines only find every match for distances
+                that are never smaller than edit_distance; the bktree engine needs a metric.
+                The batch and dawg engines compute edit_distance, the batch
+                engine weighted by vowel_cost.
+            cache_size: Number of suggestion lists kept in the LRU cache, 0 disables it
+            lazy: Defer reading the dictionary until a word is first checked and
+                building the suggestion index until suggestions are first needed
+            index_cache: Path of a file persisting the parsed word set and the
+                suggestion index of a text dictionary; it is reused while the
+                dictionary's mtime or content hash is unchanged and rewritten otherwise
+            durability: When added words reach the disk, one of DURABILITY_MODES
+                in utils.append_log
+            affix_path: Hunspell-style affix file; the text dictionary then lists
+                stems as ``stem/FLAGS`` and inflected forms are recognised by
+                affix stripping instead of being listed (see utils.morphology).
+                Not supported with compiled dictionaries
+            ranking: How retrieved candidates are ordered, one of SUGGESTION_RANKINGS:
+                by distance, or by corpus frequency and a character confusion
+                model (see utils.noisy_channel)
+            channel_path: Confusion model saved by utils.noisy_channel for the
+                noisy_channel ranking, the fidel-shaped default if None
+            language_model: Compiled word n-gram model (see utils.language_model);
+                check_text then re-ranks suggestions by context and flags
+                correctly spelled words that are unlikely where they stand.
+                The linear engine is replaced by symspell for these checks
+            context_budget: Seconds of context checking allowed per sentence;
+                words not reached in time are judged in isolation
+            vowel_cost: Cost the batch engine gives a change of vowel order
+                within one consonant's syllables (see utils.fidel); 1 keeps
+                plain edit distance
         """
+        if engine not in SUGGESTION_ENGINES:
+            raise ValueError(f"Unknown suggestion engine '{engine}', expected one of {SUGGESTION_ENGINES}")
+        if language_model and engine == 'linear':
+            # Real-word checks retrieve candidates for every word of a text,
+            # which a scan of the whole dictionary cannot do within the budget
+            engine = 'symspell'
+        if engine in ('batch', 'dawg') and distance is not None:
+            raise ValueError(f"The {engine} engine computes edit_distance and cannot use a custom distance")
+        if vowel_cost != 1 and engine != 'batch':
+            raise ValueError("Only the batch engine computes a vowel-aware distance")
+        if ranking not in SUGGESTION_RANKINGS:
+            raise ValueError(f"Unknown suggestion ranking '{ranking}', expected one of {SUGGESTION_RANKINGS}")
         self.dictionary_path = dictionary_path or os.path.join(os.path.dirname(os.path.dirname(__file__)), 
                                                             'data', 'tigrigna_words.txt')
-        self.word_dict: Set[str] = set()
-        self.load_dictionary()
-        
+        if affix_path and is_binary_dictionary(self.dictionary_path):
+            raise ValueError("Compiled dictionaries store no stem flags; use affix_path with a text dictionary")
+        self.engine = engine
+        self.index_max_distance = index_max_distance
+        self.distance = distance or self.edit_distance
+        self.vowel_cost = vowel_cost
+        self.lazy = lazy
+        self.index_cache = index_cache
+        self.affix_path = affix_path
+        # Word sets and indexes hold stems; affix rules produce the inflected forms
+        self.morphology: Optional[AffixModel] = AffixModel.from_file(affix_path) if affix_path else None
+        self.ranking = ranking
+        self.channel_path = channel_path
+        # Built on the first noisy_channel ranking
+        self.ranker: Optional[NoisyChannelRanker] = None
+        self.language_model_path = language_model
+        self.language_model: Optional[LanguageModel] = LanguageModel(language_model) if language_model else None
+        self.context_budget = context_budget
+        # Loaded and built on first access through the word_dict and index properties
+        self._word_dict: Optional[Union[Set[str], BinaryDictionary, DAWG]] = None
+        self._index: Optional[SuggestionIndex] = None
+        self.index_built = False
+        # Pickled index from the index cache, unpickled on first use
+        self.cached_index: Optional[bytes] = None
+        # Fingerprint of the dictionary files taken before they were last read
+        self.loaded_fingerprint: Optional[Tuple[int, int, int, int]] = None
+        # Corpus counts from frequency dictionaries; compiled dictionaries store their own
+        self.frequencies: Dict[str, int] = {}
+        # Built on the first call to complete()
+        self.completions: Optional[CompletionTrie] = None
+        # Bumped on every dictionary change so cached suggestions go stale
+        self.dictionary_version = 0
+        self.cache = SuggestionCache(cache_size) if cache_size > 0 else None
+        # Added words go to an append log that is compacted into the dictionary
+        self.word_log = WordLog(self.dictionary_path, durability)
+        if not lazy:
+            self.load_dictionary()
+
+    @property
+    def word_dict(self) -> Union[Set[str], BinaryDictionary, DAWG, OverlayWords]:
+        """The dictionary words, loaded on first access."""
+        if self._word_dict is None:
+            self.load_dictionary()
+        return self._word_dict
+
+    @word_dict.setter
+    def word_dict(self, words: Union[Set[str], BinaryDictionary, DAWG, OverlayWords]) -> None:
+        self._word_dict = words
+
+    @property
+    def compiled(self) -> Optional[BinaryDictionary]:
+        """The compiled dictionary the words come from, None for a text dictionary."""
+        words = self.word_dict
+        if isinstance(words, OverlayWords):
+            words = words.base
+        return words if isinstance(words, BinaryDictionary) else None
+
+    @property
+    def index(self) -> Optional[SuggestionIndex]:
+        """The suggestion index of the configured engine, built on first access."""
+        if not self.index_built:
+            if self.cached_index is not None:
+                self.restore_cached_index()
+            else:
+                self.build_index()
+                if self._index is not None:
+                    self.save_index_cache()
+        return self._index
+
+    @index.setter
+    def index(self, index: Optional[SuggestionIndex]) -> None:
+        self._index = index
+        self.index_built = True
+
     def load_dictionary(self) -> None:
         """Load the Tigrigna dictionary from file."""
+        self.index_built = False
+        self.cached_index = None
+        cached = False
+        if self.morphology is not None:
+            # Stems come from the file alone; a copy leaves snapshots sharing the old model intact
+            self.morphology = copy.copy(self.morphology)
+            self.morphology.set_stems({})
+        try:
+            # Taken before reading, so changes made while reading show as a mismatch
+            self.loaded_fingerprint = self.dictionary_fingerprint()
+        except OSError:
+            self.loaded_fingerprint = None
         try:
-            with open(self.dictionary_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                self.word_dict = {line.strip() for line in lines if line.strip()}
-            print(f"Loaded {len(self.word_dict)} Tigrigna words from dictionary.")
+            if is_binary_dictionary(self.dictionary_path):
+                # Memory-mapped, so nothing is parsed up front
+                self.word_dict = BinaryDictionary(self.dictionary_path)
+            elif self.load_index_cache():
+                cached = True
+            else:
+                word_dict, frequencies = set(), {}
+                with open(self.dictionary_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        # Frequency dictionaries carry a tab-separated count after the word
+                        word, _, count = line.strip().partition('\t')
+                        if self.morphology is not None:
+                            word, _, flags = word.partition('/')
+                            if word:
+                                self.morphology.add_stem(word, flags)
+                        if word:
+                            word_dict.add(word)
+                            if count.isdigit():
+                                frequencies[word] = int(count)
+                # Words added since the last compaction
+                logged = read_log(self.dictionary_path)
+                word_dict.update(logged)
+                if self.morphology is not None:
+                    for word in logged:
+                        self.morphology.add_stem(word)
+                self.word_dict, self.frequencies = word_dict, frequencies
+            if not cached:
+                print(f"Loaded {len(self.word_dict)} Tigrigna words from dictionary.")
         except FileNotFoundError:
             print(f"Dictionary file not found at: {self.dictionary_path}")
             self.word_dict = set()
         except Exception as e:
             print(f"Error loading dictionary: {str(e)}")
             self.word_dict = set()
+        self.completions = None
+        self.ranker = None
+        self.dictionary_version += 1
+        if not self.lazy:
+            # Restores the cached index, or builds and persists a new one
+            self.index
+        if not cached and self._index is None:
+            # Persist the parsed words now; an index is persisted once it is built
+            self.save_index_cache()
+
+    def dictionary_fingerprint(self) -> Tuple[int, int, int, int]:
+        """
+        Get the size and modification time of the dictionary file and its append log.
+        
+        Returns:
+            Tuple of sizes in bytes and mtimes in nanoseconds, 0 for a missing log
+        """
+        stat = os.stat(self.dictionary_path)
+        try:
+            log = os.stat(self.dictionary_path + ADDED_SUFFIX)
+        except FileNotFoundError:
+            return stat.st_size, stat.st_mtime_ns, 0, 0
+        return stat.st_size, stat.st_mtime_ns, log.st_size, log.st_mtime_ns
+
+    def dictionary_digest(self) -> str:
+        """
+        Hash the contents of the dictionary file and its append log.
+        
+        Returns:
+            Hex BLAKE2b digest
+        """
+        digest = hashlib.blake2b()
+        with open(self.dictionary_path, 'rb') as f:
+            digest.update(hashlib.file_digest(f, 'blake2b').digest())
+        for word in read_log(self.dictionary_path):
+            digest.update(word.encode('utf-8') + b'\n')
+        return digest.hexdigest()
+
+    def index_distance(self) -> Optional[Callable[[str, str], float]]:
+        """The distance handed to verifying indexes; None selects their banded edit distance."""
+        return None if self.distance == self.edit_distance else self.distance
+
+    def cacheable_index(self) -> bool:
+        """Whether the index can be persisted: custom distance functions are not pickled."""
+        return self.distance == self.edit_distance
+
+    def load_index_cache(self) -> bool:
+        """
+        Restore the word set and index from the index cache if it is still valid.
+        
+        The cache is valid when the dictionary's size and mtime match, or,
+        if only the mtime changed, when its content hash matches.
+        
+        Returns:
+            True if the cache was used
+        """
+        if not self.index_cache or not os.path.exists(self.index_cache):
+            return False
+        try:
+            with open(self.index_cache, 'rb') as f:
+                payload = pickle.load(f)
+            if payload.get('version') != INDEX_CACHE_VERSION:
+                return False
+            if payload['fingerprint'] != self.dictionary_fingerprint():
+                if payload['digest'] != self.dictionary_digest():
+                    return False
+        except Exception as e:
+            print(f"Ignoring unreadable index cache: {str(e)}")
+            return False
 
-    def add_to_dictionary(self, word: str) -> None:
+        if self.morphology is not None:
+            if payload['stems'] is None:
+                return False
+            self.morphology.set_stems(payload['stems'])
+        self.frequencies = payload['frequencies']
+        if (payload['index'] is not None and payload['engine'] == self.engine
+                and payload['index_max_distance'] == self.index_max_distance
+                and payload.get('vowel_cost', 1) == self.vowel_cost and self.cacheable_index()):
+            self.cached_index = payload['index']
+        if payload['words'] is not None:
+            self.word_dict = payload['words']
+        elif self.cached_index is not None:
+            # The DAWG engine stores no separate word set
+            self.restore_cached_index()
+        else:
+            return False
+        print(f"Loaded {len(self.word_dict)} Tigrigna words from index cache.")
+        return True
+
+    def restore_cached_index(self) -> None:
+        """Unpickle the index read from the index cache."""
+        index = pickle.loads(self.cached_index)
+        self.cached_index = None
+        if isinstance(index, BKTree):
+            index.distance = self.distance
+        elif hasattr(index, 'distance'):
+            index.distance = self.index_distance()
+        self.index = index
+        if self.engine == 'dawg':
+            self.word_dict = index
+
+    def save_index_cache(self) -> None:
+        """
+        Persist the word set and, once built, the index of a text dictionary.
+        
+        Nothing is saved if the dictionary files changed since they were read,
+        since the cache would then be stamped valid for words it lacks.
+        """
+        if not self.index_cache or isinstance(self._word_dict, (type(None), BinaryDictionary, OverlayWords)):
+            return
+        try:
+            fingerprint = self.dictionary_fingerprint()
+            if fingerprint != self.loaded_fingerprint:
+                return
+            digest = self.dictionary_digest()
+        except OSError:
+            return
+        index = self._index if self.index_built and self.cacheable_index() else None
+        payload = {
+            'version': INDEX_CACHE_VERSION,
+            'fingerprint': fingerprint,
+            'digest': digest,
+            'engine': self.engine,
+            'index_max_distance': self.index_max_distance,
+            'vowel_cost': self.vowel_cost,
+            'words': None if isinstance(self._word_dict, DAWG) else self._word_dict,
+            'frequencies': self.frequencies,
+            'stems': self.morphology.stems if self.morphology is not None else None,
+            'index': None,
+        }
+        temporary = f"{self.index_cache}.tmp{os.getpid()}"
+        distance = getattr(index, 'distance', None)
+        try:
+            if index is not None:
+                # The bound distance method would pickle the whole checker
+                if distance is not None:
+                    index.distance = None
+                # Pickled separately so lazy checkers unpickle it only when needed
+                payload['index'] = pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(temporary, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self.index_cache)
+        except Exception as e:
+            print(f"Could not save index cache: {str(e)}")
+            if os.path.exists(temporary):
+                os.remove(temporary)
+        finally:
+            if distance is not None:
+                index.distance = distance
+
+    def build_index(self) -> None:
+        """Build the suggestion index for the configured engine."""
+        if (self.engine == 'symspell' and isinstance(self.word_dict, BinaryDictionary)
+                and self.index_max_distance <= self.word_dict.max_distance):
+            # Use the deletion index stored in the compiled dictionary
+            self.index = self.word_dict.suggestion_index(self.index_distance())
+        elif self.engine == 'symspell':
+            self.index = SymSpellIndex(self.word_dict, self.index_distance(), self.index_max_distance)
+        elif self.engine == 'bktree':
+            self.index = BKTree(self.word_dict, self.distance)
+        elif self.engine == 'batch':
+            self.index = BatchIndex(self.word_dict, self.vowel_cost)
+        elif self.engine == 'ngram':
+            self.index = NGramIndex(self.word_dict, self.index_distance())
+        elif self.engine == 'dawg':
+            self.index = DAWG(self.word_dict)
+            # The graph replaces a text word set for membership as well; a
+            # compiled dictionary stays, as it also holds the frequencies
+            if not isinstance(self.word_dict, BinaryDictionary):
+                self.word_dict = self.index
+        else:
+            self.index = None
+
+    def reloaded(self) -> 'TigrignaSpellChecker':
+        """
+        Build a new checker with the same options from the current dictionary
+        files, leaving this one untouched for readers still using it.
+        
+        Returns:
+            A fully built checker sharing this checker's append log
+        """
+        self.word_log.flush()
+        checker = TigrignaSpellChecker(
+            self.dictionary_path, engine=self.engine, index_max_distance=self.index_max_distance,
+            distance=None if self.distance == self.edit_distance else self.distance,
+            cache_size=self.cache.maxsize if self.cache is not None else 0,
+            index_cache=self.index_cache, durability=self.word_log.durability, affix_path=self.affix_path,
+            ranking=self.ranking, channel_path=self.channel_path, language_model=self.language_model_path,
+            context_budget=self.context_budget, vowel_cost=self.vowel_cost)
+        checker.word_log.close()
+        checker.word_log = self.word_log
+        return checker
+
+    def extended(self, words: Iterable[str]) -> 'TigrignaSpellChecker':
+        """
+        Copy this checker with extra words, leaving this one untouched for
+        readers still using it.
+        
+        The copy shares this checker's word set, index and completion trie
+        and keeps the new words in an overlay of its own (see utils.overlay),
+        so a few added words cost a copy of the overlay rather than a rebuild.
+        Once the overlay holds OVERLAY_MERGE_SIZE words it is merged into a
+        new word set and index, built before the copy is returned.
+        
+        Args:
+            words: Words to add, already persisted to the append log
+        
+        Returns:
+            A fully built checker sharing this checker's append log
+        """
+        # Built here so that the copy can share it
+        index = self.index
+        words = [word for word in dict.fromkeys(word.strip() for word in words)
+                 if word and word not in self.word_dict]
+        checker = copy.copy(self)
+        checker.cache = SuggestionCache(self.cache.maxsize) if self.cache is not None else None
+        if not words:
+            return checker
+        base = self.word_dict
+        overlay = set(words)
+        if isinstance(base, OverlayWords):
+            overlay.update(base.added)
+            base = base.base
+            index = index.base if index is not None else None
+        checker.word_dict = OverlayWords(base, overlay)
+        checker.index = OverlayIndex(index, overlay, self.overlay_distance()) if index is not None else None
+        if self.completions is not None:
+            checker.completions = copy.copy(self.completions)
+            checker.completions.added = dict(self.completions.added)
+            for word in words:
+                checker.completions.add(word, self.word_frequency(word))
+        checker.dictionary_version += 1
+        if len(overlay) >= OVERLAY_MERGE_SIZE:
+            checker.merge_overlay()
+        return checker
+
+    def overlay_distance(self) -> Optional[Callable[[str, str], float]]:
+        """The distance measuring overlay words the way the engine measures indexed ones."""
+        if self.vowel_cost != 1:
+            return partial(fidel_edit_distance, vowel_cost=self.vowel_cost)
+        return self.index_distance()
+
+    def merge_overlay(self) -> None:
+        """Rebuild the word set, index and completion trie of an extended() copy with its overlay words."""
+        base, overlay = self.word_dict.base, self.word_dict.added
+        if isinstance(base, BinaryDictionary):
+            # Shares the memory map; the compiled file cannot take new words
+            words = copy.copy(base)
+            words.added = base.added | overlay
+        else:
+            words = set(base)
+            words.update(overlay)
+        self.word_dict = words
+        if self.morphology is not None:
+            self.morphology = copy.copy(self.morphology)
+            self.morphology.set_stems(dict(self.morphology.stems))
+            for word in overlay:
+                self.morphology.add_stem(word)
+        self.cached_index = None
+        self.build_index()
+        if self.completions is not None:
+            # Rebuilt now rather than on the next complete(), so the copy is warm
+            self.completions = CompletionTrie({word: self.word_frequency(word) for word in self.word_dict})
+        self.ranker = None
+
+    def add_to_dictionary(self, word: str, persist: bool = True) -> None:
         """
         Add a new word to the dictionary.
         
         Args:
             word: The word to add to the dictionary
+            persist: Whether to write the word to the append log; False for
+                words another process has already logged
         """
         word = word.strip()
-        if word:
+        if word and word not in self.word_dict:
             self.word_dict.add(word)
-            # Optionally save to file
-            try:
-                with open(self.dictionary_path, 'a', encoding='utf-8') as f:
-                    f.write(f"\n{word}")
-            except Exception as e:
-                print(f"Could not save word to dictionary file: {str(e)}")
+            if self.morphology is not None:
+                self.morphology.add_stem(word)
+            # An index that is not built yet will include the word when it is
+            if self.index_built and self._index is not None and self._index is not self.word_dict:
+                self._index.add(word)
+            if self.completions is not None:
+                self.completions.add(word, self.word_frequency(word))
+            self.dictionary_version += 1
+            if persist:
+                self.word_log.add(word)
+
+    def word_frequency(self, word: str) -> int:
+        """
+        Get the corpus frequency of a word.
+        
+        Args:
+            word: The word to look up
+            
+        Returns:
+            The frequency from the dictionary file, 0 if it has none
+        """
+        compiled = self.compiled
+        if compiled is not None:
+            return compiled.frequency(word)
+        return self.frequencies.get(word, 0)
+
+    def complete(self, prefix: str, k: int = 10) -> List[str]:
+        """
+        Get autocomplete suggestions for a prefix, most frequent first.
+        
+        The completion trie is built on the first call after each dictionary
+        load and caches the best completions at every node.
+        
+        Args:
+            prefix: The beginning of a word
+            k: Maximum number of completions
+            
+        Returns:
+            Words starting with the prefix, ranked by corpus frequency,
+            then by length and alphabetically
+        """
+        if not prefix:
+            return []
+        if self.completions is None:
+            self.completions = CompletionTrie({word: self.word_frequency(word) for word in self.word_dict})
+        return self.completions.complete(prefix, k)
 
     def tokenize_text(self, text: str) -> List[str]:
         """
@@ -67,11 +623,7 @@ class TigrignaSpellChecker:
         Returns:
             List of individual words
         """
-        # This is a simple tokenizer that splits on whitespace and punctuation
-        # For a more sophisticated approach, a Tigrigna-specific tokenizer could be developed
-        cleaned_text = re.sub(r'[፡።፣፤፥፧፦፨፠፟]', ' ', text)  # Replace Ethiopic punctuation with space
-        words = re.split(r'\s+', cleaned_text)
-        return [word for word in words if word]  # Remove empty strings
+        return tokenize(text)
 
     def check_word(self, word: str) -> bool:
         """
@@ -81,21 +633,29 @@ class TigrignaSpellChecker:
             word: Word to check
             
         Returns:
-            True if the word is in the dictionary, False otherwise
+            True if the word is in the dictionary or, with an affix file, is an
+            inflected form of a stem in it; False otherwise
         """
-        return word in self.word_dict
+        if word in self.word_dict:
+            return True
+        return self.morphology is not None and word in self.morphology
 
-    def edit_distance(self, s1: str, s2: str) -> int:
+    def edit_distance(self, s1: str, s2: str, max_distance: Optional[int] = None) -> int:
         """
         Calculate the Levenshtein edit distance between two words.
         
         Args:
             s1: First word
             s2: Second word
+            max_distance: If given, stop early once the distance is known to
+                exceed it and return max_distance + 1
             
         Returns:
             The edit distance as an integer
         """
+        if max_distance is not None:
+            return bounded_edit_distance(s1, s2, max_distance)
+
         if len(s1) < len(s2):
             return self.edit_distance(s2, s1)
             
@@ -114,6 +674,109 @@ class TigrignaSpellChecker:
             
         return previous_row[-1]
 
+    def find_candidates(self, word: str, max_distance: float,
+                        deadline: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        Find dictionary words within an edit distance of a word.
+        
+        Uses the suggestion index when it can answer the requested distance
+        and falls back to a linear scan of the dictionary otherwise.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum edit distance
+            deadline: time.perf_counter() value at which a linear scan stops
+                and returns the candidates found so far; None scans it all
+            
+        Returns:
+            Unordered list of (word, distance) pairs
+        """
+        if self.index is not None and max_distance <= self.index.max_distance:
+            return self.index.lookup(word, max_distance)
+
+        candidates = []
+        words = self.word_dict if deadline is None else _until(self.word_dict, deadline)
+        if self.distance == self.edit_distance:
+            # Integer distances allow the banded computation with early exit
+            bound = int(max_distance)
+            for dict_word in words:
+                distance = bounded_edit_distance(word, dict_word, bound)
+                if distance <= bound:
+                    candidates.append((dict_word, distance))
+            return candidates
+
+        for dict_word in words:
+            distance = self.distance(word, dict_word)
+            if distance <= max_distance:
+                candidates.append((dict_word, distance))
+        return candidates
+
+    def find_affixed_candidates(self, word: str, max_distance: float,
+                                deadline: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        Find dictionary words and inflected forms within an edit distance of a word.
+        
+        The word is split into affixes within the distance of its edges and a
+        remaining stem; stems near that remainder, within the budget the
+        affixes leave, are inflected with the same affixes and measured
+        against the whole word, so typos in the stem and in the affix are
+        both corrected.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum edit distance
+            deadline: time.perf_counter() value after which no further stems
+                are looked up; None looks them all up
+            
+        Returns:
+            Unordered list of (word, distance) pairs
+        """
+        bounded = self.distance == self.edit_distance and self.vowel_cost == 1
+        distances: Dict[str, float] = {}
+        for variant, splits in self.morphology.splits(word, int(max_distance)).items():
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            budget = max(split[2] for split in splits)
+            if budget == 0:
+                # Only the stem itself fits; skip the index
+                stems = [(variant, 0)] if variant in self.morphology.stems else []
+            elif not variant:
+                # The affixes cover the whole word, leaving room for a short stem
+                stems = [(stem, len(stem)) for stem in self.morphology.short_stems(budget)]
+            else:
+                stems = self.find_candidates(variant, budget, deadline)
+            for stem, stem_distance in stems:
+                for prefix, suffix, remaining in splits:
+                    if stem_distance > remaining:
+                        continue
+                    form = self.morphology.inflect(stem, prefix, suffix)
+                    if form is not None and form not in distances:
+                        if bounded:
+                            distances[form] = bounded_edit_distance(word, form, int(max_distance))
+                        elif self.vowel_cost != 1:
+                            distances[form] = fidel_edit_distance(word, form, self.vowel_cost)
+                        else:
+                            distances[form] = self.distance(word, form)
+        return [(form, distance) for form, distance in distances.items() if distance <= max_distance]
+
+    def retrieve_candidates(self, word: str, max_distance: float,
+                            deadline: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        Find candidates with the configured engine, through the affix model if there is one.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum edit distance
+            deadline: time.perf_counter() value by which a linear scan stops,
+                None for no limit
+            
+        Returns:
+            Unordered list of (word, distance) pairs
+        """
+        if self.morphology is not None:
+            return self.find_affixed_candidates(word, max_distance, deadline)
+        return self.find_candidates(word, max_distance, deadline)
+
     def generate_suggestions(self, word: str, max_distance: int = 2, max_suggestions: int = 5) -> List[str]:
         """
         Generate spelling correction suggestions for a word.
@@ -128,16 +791,126 @@ class TigrignaSpellChecker:
         """
         if not word or self.check_word(word):
             return []
+
+        if self.cache is not None:
+            key = (word, max_distance, max_suggestions)
+            version = self.dictionary_version
+            cached = self.cache.get(key, version)
+            if cached is not None:
+                return cached
             
-        candidates = []
-        for dict_word in self.word_dict:
-            distance = self.edit_distance(word, dict_word)
-            if distance <= max_distance:
-                candidates.append((dict_word, distance))
-                
-        # Sort by edit distance (closest matches first)
-        candidates.sort(key=lambda x: x[1])
-        return [candidate[0] for candidate in candidates[:max_suggestions]]
+        candidates = self.retrieve_candidates(word, max_distance)
+        suggestions = self.rank_candidates(word, candidates, max_suggestions)
+        if self.cache is not None:
+            self.cache.put(key, suggestions, version)
+        return suggestions
+
+    def rank_candidates(self, word: str, candidates: List[Tuple[str, float]], limit: int) -> List[str]:
+        """
+        Order retrieved candidates by the checker's ranking.
+        
+        Args:
+            word: The misspelled word
+            candidates: (word, distance) pairs from any retrieval engine
+            limit: Maximum number of candidates to return
+            
+        Returns:
+            The best candidates, best first
+        """
+        if self.ranking == 'noisy_channel':
+            if self.ranker is None:
+                channel = ChannelModel.load(self.channel_path) if self.channel_path else None
+                compiled = self.compiled
+                if compiled is not None:
+                    # Priors come straight from the mapped frequency table, by word id
+                    counts = np.frombuffer(compiled.frequencies, dtype='<u4')
+                    self.ranker = NoisyChannelRanker.from_counts(counts, compiled.find, channel,
+                                                                 vocabulary=len(self.word_dict))
+                else:
+                    self.ranker = NoisyChannelRanker(self.frequencies, channel, vocabulary=len(self.word_dict))
+            return self.ranker.rank(word, [candidate for candidate, _ in candidates], limit)
+        # Sort by edit distance (closest matches first), ties alphabetically
+        candidates.sort(key=lambda x: (x[1], x[0]))
+        return [candidate[0] for candidate in candidates[:limit]]
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Get the suggestion cache counters.
+        
+        Returns:
+            Dictionary with hits, misses, evictions, invalidations, size and
+            maxsize; empty if the cache is disabled
+        """
+        return self.cache.stats() if self.cache is not None else {}
+
+    def analyze_text(self, text: str, suggest: bool = True) -> TextAnalysis:
+        """
+        Tokenize a text once and check each distinct word only once.
+        
+        Args:
+            text: The Tigrigna text to analyse
+            suggest: Whether to generate suggestions for misspelled words
+            
+        Returns:
+            TextAnalysis with token counts and misspellings in order of first occurrence
+        """
+        # Counter keeps first-occurrence order, so misspellings do too
+        analysis = TextAnalysis(Counter(self.tokenize_text(text)))
+        for word in analysis.token_counts:
+            if not self.check_word(word):
+                analysis.misspellings[word] = self.generate_suggestions(word) if suggest else []
+        if self.language_model is not None and suggest:
+            self.check_context(text, analysis)
+        return analysis
+
+    def check_context(self, text: str, analysis: TextAnalysis) -> None:
+        """
+        Use the language model to re-rank suggestions and flag real-word errors.
+        
+        In each sentence the suggestions for a misspelling are re-ranked by
+        how well they fit the surrounding words. Then correctly spelled
+        words, least likely first, are compared with their close
+        alternatives; a word is flagged when an alternative is likelier by
+        REAL_WORD_MARGIN both overall and in what the context adds to it.
+        Each sentence stops once context_budget seconds are spent; the
+        deadline is passed on to candidate retrieval, so a linear scan for
+        one word cannot overrun it either.
+        
+        Args:
+            text: The analysed text
+            analysis: Result of the isolated checks, updated in place
+        """
+        model = self.language_model
+        reranked: Set[str] = set()
+        for words in sentences(text):
+            deadline = time.perf_counter() + self.context_budget
+            for position, word in enumerate(words):
+                if time.perf_counter() >= deadline:
+                    break
+                suggestions = analysis.misspellings.get(word)
+                if suggestions and len(suggestions) > 1 and word not in reranked:
+                    reranked.add(word)
+                    order = np.argsort(-model.window_scores(words, position, suggestions), kind='stable')
+                    analysis.misspellings[word] = [suggestions[i] for i in order.tolist()]
+            for position in np.argsort(model.score(words), kind='stable').tolist():
+                if time.perf_counter() >= deadline:
+                    break
+                word = words[position]
+                if word in analysis.misspellings:
+                    continue
+                found = self.retrieve_candidates(word, 1, deadline)
+                alternatives = sorted(candidate for candidate, _ in found if candidate != word)
+                if not alternatives:
+                    continue
+                scores = model.window_scores(words, position, [word] + alternatives)
+                # What the context adds beyond each word's own frequency
+                gains = scores - model.unigram_scores([word] + alternatives)
+                better = [(score, alternative) for alternative, score, gain
+                          in zip(alternatives, scores[1:].tolist(), gains[1:].tolist())
+                          if score >= scores[0] + REAL_WORD_MARGIN and gain >= gains[0] + REAL_WORD_MARGIN]
+                if better:
+                    better.sort(key=lambda x: -x[0])
+                    analysis.misspellings[word] = [alternative for _, alternative in better[:5]]
 
     def check_text(self, text: str) -> Dict[str, List[str]]:
         """
@@ -149,15 +922,83 @@ class TigrignaSpellChecker:
         Returns:
             Dictionary mapping misspelled words to suggestion lists
         """
-        words = self.tokenize_text(text)
-        result = {}
+        return self.analyze_text(text).misspellings
+
+    def check_many(self, documents: Iterable[str], workers: int = 1, chunk_size: int = 1000,
+                   max_distance: int = 2, max_suggestions: int = 5) -> Iterator[Dict[str, List[str]]]:
+        """
+        Check a stream of documents, yielding check_text results in input order.
         
-        for word in words:
-            if word and not self.check_word(word):
-                suggestions = self.generate_suggestions(word)
-                result[word] = suggestions
-                
-        return result
+        Each distinct misspelling gets one suggestion search for the whole
+        stream; with a language model, each document then gets its own
+        context pass as in check_text. With several workers the searches run in forked processes
+        that share this checker's dictionary and index; tokenizing the next
+        chunk overlaps with the searches for the current one. Platforms
+        without fork fall back to a single process.
+        
+        Args:
+            documents: Iterable of Tigrigna texts
+            workers: Number of worker processes for suggestion search
+            chunk_size: Number of documents read ahead per batch
+            max_distance: Maximum edit distance for suggestions
+            max_suggestions: Maximum number of suggestions per word
+            
+        Returns:
+            Iterator of dictionaries mapping misspelled words to suggestion lists
+        """
+        global _shared_checker
+        pool = None
+        if workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            # Build a lazy index once here rather than in every worker
+            self.index
+            _shared_checker = self
+            pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork'))
+
+        suggestions: Dict[str, List[str]] = {}
+        queued: Set[str] = set()
+        pending = deque()
+        documents = iter(documents)
+        try:
+            while True:
+                chunk = list(islice(documents, chunk_size))
+                if not chunk:
+                    break
+                found = [[word for word in dict.fromkeys(self.tokenize_text(text)) if not self.check_word(word)]
+                         for text in chunk]
+                new = [word for word in dict.fromkeys(word for words in found for word in words)
+                       if word not in queued]
+                queued.update(new)
+                futures = []
+                if pool is not None:
+                    step = max(1, -(-len(new) // (4 * workers)))
+                    futures = [(new[i:i + step], pool.submit(_suggest_words, new[i:i + step],
+                                                             max_distance, max_suggestions))
+                               for i in range(0, len(new), step)]
+                else:
+                    for word in new:
+                        suggestions[word] = self.generate_suggestions(word, max_distance, max_suggestions)
+                pending.append((chunk, found, futures))
+                # Keep one chunk in flight while the next is tokenized
+                if len(pending) > 1:
+                    yield from self._resolve_chunk(pending.popleft(), suggestions)
+            while pending:
+                yield from self._resolve_chunk(pending.popleft(), suggestions)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+                _shared_checker = None
+
+    def _resolve_chunk(self, chunk, suggestions: Dict[str, List[str]]) -> Iterator[Dict[str, List[str]]]:
+        texts, found, futures = chunk
+        for words, future in futures:
+            suggestions.update(zip(words, future.result()))
+        for text, words in zip(texts, found):
+            misspellings = {word: suggestions[word] for word in words}
+            if self.language_model is not None:
+                # Context differs per document, so this pass is not shared
+                analysis = TextAnalysis(misspellings=misspellings)
+                self.check_context(text, analysis)
+            yield misspellings
 
     def get_statistics(self, text: str) -> Dict[str, int]:
         """
@@ -169,12 +1010,4 @@ class TigrignaSpellChecker:
         Returns:
             Dictionary with statistics
         """
-        words = self.tokenize_text(text)
-        misspelled = [word for word in words if word and not self.check_word(word)]
-        
-        return {
-            'total_words': len(words),
-            'unique_words': len(set(words)),
-            'misspelled_words': len(misspelled),
-            'unique_misspelled': len(set(misspelled))
-        }
+        return self.analyze_text(text, suggest=False).statistics()
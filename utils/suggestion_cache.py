@@ -0,0 +1,108 @@
+"""
+Bounded LRU cache for spelling suggestions.
+Entries are tagged with the dictionary version they were computed against,
+so bumping the version invalidates the whole cache at once.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional
+
+
+class SuggestionCache:
+    """
+    A thread-safe least-recently-used cache with hit, miss and eviction counters.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Create an empty cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self.version = 0
+        self.entries: "OrderedDict[Hashable, List[str]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable, version: int) -> Optional[List[str]]:
+        """
+        Look up an entry computed against a dictionary version.
+        
+        Args:
+            key: Cache key
+            version: Current dictionary version; a newer version clears the cache
+            
+        Returns:
+            A copy of the cached suggestions, or None on a miss
+        """
+        with self.lock:
+            if version != self.version:
+                self.invalidate(version)
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return list(value)
+
+    def put(self, key: Hashable, value: List[str], version: int) -> None:
+        """
+        Store an entry, evicting the least recently used one when full.
+        
+        Args:
+            key: Cache key
+            value: Suggestions to cache
+            version: Dictionary version the suggestions were computed against
+        """
+        with self.lock:
+            if version != self.version:
+                # Computed against an older dictionary; drop it
+                if version < self.version:
+                    return
+                self.invalidate(version)
+            self.entries[key] = list(value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, version: int) -> None:
+        """
+        Drop every entry and move to a new dictionary version.
+        
+        Callers must hold the lock.
+        
+        Args:
+            version: The new dictionary version
+        """
+        if self.entries:
+            self.entries.clear()
+            self.invalidations += 1
+        self.version = version
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache counters.
+        
+        Returns:
+            Dictionary with hits, misses, evictions, invalidations, size and maxsize
+        """
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self.entries),
+                'maxsize': self.maxsize,
+            }
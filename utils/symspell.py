@@ -0,0 +1,120 @@
+"""
+Symmetric-deletion (SymSpell-style) candidate index for Tigrigna words.
+Every dictionary word is stored under each string obtainable by deleting up to
+``max_distance`` characters from it, so a lookup only has to generate the
+deletions of the query instead of scanning the whole dictionary.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from .distances import bounded_edit_distance
+except ImportError:
+    # Imported from a module run directly as a script
+    from distances import bounded_edit_distance
+
+
+class SymSpellIndex:
+    """
+    A precomputed deletion index that finds all dictionary words within a
+    given Levenshtein distance of a query word.
+    """
+
+    def __init__(self, words: Iterable[str], distance: Optional[Callable[[str, str], float]] = None,
+                 max_distance: int = 2):
+        """
+        Build the index for a collection of words.
+        
+        Args:
+            words: Dictionary words to index
+            distance: Function used to verify the distance of each candidate;
+                None uses the banded Levenshtein distance, which stops as
+                soon as the lookup's max_distance is exceeded
+            max_distance: Largest edit distance the index can answer
+        """
+        self.max_distance = max_distance
+        self.distance = distance
+        self.words: Set[str] = set()
+        self.deletes: Dict[str, List[str]] = {}
+        # Distance evaluations made by lookups, for measuring pruning
+        self.comparisons = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words
+
+    @staticmethod
+    def generate_deletes(word: str, depth: int) -> Set[str]:
+        """
+        Generate every string obtainable by deleting up to ``depth`` characters.
+        
+        Args:
+            word: The word to delete characters from
+            depth: Maximum number of deletions
+            
+        Returns:
+            Set of deletion variants, including the word itself
+        """
+        result = {word}
+        frontier = {word}
+        for _ in range(depth):
+            next_frontier = set()
+            for variant in frontier:
+                for i in range(len(variant)):
+                    next_frontier.add(variant[:i] + variant[i + 1:])
+            next_frontier -= result
+            if not next_frontier:
+                break
+            result |= next_frontier
+            frontier = next_frontier
+        return result
+
+    def add(self, word: str) -> None:
+        """
+        Add a word and its deletion variants to the index.
+        
+        Args:
+            word: The word to add
+        """
+        if word in self.words:
+            return
+        self.words.add(word)
+        for variant in self.generate_deletes(word, self.max_distance):
+            self.deletes.setdefault(variant, []).append(word)
+
+    def lookup(self, word: str, max_distance: int) -> List[Tuple[str, int]]:
+        """
+        Find all indexed words within ``max_distance`` of a word.
+        
+        Args:
+            word: The query word
+            max_distance: Maximum edit distance, at most the index's max_distance
+            
+        Returns:
+            Unordered list of (word, distance) pairs
+        """
+        if max_distance > self.max_distance:
+            raise ValueError(f"Index was built for max_distance={self.max_distance}, got {max_distance}")
+
+        candidates = set()
+        for variant in self.generate_deletes(word, max_distance):
+            bucket = self.deletes.get(variant)
+            if bucket:
+                candidates.update(bucket)
+
+        results = []
+        for candidate in candidates:
+            if abs(len(candidate) - len(word)) > max_distance:
+                continue
+            if self.distance is None:
+                distance = bounded_edit_distance(word, candidate, max_distance)
+            else:
+                distance = self.distance(word, candidate)
+            self.comparisons += 1
+            if distance <= max_distance:
+                results.append((candidate, distance))
+        return results
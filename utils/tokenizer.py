@@ -0,0 +1,67 @@
+"""
+Tigrigna tokenizer shared by the spell checker, the dictionary updater, the
+incremental checker and the keyboard.
+A token is a maximal run of Ethiopic letters (including the combining marks
+U+135D-U+135F). Whitespace, Ethiopic punctuation (U+1360-U+1368), Ethiopic
+numerals and any non-Ethiopic character separate tokens, so punctuation
+never sticks to a word and Latin text or digits are not treated as
+Tigrigna words. sentences() also splits on sentence punctuation, for the
+word language model.
+"""
+
+import re
+from typing import Iterator, List, Tuple
+
+# Ethiopic, Ethiopic Supplement and Ethiopic Extended letters
+TOKEN_PATTERN = re.compile(r'[\u1200-\u135F\u1380-\u139F\u2D80-\u2DDF]+')
+
+
+def iter_tokens(text: str) -> Iterator[Tuple[str, int, int]]:
+    """
+    Lazily tokenize a text in a single pass.
+    
+    Args:
+        text: The Tigrigna text to tokenize
+        
+    Returns:
+        Iterator of (token, start, end) with end exclusive
+    """
+    for match in TOKEN_PATTERN.finditer(text):
+        start, end = match.span()
+        yield match.group(), start, end
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Tokenize a text into a list of words when spans are not needed.
+    
+    Args:
+        text: The Tigrigna text to tokenize
+        
+    Returns:
+        List of words in order
+    """
+    return TOKEN_PATTERN.findall(text)
+
+
+# Ethiopic full stop, question mark and paragraph separator, Latin sentence
+# punctuation and line breaks end a sentence
+SENTENCE_PATTERN = re.compile(r'[።፧፨.!?\n]+')
+
+
+def sentences(text: str) -> List[List[str]]:
+    """
+    Split a text into sentences of words, for models that use word context.
+    
+    Args:
+        text: The Tigrigna text to split
+        
+    Returns:
+        List of non-empty sentences, each a list of words in order
+    """
+    result = []
+    for sentence in SENTENCE_PATTERN.split(text):
+        words = TOKEN_PATTERN.findall(sentence)
+        if words:
+            result.append(words)
+    return result
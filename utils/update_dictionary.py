@@ -1,4 +1,27 @@
-import re
+import argparse
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+try:
+    from .append_log import WordLog, read_log
+    from .binary_dictionary import BinaryDictionary, is_binary_dictionary
+    from .language_model import compile_language_model, count_ngrams
+    from .tokenizer import TOKEN_PATTERN, sentences, tokenize
+except ImportError:
+    # Running this file directly as a script
+    from append_log import WordLog, read_log
+    from binary_dictionary import BinaryDictionary, is_binary_dictionary
+    from language_model import compile_language_model, count_ngrams
+    from tokenizer import TOKEN_PATTERN, sentences, tokenize
+
+# Characters read per chunk when streaming a corpus
+CHUNK_SIZE = 1 << 20
+
+# Bytes of corpus handed to each parallel worker task
+RANGE_SIZE = 64 << 20
 
 def load_dictionary(file_path='tigrigna_dictionary.txt'):
     """
@@ -8,11 +31,17 @@ def load_dictionary(file_path='tigrigna_dictionary.txt'):
         file_path (str): Path to the dictionary file
         
     Returns:
-        set: A set containing Tigrigna words
+        set: A set containing Tigrigna words; compiled dictionaries are
+        memory-mapped and returned as a set-like BinaryDictionary
     """
     try:
+        if is_binary_dictionary(file_path):
+            return BinaryDictionary(file_path)
         with open(file_path, 'r', encoding='utf-8') as file:
-            dictionary = {line.strip() for line in file if line.strip()}
+            # Frequency dictionaries carry a tab-separated count after the word
+            dictionary = {line.split('\t', 1)[0].strip() for line in file if line.strip()}
+        # Words added since the last compaction
+        dictionary.update(read_log(file_path))
         return dictionary
     except FileNotFoundError:
         print(f"Error: Dictionary file '{file_path}' not found.")
@@ -21,6 +50,25 @@ def load_dictionary(file_path='tigrigna_dictionary.txt'):
         print(f"Error loading dictionary: {e}")
         return set()
 
+def write_frequency_dictionary(frequencies, file_path, min_count=1):
+    """
+    Writes words with their counts, most frequent first.
+    
+    Args:
+        frequencies (Counter): Word frequencies
+        file_path (str): Path of the output file
+        min_count (int): Words seen fewer times are left out
+        
+    Returns:
+        int: Number of words written
+    """
+    entries = sorted(((word, count) for word, count in frequencies.items() if count >= min_count),
+                     key=lambda entry: (-entry[1], entry[0]))
+    with open(file_path, 'w', encoding='utf-8') as file:
+        for word, count in entries:
+            file.write(f"{word}\t{count}\n")
+    return len(entries)
+
 def tokenize_text(text):
     """
     Tokenizes Tigrigna text into words.
@@ -31,22 +79,62 @@ def tokenize_text(text):
     Returns:
         list: A list of words
     """
-    # Split text by non-Tigrigna characters and spaces
-    # This regex pattern handles Tigrigna characters
-    words = re.findall(r'[\u1200-\u137F\u1380-\u139F\u2D80-\u2DDF]+', text)
+    return tokenize(text)
+
+def stream_token_chunks(file, chunk_size=CHUNK_SIZE):
+    """
+    Tokenize an open text file in fixed-size chunks.
     
-    # Remove empty strings
-    words = [word.strip() for word in words if word.strip()]
+    A word that runs up to the end of a chunk is held back and joined with
+    the start of the next chunk, so words crossing chunk boundaries are
+    never split.
     
-    return words
+    Args:
+        file: A file opened in text mode
+        chunk_size (int): Number of characters read at a time
+        
+    Yields:
+        list: The Tigrigna words completed in each chunk, in order
+    """
+    carry = ''
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        buffer = carry + chunk
+        tokens = TOKEN_PATTERN.findall(buffer)
+        carry = ''
+        if tokens and TOKEN_PATTERN.fullmatch(buffer[-1]):
+            carry = tokens.pop()
+        yield tokens
+    if carry:
+        yield [carry]
+
+def stream_tokens(file, chunk_size=CHUNK_SIZE):
+    """
+    Lazily tokenize an open text file in fixed-size chunks.
+    
+    Args:
+        file: A file opened in text mode
+        chunk_size (int): Number of characters read at a time
+        
+    Yields:
+        str: Each Tigrigna word in order
+    """
+    for tokens in stream_token_chunks(file, chunk_size):
+        yield from tokens
 
-def process_corpus(corpus_file, dictionary_file):
+def process_corpus(corpus_file, dictionary_file, chunk_size=CHUNK_SIZE):
     """
     Process a corpus file and add new words to the dictionary
     
+    The corpus is streamed in chunks, so memory use depends on the number
+    of new words rather than on the size of the corpus.
+    
     Args:
         corpus_file (str): Path to the corpus file
         dictionary_file (str): Path to the dictionary file
+        chunk_size (int): Number of characters read at a time
         
     Returns:
         tuple: (total_words, new_words_added)
@@ -61,23 +149,24 @@ def process_corpus(corpus_file, dictionary_file):
     
     # Process corpus file
     try:
+        start = time.perf_counter()
         with open(corpus_file, 'r', encoding='utf-8') as file:
-            content = file.read()
-            
-            # Tokenize the content
-            tokens = tokenize_text(content)
-            total_words = len(tokens)
-            
-            # Find new words
-            for word in tokens:
-                if word not in existing_dictionary and len(word) > 1:  # Ignore single characters
-                    new_words.add(word)
+            for tokens in stream_token_chunks(file, chunk_size):
+                total_words += len(tokens)
+                # Find new words, ignoring single characters
+                new_words.update(word for word in set(tokens)
+                                 if len(word) > 1 and word not in existing_dictionary)
+        size_mb = os.path.getsize(corpus_file) / 1e6
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        print(f"Read {size_mb:.1f} MB in {elapsed:.2f} s "
+              f"({size_mb / elapsed:.1f} MB/s, {total_words / elapsed:,.0f} tokens/s)")
     
-        # Add new words to dictionary file
+        # Add new words through the dictionary's append log, shared with running checkers
         if new_words:
-            with open(dictionary_file, 'a', encoding='utf-8') as file:
-                for word in sorted(new_words):
-                    file.write(f"{word}\n")
+            log = WordLog(dictionary_file, group_size=len(new_words))
+            for word in sorted(new_words):
+                log.add(word)
+            log.close()
             
             print(f"Added {len(new_words)} new words to the dictionary")
         else:
@@ -92,12 +181,204 @@ def process_corpus(corpus_file, dictionary_file):
         print(f"Error processing corpus: {e}")
         return 0, 0
 
+def split_byte_ranges(corpus_files, range_size=RANGE_SIZE):
+    """
+    Splits corpus files into byte ranges that start and end on line boundaries.
+    
+    Args:
+        corpus_files (list): Paths to the corpus files
+        range_size (int): Approximate number of bytes per range
+        
+    Returns:
+        list: (path, start, end) tuples covering every file
+    """
+    ranges = []
+    for path in corpus_files:
+        size = os.path.getsize(path)
+        with open(path, 'rb') as file:
+            start = 0
+            while start < size:
+                end = start + range_size
+                if end < size:
+                    # Move the end past the next newline
+                    file.seek(end)
+                    file.readline()
+                    end = file.tell()
+                end = min(end, size)
+                ranges.append((path, start, end))
+                start = end
+    return ranges
+
+def read_byte_range(byte_range):
+    """
+    Reads one line-aligned byte range of a corpus in blocks of whole lines.
+    
+    Args:
+        byte_range (tuple): (path, start, end) from split_byte_ranges
+        
+    Yields:
+        str: Decoded blocks of the range, in order
+    """
+    path, start, end = byte_range
+    with open(path, 'rb') as file:
+        file.seek(start)
+        position = start
+        while position < end:
+            block = file.read(min(CHUNK_SIZE, end - position))
+            if not block:
+                break
+            position += len(block)
+            if position < end and not block.endswith(b'\n'):
+                # Finish the line so no word or character is split
+                rest = file.readline()
+                block += rest
+                position += len(rest)
+            yield block.decode('utf-8', errors='replace')
+
+def count_byte_range(byte_range):
+    """
+    Counts the Tigrigna words in one line-aligned byte range of a corpus.
+    
+    Args:
+        byte_range (tuple): (path, start, end) from split_byte_ranges
+        
+    Returns:
+        Counter: Word frequencies in the range
+    """
+    counts = Counter()
+    for block in read_byte_range(byte_range):
+        counts.update(TOKEN_PATTERN.findall(block))
+    return counts
+
+def count_ngram_range(byte_range, order=3):
+    """
+    Counts the word n-grams of the sentences in one byte range of a corpus.
+    
+    Args:
+        byte_range (tuple): (path, start, end) from split_byte_ranges
+        order (int): Highest n-gram order to count
+        
+    Returns:
+        Counter: N-gram tuples and their counts
+    """
+    counts = Counter()
+    for block in read_byte_range(byte_range):
+        counts.update(count_ngrams(sentences(block), order))
+    return counts
+
+def count_corpus(corpus_files, workers=None, range_size=RANGE_SIZE, counter=count_byte_range):
+    """
+    Counts word frequencies across corpus files with a process pool.
+    
+    Args:
+        corpus_files (list): Paths to the corpus files
+        workers (int): Number of worker processes, defaults to the CPU count
+        range_size (int): Approximate number of bytes per task
+        counter (callable): Function counting one byte range, count_byte_range
+            for words or count_ngram_range for n-grams
+        
+    Returns:
+        Counter: Merged word frequencies
+    """
+    ranges = split_byte_ranges(corpus_files, range_size)
+    total = Counter()
+    if workers == 1:
+        for byte_range in ranges:
+            total.update(counter(byte_range))
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for counts in executor.map(counter, ranges):
+            total.update(counts)
+    return total
+
+def build_frequency_dictionary(corpus_files, output_file, dictionary_file=None, workers=None, min_count=1):
+    """
+    Rebuilds a frequency-annotated dictionary from corpus files in parallel.
+    
+    Args:
+        corpus_files (list): Paths to the corpus files
+        output_file (str): Path of the frequency dictionary to write
+        dictionary_file (str): Existing dictionary whose words are always kept
+        workers (int): Number of worker processes, defaults to the CPU count
+        min_count (int): Corpus words seen fewer times are left out
+        
+    Returns:
+        tuple: (total_words, unique_words_written)
+    """
+    start = time.perf_counter()
+    frequencies = count_corpus(corpus_files, workers)
+    total_words = sum(frequencies.values())
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    size_mb = sum(os.path.getsize(path) for path in corpus_files) / 1e6
+    print(f"Counted {size_mb:.1f} MB in {elapsed:.2f} s "
+          f"({size_mb / elapsed:.1f} MB/s, {total_words / elapsed:,.0f} tokens/s)")
+
+    # Ignore single characters, as process_corpus does
+    for word in [word for word in frequencies if len(word) < 2]:
+        del frequencies[word]
+    if dictionary_file:
+        for word in load_dictionary(dictionary_file):
+            # Keep known words even if the corpus never used them
+            frequencies[word] = max(frequencies[word], min_count)
+    written = write_frequency_dictionary(frequencies, output_file, min_count)
+    print(f"Wrote {written} words with frequencies to {output_file}")
+    return total_words, written
+
+def build_language_model(corpus_files, output_file, order=3, workers=None, min_count=2):
+    """
+    Builds a compiled word n-gram language model from corpus files in parallel.
+    
+    Args:
+        corpus_files (list): Paths to the corpus files
+        output_file (str): Path of the compiled model to write
+        order (int): Highest n-gram order
+        workers (int): Number of worker processes, defaults to the CPU count
+        min_count (int): N-grams of two or more words seen fewer times are pruned
+        
+    Returns:
+        int: Number of n-grams written
+    """
+    start = time.perf_counter()
+    counts = count_corpus(corpus_files, workers, counter=partial(count_ngram_range, order=order))
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(f"Counted {len(counts)} distinct n-grams in {elapsed:.2f} s")
+    written = compile_language_model(counts, output_file, order, min_count)
+    print(f"Wrote {written} n-grams to {output_file} ({os.path.getsize(output_file) / 1024:.1f} KB)")
+    return written
+
 def main():
-    corpus_file = "tigrigna_corpus.txt"
-    dictionary_file = "tigrigna_dictionary.txt"
+    parser = argparse.ArgumentParser(description="Add words from Tigrigna corpora to the dictionary.")
+    parser.add_argument('corpus_files', nargs='*', default=["tigrigna_corpus.txt"])
+    parser.add_argument('--dictionary', default="tigrigna_dictionary.txt")
+    parser.add_argument('--frequencies', help="rebuild a frequency dictionary at this path in parallel")
+    parser.add_argument('--workers', type=int, help="worker processes for --frequencies")
+    parser.add_argument('--min-count', type=int, default=1)
+    parser.add_argument('--language-model', help="build a compiled word n-gram model at this path")
+    parser.add_argument('--order', type=int, default=3, help="n-gram order for --language-model")
+    parser.add_argument('--ngram-min-count', type=int, default=2, help="prune rarer n-grams from --language-model")
+    args = parser.parse_args()
+    dictionary_file = args.dictionary
+
+    if args.language_model:
+        build_language_model(args.corpus_files, args.language_model, args.order, args.workers,
+                             args.ngram_min_count)
+        if not args.frequencies:
+            return
+
+    if args.frequencies:
+        total_words, written = build_frequency_dictionary(args.corpus_files, args.frequencies, dictionary_file,
+                                                          args.workers, args.min_count)
+        print(f"\nSummary:")
+        print(f"Total words processed: {total_words}")
+        print(f"Frequency dictionary contains {written} words")
+        return
     
-    print(f"Processing corpus file: {corpus_file}")
-    total_words, new_words = process_corpus(corpus_file, dictionary_file)
+    total_words = new_words = 0
+    for corpus_file in args.corpus_files:
+        print(f"Processing corpus file: {corpus_file}")
+        file_words, file_new_words = process_corpus(corpus_file, dictionary_file)
+        total_words += file_words
+        new_words += file_new_words
     
     print(f"\nSummary:")
     print(f"Total words processed: {total_words}")